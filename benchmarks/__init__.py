@@ -0,0 +1,14 @@
+"""
+Benchmarks
+----------
+Timing suite for the hot paths of Word Search Generator (puzzle generation,
+masking, image processing, and exporting).
+
+Run the suite and save the results as JSON:
+
+    python -m benchmarks run -o results.json
+
+Compare two result files and report any regressions:
+
+    python -m benchmarks compare old.json new.json
+"""
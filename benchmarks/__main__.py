@@ -0,0 +1,111 @@
+import argparse
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from .cases import SUITES, collect
+from .harness import Timing, compare_results, load_results, run_benchmarks, save_results
+
+
+def run(args: argparse.Namespace) -> int:
+    benchmarks = collect(args.suite, quick=args.quick)
+    if args.filter:
+        benchmarks = [b for b in benchmarks if args.filter in b.name]
+
+    def report(name: str, timing: Timing) -> None:
+        print(f"{name:<50} {timing['median'] * 1000:>10.3f} ms", file=sys.stderr)
+
+    results = run_benchmarks(benchmarks, rounds=args.rounds, callback=report)
+    if args.output:
+        save_results(results, args.output)
+        print(f"Results saved to {args.output}", file=sys.stderr)
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    regressions = compare_results(
+        load_results(args.old),
+        load_results(args.new),
+        threshold=args.threshold,
+        stat=args.stat,
+    )
+    for r in regressions:
+        print(
+            f"{r.name:<50} {r.old * 1000:>10.3f} ms -> {r.new * 1000:>10.3f} ms"
+            + f" ({r.ratio:.2f}x)"
+        )
+    if regressions:
+        print(f"{len(regressions)} regression(s) found.", file=sys.stderr)
+        return 1
+    print("No regressions found.", file=sys.stderr)
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the Word Search Generator hot paths.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmark suites.")
+    run_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Save the results as JSON to this path.",
+    )
+    run_parser.add_argument(
+        "-s",
+        "--suite",
+        action="append",
+        choices=list(SUITES),
+        help="Suite to run (repeatable). Defaults to all suites.",
+    )
+    run_parser.add_argument(
+        "-k",
+        "--filter",
+        help="Only run benchmarks whose name contains this string.",
+    )
+    run_parser.add_argument(
+        "-r",
+        "--rounds",
+        type=int,
+        default=5,
+        help="Timed rounds per benchmark. Defaults to 5.",
+    )
+    run_parser.add_argument(
+        "-q",
+        "--quick",
+        action="store_true",
+        help="Run a reduced set of cases (useful for smoke testing).",
+    )
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare two result files and report any regressions."
+    )
+    compare_parser.add_argument("old", type=Path, help="Baseline results.")
+    compare_parser.add_argument("new", type=Path, help="Results to check.")
+    compare_parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Slowdown ratio considered a regression. Defaults to 1.25.",
+    )
+    compare_parser.add_argument(
+        "--stat",
+        choices=["min", "mean", "median"],
+        default="median",
+        help="Timing stat to compare. Defaults to median.",
+    )
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    status: int = args.func(args)
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
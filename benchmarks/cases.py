@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import atexit
+import random
+import shutil
+import tempfile
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from PIL import Image, ImageDraw
+
+from word_search_generator import WordSearch
+from word_search_generator.core.directions import LEVEL_DIRS
+from word_search_generator.mask import MASK_CACHE, shapes
+from word_search_generator.mask.bitmap import BitmapImage
+from word_search_generator.utils import WORD_LIST
+
+from .harness import Benchmark
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+SEED = 1234
+
+SIZES = [5, 10, 20, 30, 40, 50]
+WORD_COUNTS = [1, 10, 25, 50, 100]
+LEVELS = [level for level in LEVEL_DIRS if level > 0]
+MASK_SIZES = [21, 50]
+IMAGE_SIZES = [256, 1024]
+EXPORT_FORMATS = ["CSV", "JSON", "PDF"]
+
+QUICK_SIZES = [10, 25]
+QUICK_WORD_COUNTS = [5, 25]
+QUICK_LEVELS = [1, 3]
+QUICK_MASK_SIZES = [21]
+QUICK_IMAGE_SIZES = [256]
+
+
+def sample_words(count: int, max_length: int) -> str:
+    """Reproducible sample of dictionary words that fit in a puzzle."""
+    words = sorted(word for word in WORD_LIST if len(word) <= max_length)
+    return ",".join(random.Random(SEED).sample(words, count))
+
+
+def seeded_puzzle(size: int, count: int, level: int) -> WordSearch:
+    return WordSearch(sample_words(count, size), level=level, size=size, seed=SEED)
+
+
+def generate_benchmarks(quick: bool = False) -> Iterator[Benchmark]:
+    """Time `WordSearch.generate()` across puzzle sizes, word counts, and levels.
+    Every level is timed on a mid sized puzzle to keep the matrix manageable."""
+    sizes = QUICK_SIZES if quick else SIZES
+    counts = QUICK_WORD_COUNTS if quick else WORD_COUNTS
+    levels = QUICK_LEVELS if quick else LEVELS
+    cases = {(size, count, 2) for size in sizes for count in counts}
+    cases.update((sizes[len(sizes) // 2], counts[-1], level) for level in levels)
+    for size, count, level in sorted(cases):
+        ws = seeded_puzzle(size, count, level)
+
+        def setup(ws: WordSearch = ws) -> WordSearch:
+            return ws
+
+        yield Benchmark(
+            f"generate[size={size},words={count},level={level}]",
+            WordSearch.generate,
+            setup,
+        )
+
+
+def mask_benchmarks(quick: bool = False) -> Iterator[Benchmark]:
+    """Time `Game.apply_mask()` for every built-in mask shape, both generating
+    the mask from scratch and restoring it from the `MASK_CACHE`."""
+    for size in QUICK_MASK_SIZES if quick else MASK_SIZES:
+        ws = seeded_puzzle(size, 10, 2)
+        for name in shapes.BUILTIN_MASK_SHAPES:
+            shape = getattr(shapes, name)
+
+            def setup(ws=ws, shape=shape, cached=False):
+                ws.remove_masks()
+                MASK_CACHE.clear()
+                if cached:
+                    shape().generate(ws.size)
+                return ws, shape()
+
+            yield Benchmark(
+                f"apply_mask[shape={name},size={size}]",
+                lambda args: args[0].apply_mask(args[1]),
+                setup,
+            )
+            yield Benchmark(
+                f"apply_mask_cached[shape={name},size={size}]",
+                lambda args: args[0].apply_mask(args[1]),
+                partial(setup, cached=True),
+            )
+
+
+def sample_image(size: int) -> Image.Image:
+    """A dark heart-ish blob on a white background."""
+    image = Image.new("L", (size, size), 255)
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((size // 8, size // 8, size // 2, size // 2), fill=0)
+    draw.ellipse((size // 2, size // 8, size * 7 // 8, size // 2), fill=0)
+    draw.polygon(
+        [(size // 8, size * 3 // 8), (size * 7 // 8, size * 3 // 8), (size // 2, size)],
+        fill=0,
+    )
+    return image
+
+
+def image_benchmarks(quick: bool = False) -> Iterator[Benchmark]:
+    """Time `BitmapImage.process_image()` for a few image and puzzle sizes."""
+    for image_size in QUICK_IMAGE_SIZES if quick else IMAGE_SIZES:
+        image = sample_image(image_size)
+        for size in QUICK_MASK_SIZES if quick else MASK_SIZES:
+            yield Benchmark(
+                f"process_image[image={image_size},size={size}]",
+                partial(BitmapImage.process_image, size=size),
+                image.copy,
+            )
+
+
+def export_benchmarks(quick: bool = False) -> Iterator[Benchmark]:
+    """Time `WordSearchFormatter.save()` for each export format."""
+    directory = Path(tempfile.mkdtemp(prefix="wsg-bench-"))
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    for size in QUICK_SIZES if quick else [10, 50]:
+        ws = seeded_puzzle(size, 25, 2)
+        for fmt in EXPORT_FORMATS:
+            path = directory.joinpath(f"puzzle-{size}.{fmt.lower()}")
+
+            def setup(ws=ws, path=path, fmt=fmt):
+                path.unlink(missing_ok=True)  # saving never overwrites
+                return ws, path, fmt
+
+            yield Benchmark(
+                f"save[format={fmt},size={size}]",
+                lambda args: args[0].save(args[1], format=args[2]),
+                setup,
+            )
+
+
+SUITES = {
+    "generate": generate_benchmarks,
+    "mask": mask_benchmarks,
+    "image": image_benchmarks,
+    "export": export_benchmarks,
+}
+
+
+def collect(suites: list[str] | None = None, quick: bool = False) -> list[Benchmark]:
+    """Collect the benchmarks of each suite in `suites` (all when None)."""
+    return [
+        benchmark
+        for name in suites or SUITES
+        for benchmark in SUITES[name](quick=quick)
+    ]
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+
+class Benchmark(NamedTuple):
+    """A single timed case. `setup` is called (untimed) before each round and
+    whatever it returns is passed to `func`."""
+
+    name: str
+    func: Callable[[Any], object]
+    setup: Callable[[], Any] = lambda: None
+
+
+class Timing(TypedDict):
+    rounds: int
+    min: float
+    max: float
+    mean: float
+    median: float
+    stdev: float
+
+
+class Results(TypedDict):
+    meta: dict[str, str | int]
+    benchmarks: dict[str, Timing]
+
+
+class Regression(NamedTuple):
+    name: str
+    old: float
+    new: float
+
+    @property
+    def ratio(self) -> float:
+        return self.new / self.old
+
+
+def time_benchmark(benchmark: Benchmark, rounds: int = 5) -> Timing:
+    """Time `rounds` calls of a benchmark.
+
+    Args:
+        benchmark: Benchmark to time.
+        rounds: Number of timed calls. Defaults to 5.
+
+    Returns:
+        Timing stats (in seconds) for the benchmark.
+    """
+    times = []
+    for _ in range(rounds):
+        arg = benchmark.setup()
+        start = time.perf_counter()
+        benchmark.func(arg)
+        times.append(time.perf_counter() - start)
+    return {
+        "rounds": rounds,
+        "min": min(times),
+        "max": max(times),
+        "mean": statistics.fmean(times),
+        "median": statistics.median(times),
+        "stdev": statistics.stdev(times) if rounds > 1 else 0.0,
+    }
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    rounds: int = 5,
+    callback: Callable[[str, Timing], None] | None = None,
+) -> Results:
+    """Time each benchmark and collect the results.
+
+    Args:
+        benchmarks: Benchmarks to run.
+        rounds: Number of timed calls per benchmark. Defaults to 5.
+        callback: Called with the name and timing of each finished benchmark
+            (e.g. for progress output). Defaults to None.
+
+    Returns:
+        Timing stats for every benchmark plus info about the environment.
+    """
+    from word_search_generator import __version__
+
+    results: Results = {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "rounds": rounds,
+        },
+        "benchmarks": {},
+    }
+    for benchmark in benchmarks:
+        timing = time_benchmark(benchmark, rounds)
+        results["benchmarks"][benchmark.name] = timing
+        if callback:
+            callback(benchmark.name, timing)
+    return results
+
+
+def save_results(results: Results, path: Path) -> None:
+    path.write_text(json.dumps(results, indent=2))
+
+
+def load_results(path: Path) -> Results:
+    results: Results = json.loads(path.read_text())
+    return results
+
+
+def compare_results(
+    old: Results, new: Results, threshold: float = 1.25, stat: str = "median"
+) -> list[Regression]:
+    """Find benchmarks that got slower between two runs.
+
+    Args:
+        old: Baseline results.
+        new: Results to check.
+        threshold: Slowdown ratio (new / old) considered a regression.
+            Defaults to 1.25.
+        stat: Timing stat to compare. Defaults to "median".
+
+    Returns:
+        Regressions found, slowest first. Benchmarks missing from
+        either run are ignored.
+    """
+    regressions = []
+    for name, timing in new["benchmarks"].items():
+        if name not in old["benchmarks"]:
+            continue
+        before = old["benchmarks"][name][stat]  # type: ignore[literal-required]
+        after = timing[stat]  # type: ignore[literal-required]
+        if before and after / before > threshold:
+            regressions.append(Regression(name, before, after))
+    return sorted(regressions, key=lambda r: r.ratio, reverse=True)
@@ -9,11 +9,13 @@ Generate Word Search puzzles with Python.
 
 __all__ = [
     "__version__",
+    "generate_many",
     "WordSearch",
 ]
 
 from rich.traceback import install
 
+from .word_search.batch import generate_many  # noqa: F401
 from .word_search.word_search import WordSearch  # noqa: F401c
 
 install(show_locals=True)
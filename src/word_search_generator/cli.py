@@ -8,7 +8,7 @@ from .core.directions import LEVEL_DIRS
 from .core.game import Game
 from .core.word import Direction
 from .mask import Mask, shapes
-from .utils import get_random_words
+from .utils import get_random_words, read_words
 
 BUILTIN_MASK_SHAPES_OBJECTS = shapes.get_shape_objects()
 
@@ -185,6 +185,12 @@ If all words can't be placed, and exception will be raised.",
         type=int,
         help=f"{Game.MIN_PUZZLE_SIZE} <= puzzle size <= {Game.MIN_PUZZLE_SIZE}",
     )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print puzzle generation stats (phase timings, placement attempts, \
+rejected fits, and duplicate word checks) to stderr.",
+    )
     secret_words_group.add_argument(
         "-x",
         "--secret-words",
@@ -198,6 +204,13 @@ If all words can't be placed, and exception will be raised.",
         action=DifficultyAction,
         help="Difficulty level (numeric) or cardinal directions \
 secret puzzle words can go. See valid arguments above.",
+    )
+    parser.add_argument(
+        "-w",
+        "--wordlist",
+        type=str,
+        help="Word list file (or '-' for stdin) to pick `-r, --random` and \
+`-rx, --random-secret-words` words from instead of the built-in dictionary.",
     )
     parser.add_argument(
         "--version",
@@ -205,6 +218,10 @@ secret puzzle words can go. See valid arguments above.",
         version=f"%(prog)s {version('word_search_generator')}",
     )
     args = parser.parse_args(argv)
+    if args.wordlist and not (args.random or args.random_secret_words):
+        parser.error(
+            "-w, --wordlist requires -r, --random or -rx, --random-secret-words"
+        )
 
     # check for mask preview first
     if args.preview_masks:
@@ -243,28 +260,55 @@ secret puzzle words can go. See valid arguments above.",
             console.print(table)
         return 0
 
+    # pick all random words in a single pass over the word list
+    random_words: list[str] = []
+    if args.wordlist:
+        from .word_search import WordSearch
+        from .wordlist import WordSource
+
+        source = WordSource(
+            args.wordlist,
+            max_length=args.size,
+            validators=None if args.no_validators else WordSearch.DEFAULT_VALIDATORS,
+        )
+        random_words = source.sample(
+            (args.random or 0) + (args.random_secret_words or 0)
+        )
+
     # process puzzle words
     words = ""
     if args.random:
         words = ",".join(
-            get_random_words(args.random, max_length=args.size if args.size else None)
+            random_words[: args.random]
+            if args.wordlist
+            else get_random_words(
+                args.random, max_length=args.size if args.size else None
+            )
         )
     elif args.input:
-        words = args.input.read_text()
+        # only read as many words as a puzzle can hold
+        with args.input.open() as f:
+            words = ",".join(read_words(f, Game.MAX_PUZZLE_WORDS))
     elif isinstance(args.words, list):
         # needed when words were provided as "command, then, space"
         words = ",".join([word.replace(",", "") for word in args.words])
     elif not sys.stdin.isatty():
         # disable interactive tty which can be confusing
         # but still process words were piped in from the shell
-        words = args.words.read().rstrip()
+        words = ",".join(read_words(args.words, Game.MAX_PUZZLE_WORDS))
 
     # process secret puzzle words
     secret_words = (
         args.secret_words
         if args.secret_words
         else (
-            ",".join(get_random_words(args.random_secret_words))
+            ",".join(
+                random_words[args.random or 0 :]
+                if args.wordlist
+                else get_random_words(
+                    args.random_secret_words, exclude=words.split(",")
+                )
+            )
             if args.random_secret_words
             else ""
         )
@@ -277,6 +321,7 @@ secret puzzle words can go. See valid arguments above.",
 
     # create a new puzzle object from provided arguments
     from .word_search import WordSearch
+    from .word_search._generator import WordSearchGenerator
 
     puzzle = WordSearch(
         words,
@@ -286,6 +331,7 @@ secret puzzle words can go. See valid arguments above.",
         secret_level=args.secret_difficulty,
         require_all_words=args.require_all_words,
         validators=None if args.no_validators else WordSearch.DEFAULT_VALIDATORS,
+        generator=WordSearchGenerator(profile=True) if args.stats else None,
     )
 
     # apply masking if specified
@@ -327,6 +373,9 @@ secret puzzle words can go. See valid arguments above.",
             hide_key=args.hide_key,
         )
 
+    if args.stats and puzzle.stats:
+        print(puzzle.stats, file=sys.stderr)
+
     return 0
 
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING, Any
 
 if TYPE_CHECKING:  # pragma: no cover
     from pathlib import Path
@@ -20,12 +20,15 @@ class Formatter(ABC):
         """Return a string representation of the game."""
 
     @abstractmethod
-    def save(self, game: GameType, path: str | Path, format: str = "PDF") -> Path:
-        """Save the current puzzle to a file.
+    def save(
+        self, game: GameType, path: str | Path | IO[Any], format: str = "PDF"
+    ) -> Path | None:
+        """Save the current puzzle to a file or stream.
 
         Args:
             game (Game): Parent `WordSearch` puzzle.
-            path (str | Path): File save path.
+            path (str | Path | IO): File save path, or a text or binary stream
+                (e.g. an in-memory buffer) to write the puzzle to.
             format (str, optional): Type of file to save ("CSV", "JSON", "PDF").
                 Defaults to "PDF".
             solution (bool, optional): Include solution with the saved file.
@@ -34,5 +37,6 @@ class Formatter(ABC):
                 characters highlighted in red. Defaults to False.
 
         Returns:
-            str: Final save path of the file.
+            Path | None: Final save path of the file (None when written to a
+                stream).
         """
@@ -1,15 +1,22 @@
+import asyncio
 import json
-from collections.abc import Iterable, Sized
-from math import log2
+import random
+from collections.abc import Iterable, Iterator, Sized
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from functools import partial
+from io import TextIOBase
+from math import isqrt, log2
 from pathlib import Path
-from typing import TypeAlias
+from typing import IO, Any, TypeAlias
 
+from .. import utils
 from ..core.formatter import Formatter
-from ..core.generator import Generator
+from ..core.generator import Generator, GeneratorStats
 from ..mask import CompoundMask, Mask
 from ..utils import BoundingBox, find_bounding_box
 from .directions import LEVEL_DIRS, Direction
-from .validator import Validator
+from .validator import Validator, ValidatorPipeline
 from .word import KeyInfo, KeyInfoJson, Word
 
 
@@ -86,14 +93,20 @@ class Game:
 
     def __init__(
         self,
-        words: str | WordSet | None = None,
+        words: str | TextIOBase | WordSet | None = None,
         level: int | str | None = None,
         size: int | None = None,
         require_all_words: bool = False,
         generator: Generator | None = None,
         formatter: Formatter | None = None,
         validators: Iterable[Validator] | None = None,
+        compact: bool = False,
+        seed: int | None = None,
     ):
+        # setup puzzle rng first since word colors are drawn from it
+        self._seed: int | None = seed
+        self.rng: random.Random = self._new_rng(seed)
+
         # setup puzzle
         self._words: WordSet = set()
         self._level: DirectionSet = set()
@@ -103,6 +116,15 @@ class Game:
         self._puzzle: Puzzle = []
         self._masks: list[Mask] = []
         self._mask: Puzzle = []
+        # packed versions of the puzzle and mask used when `compact` is set
+        self._compact: bool = compact
+        self._packed_puzzle: str = ""
+        self._packed_mask: tuple[int, int] | None = None  # (size, bits)
+        self._stats: GeneratorStats | None = None
+        # deferred regeneration (see `batch()`)
+        self._batch_depth = 0
+        self._pending: bool = False
+        self._pending_reset_size: bool = False
 
         # setup required defaults
         self.generator: Generator | None = (
@@ -112,11 +134,15 @@ class Game:
             formatter if formatter is not None else self.DEFAULT_FORMATTER
         )
         self._validators: Iterable[Validator] | None = validators
+        # built when needed so cached validation results survive regeneration
+        self._validator_pipeline: ValidatorPipeline | None = None
 
         # set game words
         if words:
             self._words = (
-                self._process_input(words) if isinstance(words, str) else words
+                self._process_input(words)
+                if isinstance(words, str | TextIOBase)
+                else words
             )
 
         # determine valid word directions
@@ -150,16 +176,23 @@ class Game:
     @property
     def placed_words(self) -> WordSet:
         """Words of any type currently placed in the puzzle."""
+        self._flush()
         return {word for word in self.words if word.placed}
 
     @property
     def unplaced_words(self) -> WordSet:
         """Words of any type not currently placed in the puzzle."""
+        self._flush()
         return {word for word in self.words if not word.placed}
 
     @property
     def puzzle(self) -> Puzzle:
         """The current puzzle state."""
+        self._flush()
+        if self._packed_puzzle:
+            return utils.unpack_grid(
+                self._packed_puzzle, isqrt(len(self._packed_puzzle))
+            )
         return self._puzzle
 
     @property
@@ -170,6 +203,9 @@ class Game:
     @property
     def mask(self) -> Puzzle:
         """The current puzzle state."""
+        if self._packed_mask is not None:
+            size, bits = self._packed_mask
+            return utils.unpack_bits(bits, size, self.ACTIVE, self.INACTIVE)
         return self._mask
 
     @property
@@ -186,13 +222,27 @@ class Game:
     def bounding_box(self) -> BoundingBox:
         """Bounding box of the active puzzle area as a rectangle defined
         by a tuple of (top-left edge as x, y, bottom-right edge as x, y)"""
+        if self._packed_mask is not None:
+            return utils.bits_bounding_box(*reversed(self._packed_mask))
         return find_bounding_box(self.mask, self.ACTIVE)
 
     @property
     def cropped_puzzle(self) -> Puzzle:
         """The current puzzle state cropped to the mask."""
+        self._flush()
         min_x, min_y = self.bounding_box[0]
         max_x, max_y = self.bounding_box[1]
+        if self._packed_puzzle:
+            size = isqrt(len(self._packed_puzzle))
+            return [
+                [
+                    c if c != utils.PACKED_EMPTY else ""
+                    for c in self._packed_puzzle[y * size : (y + 1) * size][
+                        min_x : max_x + 1
+                    ]
+                ]
+                for y in range(min_y, min(max_y + 1, size))
+            ]
         return [list(row[min_x : max_x + 1]) for row in self.puzzle[min_y : max_y + 1]]
 
     @property
@@ -237,7 +287,7 @@ class Game:
                 from the Direction object.
         """
         self._directions = self.validate_level(value)
-        self.generate()
+        self._regenerate()
 
     @property
     def direction_set_repr(self) -> str:
@@ -278,6 +328,12 @@ class Game:
             ValueError: Must be greater than `self.MIN_PUZZLE_SIZE` and
                 less than `self.MAX_PUZZLE_SIZE`.
         """
+        if self._set_size(value):
+            self._regenerate()
+
+    def _set_size(self, value: int) -> bool:
+        """Validate and set the puzzle size (reapplying any masks) without
+        regenerating the puzzle. Returns True if the size changed."""
         if not isinstance(value, int):
             raise TypeError("Size must be an integer.")
         if not self.MIN_PUZZLE_SIZE <= value <= self.MAX_PUZZLE_SIZE:
@@ -285,10 +341,62 @@ class Game:
                 f"Puzzle size must be >= {self.MIN_PUZZLE_SIZE}"
                 + f" and <= {self.MAX_PUZZLE_SIZE}."
             )
-        if self.size != value:
-            self._size = value
-            self._reapply_masks()
-            self.generate()
+        if self.size == value:
+            return False
+        # masks applied before the puzzle had a size are generated at the first
+        initial = not self.size
+        self._size = value
+        self._reapply_masks(initial)
+        return True
+
+    @property
+    def compact(self) -> bool:
+        """Store the puzzle and mask in a compact packed form between changes.
+
+        The puzzle letters are packed into a single string and the mask into the
+        bits of a single integer, greatly reducing the memory used by each game.
+        The `puzzle` and `mask` properties still return nested lists, but they
+        are built on each access, so changes to them don't affect the game."""
+        return self._compact
+
+    @compact.setter
+    def compact(self, value: bool) -> None:
+        """Set the compact storage of the game puzzle and mask.
+
+        Args:
+            value: Compact storage.
+        """
+        self._compact = value
+        if value:
+            self._pack_grids()
+        else:
+            self._unpack_grids()
+
+    @property
+    def seed(self) -> int | None:
+        """Seed for the game random number generator (`rng`).
+
+        When set, the rng is reseeded before each generation so the same
+        words and settings always produce the same puzzle."""
+        return self._seed
+
+    @seed.setter
+    def seed(self, value: int | None) -> None:
+        """Set the game seed and regenerate the puzzle.
+
+        Args:
+            value: Random seed. Use None for an unseeded game.
+        """
+        self._seed = value
+        self.rng = self._new_rng(value)
+        if self.words:
+            self._regenerate()
+
+    @property
+    def stats(self) -> GeneratorStats | None:
+        """Stats recorded during the last puzzle generation. Only available
+        when the game generator was created with `profile=True`."""
+        return self._stats
 
     @property
     def validators(self) -> Iterable[Validator] | None:
@@ -303,7 +411,22 @@ class Game:
             value: Game word validators.
         """
         self._validators = value
-        self.generate()
+        self._validator_pipeline = None
+        self._regenerate()
+
+    @property
+    def validator_pipeline(self) -> ValidatorPipeline | None:
+        """Pipeline running the game validators. Results of context-free
+        validators are cached for as long as the validators don't change."""
+        if not self._validators:
+            return None
+        pipeline = self._validator_pipeline
+        if pipeline is None or (
+            isinstance(self._validators, Sized)
+            and tuple(self._validators) != pipeline.validators
+        ):
+            pipeline = self._validator_pipeline = ValidatorPipeline(self._validators)
+        return pipeline
 
     # ************************************************* #
     # ******************** METHODS ******************** #
@@ -322,17 +445,57 @@ class Game:
             raise MissingFormatterError()
         print(self.formatter.show(self, *args, **kwargs))
 
-    def save(self, path: str | Path, format: str = "PDF", *args, **kwargs) -> str:
-        """Save the current puzzle to a file.
+    def save(
+        self, path: str | Path | IO[Any], format: str = "PDF", *args, **kwargs
+    ) -> str:
+        """Save the current puzzle to a file or stream.
 
         Args:
-            path: File save path.
+            path: File save path, or a text or binary stream (e.g. an in-memory
+                buffer, socket file, or zip archive member) to write to. PDFs
+                require a binary stream.
             format: Type of file to save ("CSV", "JSON", "PDF"). Defaults to "PDF".
 
         Raises:
             EmptyPuzzleError: Puzzle not yet generated or puzzle has no placed words.
             MissingFormatterError: No puzzle formatter set.
 
+        Returns:
+            Final save path of the file (an empty string when written to a stream).
+        """
+        if not self.puzzle or not self.placed_words:
+            raise EmptyPuzzleError()
+        if not self.formatter:
+            raise MissingFormatterError()
+        saved_file = self.formatter.save(self, path, format, *args, **kwargs)
+        return str(saved_file) if saved_file else ""
+
+    async def save_async(
+        self,
+        path: str | Path | IO[Any],
+        format: str = "PDF",
+        *args,
+        executor: Executor | None = None,
+        **kwargs,
+    ) -> str:
+        """Save the current puzzle to a file without blocking the event loop.
+
+        Rendering and writing the file run in `executor` so a single process
+        can export many puzzles concurrently. Since the puzzle is read while
+        it is being saved, don't modify it until the save has finished.
+
+        Args:
+            path: File save path, or a text or binary stream to write to.
+            format: Type of file to save ("CSV", "JSON", "PDF"). Defaults to "PDF".
+            executor: Worker pool used to save the file. A
+                `concurrent.futures.ProcessPoolExecutor` renders on multiple
+                cores (the puzzle is pickled and sent to the worker). Defaults to
+                None (the event loop's default thread pool).
+
+        Raises:
+            EmptyPuzzleError: Puzzle not yet generated or puzzle has no placed words.
+            MissingFormatterError: No puzzle formatter set.
+
         Returns:
             Final save path of the file.
         """
@@ -340,12 +503,21 @@ class Game:
             raise EmptyPuzzleError()
         if not self.formatter:
             raise MissingFormatterError()
-        return str(self.formatter.save(self, path, format, *args, **kwargs))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, partial(self.save, path, format, *args, **kwargs)
+        )
 
     # *************************************************************** #
     # ******************** PROCESSING/GENERATION ******************** #
     # *************************************************************** #
 
+    @staticmethod
+    def _new_rng(seed: int | None) -> random.Random:
+        """Create a random number generator for a game. Unseeded games are
+        seeded from the global `random` state so `random.seed()` still works."""
+        return random.Random(seed if seed is not None else random.getrandbits(64))
+
     @staticmethod
     def _build_puzzle(size: int, char: str) -> Puzzle:
         """Build an empty nested list/puzzle grid."""
@@ -369,8 +541,9 @@ class Game:
             raise MissingGeneratorError()
         if not self.words:
             raise EmptyWordlistError("No words have been added to the puzzle.")
+        self._pending = self._pending_reset_size = False
         if not self.size or reset_size:
-            self.size = self._calc_puzzle_size(self._words, self._directions)
+            self._set_size(self._calc_puzzle_size(self._words, self._directions))
         min_word_length = (
             min([len(word.text) for word in self.words]) if self.words else self.size
         )
@@ -380,15 +553,102 @@ class Game:
             )
         for word in self.words:
             word.remove_from_puzzle()
+        if self.seed is not None:
+            self.rng.seed(self.seed)
+        self._unpack_grids()
         if not self.mask or len(self.mask) != self.size:
             self._mask = self._build_puzzle(self.size, self.ACTIVE)
         self._puzzle = self.generator.generate(self)
+        self._stats = self.generator.stats
+        self._pack_grids()
         if not self.masked and not self.placed_words:
             raise NoValidWordsError("No valid words have been added to the puzzle.")
         if self.require_all_words and self.unplaced_words:
             raise MissingWordError("All words could not be placed in the puzzle.")
 
-    def _process_input(self, words: str, secret: bool = False) -> WordSet:
+    @contextmanager
+    def batch(self) -> Iterator["Game"]:
+        """Defer puzzle regeneration while making several changes.
+
+        Changes made inside the block (e.g. adding words, resizing, or
+        applying masks) normally regenerate the puzzle each time. Inside a
+        batch, the puzzle is regenerated just once when the (outermost) block
+        exits, or sooner if the puzzle is read inside the block.
+
+        Example:
+            ```python
+            with puzzle.batch():
+                puzzle.add_words("dog, cat")
+                puzzle.size = 20
+                puzzle.apply_mask(Circle())
+            ```
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth:
+            self._flush()
+
+    def _regenerate(self, reset_size: bool = False) -> None:
+        """Regenerate the puzzle after a change, or defer it if batching."""
+        if self._batch_depth:
+            self._pending = True
+            self._pending_reset_size |= reset_size
+        else:
+            self.generate(reset_size=reset_size)
+
+    def _flush(self) -> None:
+        """Run any regeneration deferred by `batch()`."""
+        if self._pending:
+            self.generate(reset_size=self._pending_reset_size)
+
+    def _pack_grids(self) -> None:
+        """Pack the puzzle and mask when `compact` storage is set."""
+        if not self.compact:
+            return
+        if self._puzzle:
+            self._packed_puzzle = utils.pack_grid(self._puzzle)
+            self._puzzle = []
+        if self._mask:
+            self._packed_mask = (
+                len(self._mask),
+                utils.pack_bits(self._mask, self.ACTIVE),
+            )
+            self._mask = []
+
+    def _unpack_grids(self) -> None:
+        """Unpack the puzzle and mask back into nested lists for processing."""
+        if self._packed_puzzle:
+            self._puzzle = self.puzzle
+            self._packed_puzzle = ""
+        if self._packed_mask is not None:
+            self._mask = self.mask
+            self._packed_mask = None
+
+    def _mask_bits(self) -> int:
+        """The current puzzle mask packed into bits (see `utils.pack_bits()`)."""
+        if self._packed_mask is not None:
+            return self._packed_mask[1]
+        return utils.pack_bits(self._mask, self.ACTIVE)
+
+    def _mask_size(self) -> int:
+        """Size of the current puzzle mask."""
+        if self._packed_mask is not None:
+            return self._packed_mask[0]
+        return len(self._mask)
+
+    def _set_mask_bits(self, bits: int, size: int) -> None:
+        """Replace the current puzzle mask with packed mask `bits`."""
+        if self.compact:
+            self._packed_mask = (size, bits)
+            self._mask = []
+        else:
+            self._mask = utils.unpack_bits(bits, size, self.ACTIVE, self.INACTIVE)
+            self._packed_mask = None
+
+    def _process_input(self, words: str | TextIOBase, secret: bool = False) -> WordSet:
         clean_words = self._cleanup_input(words, secret=secret)
         return clean_words
 
@@ -416,9 +676,10 @@ class Game:
 
     def add_words(
         self,
-        words: str | WordSet,
+        words: str | TextIOBase | WordSet,
         secret: bool = False,
         reset_size: bool = False,
+        incremental: bool = False,
     ) -> None:
         """Add words to the puzzle.
 
@@ -427,31 +688,94 @@ class Game:
             secret: Should the new words be secret. Defaults to False.
             reset_size: Reset the puzzle size based on the updated words.
                 Defaults to False.
+            incremental: Fit the new words into the current puzzle instead of
+                regenerating it, leaving all placed words where they are.
+                Falls back to regenerating the puzzle when not possible (e.g.
+                `reset_size` is set or the generator doesn't support it).
+                Defaults to False.
         """
-        if isinstance(words, str):
+        if isinstance(words, str | TextIOBase):
             words = self._process_input(words, secret)
 
+        replaced = {word for word in self._words if word in words}
         # remove all new words first so any updates are reflected in the word list
         self._words.symmetric_difference_update(words)
         self._words.update(words)
-        self.generate(reset_size=reset_size)
+        if incremental and not reset_size and self._update(words, replaced):
+            return
+        self._regenerate(reset_size=reset_size)
 
-    def remove_words(self, words: str | WordSet, reset_size: bool = False) -> None:
+    def remove_words(
+        self,
+        words: str | TextIOBase | WordSet,
+        reset_size: bool = False,
+        incremental: bool = False,
+    ) -> None:
         """Remove words from the puzzle.
 
         Args:
             words: Words to remove.
             reset_size: Reset the puzzle size based on the updated words.
                 Defaults to False.
+            incremental: Clear the words from the current puzzle instead of
+                regenerating it, leaving all other words where they are.
+                Falls back to regenerating the puzzle when not possible (e.g.
+                `reset_size` is set or the generator doesn't support it).
+                Defaults to False.
         """
-        if isinstance(words, str):
+        if isinstance(words, str | TextIOBase):
             words = self._process_input(words)
 
+        removed = {word for word in self._words if word in words}
         self._words.difference_update(words)
-        self.generate(reset_size=reset_size)
+        if incremental and not reset_size and self._update(set(), removed):
+            return
+        self._regenerate(reset_size=reset_size)
+
+    def _update(self, added: WordSet, removed: WordSet) -> bool:
+        """Update the current puzzle in place using the generator.
+
+        Args:
+            added: Words to fit into the puzzle.
+            removed: Words to clear from the puzzle.
+
+        Returns:
+            False if the puzzle couldn't be updated in place and needs
+            to be regenerated instead.
+        """
+        if (
+            not self.generator
+            or not self._words
+            or self._batch_depth
+            or self._pending
+            or not (self._puzzle or self._packed_puzzle)
+        ):
+            return False
+        self._unpack_grids()
+        try:
+            removed = {word for word in removed if word.placed}
+            if removed:
+                self._puzzle = self.generator.remove_words(self, removed)
+                for word in removed:
+                    word.remove_from_puzzle()
+            if added:
+                self._puzzle = self.generator.add_words(self, added)
+        except NotImplementedError:
+            return False
+        finally:
+            self._pack_grids()
+        self._stats = self.generator.stats
+        if self.require_all_words and any(
+            not word.placed and not word.secret for word in added
+        ):
+            raise MissingWordError("All words could not be placed in the puzzle.")
+        return True
 
     def replace_words(
-        self, words: str | WordSet, secret: bool = False, reset_size: bool = False
+        self,
+        words: str | TextIOBase | WordSet,
+        secret: bool = False,
+        reset_size: bool = False,
     ) -> None:
         """Replace all words from the puzzle.
 
@@ -461,30 +785,24 @@ class Game:
             reset_size: Reset the puzzle size based on the updated words.
                 Defaults to False.
         """
-        if isinstance(words, str):
+        if isinstance(words, str | TextIOBase):
             words = self._process_input(words, secret)
 
         self._words.clear()
         self._words.update(words)
-        self.generate(reset_size=reset_size)
+        self._regenerate(reset_size=reset_size)
 
-    def _cleanup_input(self, words: str, secret: bool = False) -> WordSet:
-        """Cleanup provided input string."""
-        if not isinstance(words, str):
+    def _cleanup_input(self, words: str | TextIOBase, secret: bool = False) -> WordSet:
+        """Cleanup provided input string (or text stream)."""
+        if not isinstance(words, str | TextIOBase):
             raise TypeError(
                 "Words must be a string separated by spaces, commas, or new lines"
             )
-        # remove new lines
-        words = words.replace("\n", ",")
-        # remove excess spaces and commas
-        word_list = ",".join(words.split(" ")).split(",")
-        # iterate through all words and pick first set that match criteria
-        word_set: WordSet = set()
-        while word_list and len(word_set) <= self.MAX_PUZZLE_WORDS:
-            word = word_list.pop(0)
-            if word:
-                word_set.add(Word(word, secret=secret))
-        return word_set
+        # dedupe first so only the words kept are built (and colored)
+        return {
+            Word(word, secret=secret, rng=self.rng)
+            for word in utils.read_words(words, self.MAX_PUZZLE_WORDS)
+        }
 
     @staticmethod
     def _validate_direction_iterable(
@@ -530,38 +848,38 @@ class Game:
 
     def apply_mask(self, mask: Mask) -> None:
         """Apply a singular mask object to the puzzle."""
-        if not self.puzzle:
+        if not (self._puzzle or self._packed_puzzle or self._pending):
             raise EmptyPuzzleError()
         if not isinstance(mask, Mask | CompoundMask):
             raise TypeError("Please provide a Mask object.")
-        if mask.puzzle_size != self.size:
-            mask.generate(self.size)
-        for y in range(self.size):
-            for x in range(self.size):
-                if mask.method == 1:
-                    if (
-                        mask.mask[y][x] == self.ACTIVE
-                        and self.mask[y][x] == self.ACTIVE
-                    ):
-                        self.mask[y][x] = self.ACTIVE
-                    else:
-                        self.mask[y][x] = self.INACTIVE
-                elif mask.method == 2:
-                    if mask.mask[y][x] == self.ACTIVE:
-                        self.mask[y][x] = self.ACTIVE
-                else:
-                    if mask.mask[y][x] == self.ACTIVE:
-                        self.mask[y][x] = self.INACTIVE
+        # without a size yet (batching before the first generation) the mask is
+        # applied once the size is known (see `_set_size()`)
+        if self.size:
+            self._apply_mask(mask)
         # add mask to puzzle instance for later reference
         if mask not in self.masks:
             self.masks.append(mask)
         # fill in the puzzle
-        self.generate()
+        self._regenerate()
+
+    def _apply_mask(self, mask: Mask) -> None:
+        """Combine `mask` with the current puzzle mask."""
+        if mask.puzzle_size != self.size:
+            mask.generate(self.size)
+        # start from a fully active mask if the puzzle hasn't been generated yet
+        current = (
+            self._mask_bits()
+            if self._mask_size() == self.size
+            else utils.full_bits(self.size)
+        )
+        bits = utils.composite_bits(current, mask.bits, mask.method)
+        self._set_mask_bits(bits, self.size)
 
     def apply_masks(self, masks: Iterable[Mask]) -> None:
         """Apply a group of masks to the puzzle."""
-        for mask in masks:
-            self.apply_mask(mask)
+        with self.batch():
+            for mask in masks:
+                self.apply_mask(mask)
 
     def show_mask(self) -> None:
         """Show the current puzzle mask."""
@@ -574,46 +892,48 @@ class Game:
     def invert_mask(self) -> None:
         """Invert the current puzzle mask. Has no effect on the
         actual mask(s) found in `WordSearch.mask`."""
-        self._mask = [
-            [self.ACTIVE if c == self.INACTIVE else self.INACTIVE for c in row]
-            for row in self.mask
-        ]
-        self.generate()
+        size = self._mask_size()
+        self._set_mask_bits(self._mask_bits() ^ utils.full_bits(size), size)
+        self._regenerate()
 
     def flip_mask_horizontal(self) -> None:
         """Flip the current puzzle mask along the vertical axis (left to right).
         Has no effect on the actual mask(s) found in `WordSearch.mask`."""
-        self._mask = [r[::-1] for r in self.mask]
-        self.generate()
+        size = self._mask_size()
+        self._set_mask_bits(utils.flip_bits_horizontal(self._mask_bits(), size), size)
+        self._regenerate()
 
     def flip_mask_vertical(self) -> None:
         """Flip the current puzzle mask along the horizontal axis (top to bottom).
         Has no effect on the actual mask(s) found in `WordSearch.mask`."""
-        self._mask = self.mask[::-1]
-        self.generate()
+        size = self._mask_size()
+        self._set_mask_bits(utils.flip_bits_vertical(self._mask_bits(), size), size)
+        self._regenerate()
 
     def transpose_mask(self) -> None:
         """Interchange each row with the corresponding column
         of the current puzzle mask. Has no effect on the actual
         mask(s) found in `WordSearch.mask`."""
-        self._mask = list(map(list, zip(*self.mask, strict=False)))
-        self.generate()
+        size = self._mask_size()
+        self._set_mask_bits(utils.transpose_bits(self._mask_bits(), size), size)
+        self._regenerate()
 
     def remove_masks(self) -> None:
         self._masks = []
-        self._mask = self._build_puzzle(self.size, self.ACTIVE)
-        self.generate()
+        self._set_mask_bits(utils.full_bits(self.size), self.size)
+        self._regenerate()
 
     def remove_static_masks(self) -> None:
         self._masks = [mask for mask in self.masks if not mask.static]
 
-    def _reapply_masks(self) -> None:
-        """Reapply all current masks to the puzzle."""
-        self._mask = self._build_puzzle(self.size, self.ACTIVE)
+    def _reapply_masks(self, include_static: bool = False) -> None:
+        """Reapply all current masks to the puzzle. Static masks generated at
+        a different size are skipped unless `include_static` is set."""
+        self._set_mask_bits(utils.full_bits(self.size), self.size)
         for mask in self.masks:
-            if mask.static and mask.puzzle_size != self.size:
+            if not include_static and mask.static and mask.puzzle_size != self.size:
                 continue
-            self.apply_mask(mask)
+            self._apply_mask(mask)
 
     # ******************************************************** #
     # ******************** DUNDER METHODS ******************** #
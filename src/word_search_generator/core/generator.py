@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import string
+import time
 from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import contextmanager, nullcontext
 from functools import wraps
 from typing import TYPE_CHECKING, TypeAlias
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
+    from contextlib import AbstractContextManager
 
     from . import GameType
     from .game import Puzzle
+    from .word import Word
 
 
 Fit: TypeAlias = tuple[str, list[tuple[int, int]]]
@@ -55,6 +60,68 @@ def retry(retries: int = 1000):
     return decorator
 
 
+class GeneratorStats:
+    """Instrumentation recorded while generating a single puzzle.
+
+    Only collected when the generator is created with `profile=True`. After
+    `Game.generate()` the stats are available as `Game.stats`.
+    """
+
+    REJECTION_REASONS = (
+        "out_of_bounds",
+        "mask_inactive",
+        "letter_conflict",
+        "duplicate_created",
+    )
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}  # wall time (seconds) per phase
+        self.attempts: Counter[str] = Counter()  # placement attempts per word
+        self.rejections: Counter[str] = Counter()  # rejected fits per reason
+        self.dupe_checks = 0  # calls to the duplicate word check
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the wall time of the enclosed block to phase `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def as_dict(self) -> dict[str, object]:
+        """Stats as plain built-in types (e.g. for serializing to JSON)."""
+        return {
+            "phases": dict(self.phases),
+            "attempts": dict(self.attempts),
+            "rejections": {r: self.rejections[r] for r in self.REJECTION_REASONS},
+            "dupe_checks": self.dupe_checks,
+        }
+
+    def __str__(self) -> str:
+        phases = ", ".join(
+            f"{name} {seconds * 1000:.3f}" for name, seconds in self.phases.items()
+        )
+        attempts = ", ".join(
+            f"{word} {count}" for word, count in self.attempts.most_common()
+        )
+        rejections = ", ".join(
+            f"{r} {self.rejections[r]}" for r in self.REJECTION_REASONS
+        )
+        return "\n".join(
+            [
+                f"Phases (ms): {phases or 'none'}",
+                f"Attempts: {sum(self.attempts.values())} ({attempts or 'none'})",
+                f"Rejections: {rejections}",
+                f"Duplicate word checks: {self.dupe_checks}",
+            ]
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.as_dict()})"
+
+
 class Generator(ABC):
     """Base class for the puzzle generation algorithm.
 
@@ -68,14 +135,18 @@ class Generator(ABC):
         ```
     """
 
-    def __init__(self, alphabet: str | Iterable[str] = ALPHABET) -> None:
+    def __init__(
+        self, alphabet: str | Iterable[str] = ALPHABET, profile: bool = False
+    ) -> None:
         """Initialize a puzzle generator.
 
         Args:
             alphabet: Alphabet (letters) to use for the puzzle filler characters.
+            profile: Record `GeneratorStats` for each generated puzzle.
+                Defaults to False.
         """
         if alphabet:
-            self.alphabet = list({c.upper() for c in alphabet if c.isalpha()})
+            self.alphabet = sorted({c.upper() for c in alphabet if c.isalpha()})
         else:
             self.alphabet = ALPHABET
 
@@ -83,6 +154,14 @@ class Generator(ABC):
             raise EmptyAlphabetError()
 
         self.puzzle: Puzzle = []
+        self.profile = profile
+        self.stats: GeneratorStats | None = None
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        """Time the enclosed block as phase `name` when profiling."""
+        if self.stats is None:
+            return nullcontext()
+        return self.stats.phase(name)
 
     @abstractmethod
     def generate(self, game: GameType) -> Puzzle:
@@ -94,3 +173,39 @@ class Generator(ABC):
         Returns:
             The generated puzzle.
         """
+
+    def add_words(self, game: GameType, words: Iterable[Word]) -> Puzzle:
+        """Fit `words` into the current puzzle without moving any placed words.
+
+        Generators that can't update a puzzle in place don't need to implement
+        this, the game falls back to regenerating the entire puzzle.
+
+        Args:
+            game: The base `Game` object (already including `words`).
+            words: Words to fit.
+
+        Raises:
+            NotImplementedError: The generator can't add words in place.
+
+        Returns:
+            The updated puzzle.
+        """
+        raise NotImplementedError
+
+    def remove_words(self, game: GameType, words: Iterable[Word]) -> Puzzle:
+        """Clear `words` from the current puzzle without moving any other words.
+
+        Generators that can't update a puzzle in place don't need to implement
+        this, the game falls back to regenerating the entire puzzle.
+
+        Args:
+            game: The base `Game` object (no longer including `words`).
+            words: Placed words to clear.
+
+        Raises:
+            NotImplementedError: The generator can't remove words in place.
+
+        Returns:
+            The updated puzzle.
+        """
+        raise NotImplementedError
@@ -1,5 +1,8 @@
 import string
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from typing import Any
 
 
 class Validator(ABC):
@@ -13,8 +16,15 @@ class Validator(ABC):
             def validate(self, value: str) -> bool:
                 return value == value[::-1]
         ```
+
+    Validators whose result only depends on the value (not the placed words)
+    should set `context_free = True` so their results can be cached. Override
+    `validate_many()` to check a whole wordlist at once (e.g. a profanity list).
     """
 
+    context_free: bool = False
+    """The result only depends on the value so it can be cached."""
+
     @abstractmethod
     def validate(self, value: str, *args, **kwargs) -> bool:
         """Validate the value.
@@ -27,10 +37,24 @@ class Validator(ABC):
             bool: The validation result.
         """
 
+    def validate_many(self, values: Sequence[str], *args, **kwargs) -> list[bool]:
+        """Validate each of the values.
+
+        Args:
+            values (Sequence[str]): The values to validate.
+            placed_words (list[str]): Current puzzle words.
+
+        Returns:
+            list[bool]: The validation result for each value.
+        """
+        return [self.validate(value, *args, **kwargs) for value in values]
+
 
 class NoSingleLetterWords(Validator):
     """A validator to ensure the value is larger than one character."""
 
+    context_free = True
+
     def validate(self, value: str, *args, **kwargs) -> bool:
         return len(value) > 1
 
@@ -38,6 +62,8 @@ class NoSingleLetterWords(Validator):
 class NoPunctuation(Validator):
     """A validator to ensure the value doesn't contain punctuation."""
 
+    context_free = True
+
     def validate(self, value: str, *args, **kwargs) -> bool:
         return not any(c in string.punctuation for c in value)
 
@@ -45,21 +71,248 @@ class NoPunctuation(Validator):
 class NoPalindromes(Validator):
     """A validator to ensure the value isn't a palindrome."""
 
+    context_free = True
+
     def validate(self, value: str, *args, **kwargs) -> bool:
         return value != value[::-1]
 
 
 class NoSubwords(Validator):
-    """A validator to ensure the value isn't a subword of another word."""
+    """A validator to ensure the value isn't a subword of another word.
+
+    The placed words are indexed as they are added, so each check only takes
+    time proportional to the length of the value instead of the placed words.
+    """
+
+    def __init__(self) -> None:
+        # index of the last list of placed words seen (per thread)
+        self._local = threading.local()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {}  # the index is rebuilt when needed
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__()  # type: ignore[misc]
 
     def validate(self, value: str, *args, **kwargs) -> bool:  # type: ignore
         placed_words = kwargs["placed_words"] or []
-        for test_word in placed_words:
-            if (
-                value.lower() in test_word.lower()
-                or value[::-1].lower() in test_word.lower()
-                or test_word.lower() in value.lower()
-                or test_word.lower()[::-1] in value.lower()
-            ):
+        if not placed_words:
+            return True
+        index = self._index(placed_words)
+        value = value.lower()
+        return not (
+            value in index.substrings
+            or value[::-1] in index.substrings
+            or index.words.found_in(value)
+        )
+
+    def _index(self, placed_words: list[str]) -> "_SubwordIndex":
+        """Index for `placed_words`. When the same list is validated again after
+        words were appended (e.g. during puzzle generation), only the new words
+        are added to the index. Only the last indexed word is checked for
+        changes, so lists edited in place (other than appending) should be
+        replaced with a new list instead."""
+        index: _SubwordIndex | None = getattr(self._local, "index", None)
+        indexed = len(index.indexed) if index is not None else 0
+        if (
+            index is None
+            or index.source is not placed_words
+            or len(placed_words) < indexed
+            or (indexed and placed_words[indexed - 1] != index.indexed[-1])
+        ):
+            index = self._local.index = _SubwordIndex(placed_words)
+        for word in placed_words[len(index.indexed) :]:
+            index.add(word)
+        return index
+
+
+class ValidatorPipeline:
+    """Run a set of validators over words.
+
+    Context-free validators run first and their results are cached by value,
+    so each value is only checked once by them no matter how many times the
+    puzzle is regenerated. Context-dependent validators (e.g. `NoSubwords`)
+    run every time with the current placed words.
+    """
+
+    def __init__(self, validators: Iterable[Validator]) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            validators: Validators to run.
+
+        Raises:
+            TypeError: Incorrect validator type provided.
+        """
+        self.validators: tuple[Validator, ...] = tuple(validators)
+        for validator in self.validators:
+            if not isinstance(validator, Validator):
+                raise TypeError(f"Invalid validator: {validator}.")
+        self.context_free = [v for v in self.validators if v.context_free]
+        self.contextual = [v for v in self.validators if not v.context_free]
+        self._cache: dict[str, bool] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.validators)
+
+    def prime(self, values: Iterable[str]) -> None:
+        """Run the context-free validators over every uncached value in a single
+        `validate_many()` call per validator and cache the results."""
+        pending = [value for value in dict.fromkeys(values) if value not in self._cache]
+        for validator in self.context_free:
+            if not pending:
+                break
+            results = validator.validate_many(pending, placed_words=[])
+            for value, valid in zip(pending, results, strict=True):
+                if not valid:
+                    self._cache[value] = False
+            pending = [value for value in pending if value not in self._cache]
+        self._cache.update(dict.fromkeys(pending, True))
+
+    def validate(self, value: str, placed_words: list[str] | None = None) -> bool:
+        """Validate a value against every validator.
+
+        Args:
+            value: The value to validate.
+            placed_words: Current puzzle words. Defaults to None.
+
+        Returns:
+            The value passes all validators.
+        """
+        if value not in self._cache:
+            self.prime([value])
+        if not self._cache[value]:
+            return False
+        placed_words = placed_words or []
+        return all(
+            validator.validate(value, placed_words=placed_words)
+            for validator in self.contextual
+        )
+
+    def validate_many(
+        self, values: Sequence[str], placed_words: list[str] | None = None
+    ) -> list[bool]:
+        """Validate each of the values against every validator.
+
+        Args:
+            values: The values to validate.
+            placed_words: Current puzzle words (the same for every value).
+                Defaults to None.
+
+        Returns:
+            The validation result for each value.
+        """
+        self.prime(values)
+        results = {value: self._cache[value] for value in values}
+        placed_words = placed_words or []
+        for validator in self.contextual:
+            pending = [value for value, valid in results.items() if valid]
+            if not pending:
+                break
+            checks = validator.validate_many(pending, placed_words=placed_words)
+            for value, valid in zip(pending, checks, strict=True):
+                results[value] = valid
+        return [results[value] for value in values]
+
+
+class _SubwordIndex:
+    """Substrings of a list of words (and the words plus their reverses)."""
+
+    def __init__(self, source: list[str]) -> None:
+        self.source = source
+        self.indexed: list[str] = []
+        self.substrings = _SuffixAutomaton()
+        self.words = _WordTrie()
+
+    def add(self, word: str) -> None:
+        self.indexed.append(word)
+        word = word.lower()
+        self.substrings.add(word)
+        self.words.add(word)
+        self.words.add(word[::-1])
+
+
+class _SuffixAutomaton:
+    """Generalized suffix automaton that accepts every substring of the added
+    strings. Each string is added in time proportional to its length, and
+    substrings are looked up in time proportional to the substring length."""
+
+    def __init__(self) -> None:
+        self.transitions: list[dict[str, int]] = [{}]
+        self.links: list[int] = [-1]
+        self.lengths: list[int] = [0]
+
+    def __contains__(self, value: str) -> bool:
+        state: int | None = 0
+        for c in value:
+            state = self.transitions[state].get(c)  # type: ignore[index]
+            if state is None:
                 return False
         return True
+
+    def add(self, value: str) -> None:
+        last = 0
+        for c in value:
+            last = self._extend(last, c)
+
+    def _extend(self, last: int, c: str) -> int:
+        """Extend the automaton by `c` from state `last`. Returns the new state."""
+        transitions, links, lengths = self.transitions, self.links, self.lengths
+        if c in transitions[last]:  # the substring was already added
+            q = transitions[last][c]
+            if lengths[q] == lengths[last] + 1:
+                return q
+            return self._split(last, c, q)
+        state = len(transitions)
+        transitions.append({})
+        links.append(0)
+        lengths.append(lengths[last] + 1)
+        p = last
+        while p != -1 and c not in transitions[p]:
+            transitions[p][c] = state
+            p = links[p]
+        if p != -1:
+            q = transitions[p][c]
+            links[state] = q if lengths[p] + 1 == lengths[q] else self._split(p, c, q)
+        return state
+
+    def _split(self, p: int, c: str, q: int) -> int:
+        """Clone state `q` so the `c` transition from `p` (and its suffix links)
+        leads to a state of length `lengths[p] + 1`. Returns the clone."""
+        transitions, links, lengths = self.transitions, self.links, self.lengths
+        clone = len(transitions)
+        transitions.append(dict(transitions[q]))
+        links.append(links[q])
+        lengths.append(lengths[p] + 1)
+        links[q] = clone
+        while p != -1 and transitions[p].get(c) == q:
+            transitions[p][c] = clone
+            p = links[p]
+        return clone
+
+
+class _WordTrie:
+    """Trie of words used to find any of the words within a value."""
+
+    END = ""  # key marking the end of a word (never a character)
+
+    def __init__(self) -> None:
+        self.root: dict[str, Any] = {}
+
+    def add(self, word: str) -> None:
+        node = self.root
+        for c in word:
+            node = node.setdefault(c, {})
+        node[self.END] = True
+
+    def found_in(self, value: str) -> bool:
+        """Is any word in the trie a substring of `value`."""
+        for start in range(len(value)):
+            node: dict[str, Any] | None = self.root
+            for c in value[start:]:
+                node = node.get(c)  # type: ignore[union-attr]
+                if node is None:
+                    break
+                if self.END in node:
+                    return True
+        return False
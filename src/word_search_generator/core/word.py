@@ -7,7 +7,7 @@ from rich.style import Style
 
 from ..utils import BoundingBox
 from .game import Direction
-from .validator import Validator
+from .validator import Validator, ValidatorPipeline
 
 
 class Position(NamedTuple):
@@ -35,27 +35,38 @@ class Word:
         self,
         text: str,
         secret: bool = False,
+        rng: random.Random | None = None,
     ) -> None:
-        """Initialize a Word Search puzzle Word."""
+        """Initialize a Word Search puzzle Word.
+
+        Args:
+            text: Word text.
+            secret: Word is a secret word. Defaults to False.
+            rng: Random number generator used to pick the word color.
+                Defaults to the global `random` functions.
+        """
         self.text = text.upper().strip()
         self.start_row: int | None = None
         self.start_column: int | None = None
         self.coordinates: list[tuple[int, int]] = []
         self.direction: Direction | None = None
         self.secret = secret
+        rand = rng if rng is not None else random
         self.color = colorsys.hsv_to_rgb(
-            random.random(),
-            random.randint(42, 98) / 100,
-            random.randint(40, 90) / 100,
+            rand.random(),
+            rand.randint(42, 98) / 100,
+            rand.randint(40, 90) / 100,
         )
 
     def validate(
-        self, validators: Iterable[Validator], placed_words: list[str]
+        self,
+        validators: Iterable[Validator] | ValidatorPipeline,
+        placed_words: list[str],
     ) -> bool:
         """Validate the word against a list of validators.
 
         Args:
-            validators: Validators to test.
+            validators: Validators to test (or a pipeline of them).
             placed_words: Currently placed puzzle words.
 
         Raises:
@@ -64,12 +75,9 @@ class Word:
         Returns:
             Word passes all validators.
         """
-        for validator in validators:
-            if not isinstance(validator, Validator):
-                raise TypeError(f"Invalid validator: {validator}.")
-            if not validator.validate(self.text, placed_words=placed_words):
-                return False
-        return True
+        if not isinstance(validators, ValidatorPipeline):
+            validators = ValidatorPipeline(validators)
+        return validators.validate(self.text, placed_words)
 
     @property
     def lowercase(self) -> str:
@@ -1,4 +1,18 @@
-from ..utils import BoundingBox, find_bounding_box
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import wraps
+from pathlib import PurePath
+from typing import Any, NamedTuple, TypeAlias
+
+from ..utils import (
+    BoundingBox,
+    composite_bits,
+    find_bounding_box,
+    full_bits,
+    pack_bits,
+    unpack_bits,
+)
 
 
 class MaskNotGenerated(Exception):
@@ -7,6 +21,171 @@ class MaskNotGenerated(Exception):
     pass
 
 
+class _FrozenList(tuple[Any, ...]):
+    """Immutable stand-in for a list stored in the `MaskCache`."""
+
+
+class _FrozenNestedList(_FrozenList):
+    """Immutable stand-in for a list of lists/masks stored in the `MaskCache`."""
+
+
+class _FrozenMask(NamedTuple):
+    """Immutable stand-in for a (sub) `Mask` stored in the `MaskCache`."""
+
+    cls: type["Mask"]
+    attrs: "MaskState"
+
+
+# (attribute name, frozen value) pairs of a mask
+MaskState: TypeAlias = tuple[tuple[str, Any], ...]
+
+_SCALARS = (type(None), bool, int, float, str, bytes, PurePath)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert a mask attribute value into an immutable (hashable) value.
+
+    Raises:
+        TypeError: `value` can't be safely frozen (and the mask can't be cached).
+    """
+    if isinstance(value, _SCALARS):
+        return value
+    if isinstance(value, tuple):
+        if all(isinstance(v, _SCALARS) for v in value):
+            return value
+        frozen = tuple(_freeze(v) for v in value)
+        if any(isinstance(v, _FrozenList | _FrozenMask) for v in frozen):
+            raise TypeError("Can't freeze mutable values within a tuple.")
+        return frozen
+    if isinstance(value, list):
+        frozen = tuple(_freeze(v) for v in value)
+        if any(isinstance(v, _FrozenList | _FrozenMask) for v in frozen):
+            return _FrozenNestedList(frozen)
+        return _FrozenList(frozen)
+    if isinstance(value, Mask):
+        return _FrozenMask(type(value), _freeze_attrs(value))
+    raise TypeError(f"Can't freeze {type(value).__name__!r} for the mask cache.")
+
+
+def _freeze_attrs(mask: "Mask", exclude: tuple[str, ...] = ()) -> MaskState:
+    return tuple(
+        (name, tuple(map(tuple, value)) if name == "_mask" else _freeze(value))
+        for name, value in sorted(vars(mask).items())
+        if name not in exclude
+    )
+
+
+def _thaw(value: Any) -> Any:
+    """Reverse `_freeze()`, returning fresh copies of any mutable values."""
+    if isinstance(value, _FrozenNestedList):
+        return [_thaw(v) for v in value]
+    if isinstance(value, _FrozenList):
+        return list(value)
+    if isinstance(value, _FrozenMask):
+        mask = value.cls.__new__(value.cls)
+        _thaw_attrs(mask, value.attrs)
+        return mask
+    return value
+
+
+def _thaw_attrs(mask: "Mask", attrs: MaskState) -> None:
+    for name, value in attrs:
+        setattr(mask, name, list(map(list, value)) if name == "_mask" else _thaw(value))
+
+
+class MaskCache:
+    """Bounded LRU cache of generated masks shared by every mask in the process.
+
+    Entries are keyed by the mask class, its parameters (including the `method`),
+    and the puzzle size, so repeatedly generating the same shape (e.g. across
+    a batch of puzzles, or when masks are reapplied after a resize) only pays
+    the geometry cost once. Set `maxsize` to 0 to disable caching."""
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialize a mask cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of generated masks to keep.
+                The least recently used mask is evicted first. Defaults to 256.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, MaskState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> MaskState | None:
+        """Frozen mask state stored under `key` (or None)."""
+        with self._lock:
+            state = self._entries.get(key)
+            if state is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return state
+
+    def put(self, key: Hashable, state: MaskState) -> None:
+        """Store frozen mask `state` under `key`, evicting the least
+        recently used masks once `maxsize` is exceeded."""
+        with self._lock:
+            self._entries[key] = state
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(self.maxsize, 0):
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached masks and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+MASK_CACHE = MaskCache()
+
+
+def cached_generate(
+    func: Callable[[Any, int], None],
+) -> Callable[[Any, int], None]:
+    """Decorate a mask `generate()` method so the resulting mask is stored
+    in (and restored from) the shared `MASK_CACHE`.
+
+    Only the most derived `generate()` of a mask class is cached, so subclasses
+    that override `generate()` without this decorator are never cached (even
+    when they call `super().generate()`). Masks with `cacheable` set to False,
+    or with attributes that can't be frozen, are always generated."""
+
+    @wraps(func)
+    def wrapper(self: "Mask", puzzle_size: int) -> None:
+        if (
+            not self.cacheable
+            or not MASK_CACHE.maxsize
+            or getattr(type(self), "generate", None) is not wrapper
+        ):
+            return func(self, puzzle_size)
+        try:
+            key = (
+                type(self),
+                puzzle_size,
+                _freeze_attrs(self, ("_mask", "_puzzle_size") + self._generated),
+            )
+            hash(key)
+        except TypeError:
+            return func(self, puzzle_size)
+        state = MASK_CACHE.get(key)
+        if state is not None:
+            _thaw_attrs(self, state)
+            return None
+        func(self, puzzle_size)
+        MASK_CACHE.put(key, _freeze_attrs(self))
+        return None
+
+    return wrapper
+
+
 class Mask:
     """This class represents Mask object that can be applied
     to a WordSearch puzzle."""
@@ -15,6 +194,12 @@ class Mask:
     INACTIVE = "#"
     METHODS = [1, 2, 3]
 
+    # allow generated masks to be stored in the shared `MASK_CACHE`
+    cacheable = True
+    # attributes set by `generate()` (not used as inputs) that
+    # can be ignored when looking up a mask in the `MASK_CACHE`
+    _generated: tuple[str, ...] = ()
+
     def __init__(
         self,
         points: list[tuple[int, int]] | None = None,
@@ -46,6 +231,16 @@ class Mask:
         """Mask as a 2-D array (list[list[str]])."""
         return self._mask
 
+    @property
+    def bits(self) -> int:
+        """Mask packed into the bits of an integer, with bit `y * size + x` set
+        for each active cell (see `utils.pack_bits()`)."""
+        return pack_bits(self._mask, self.ACTIVE)
+
+    def _set_bits(self, bits: int) -> None:
+        """Replace the mask with packed mask `bits` (see `Mask.bits`)."""
+        self._mask = unpack_bits(bits, len(self._mask), self.ACTIVE, self.INACTIVE)
+
     @property
     def method(self) -> int:
         """Mask method."""
@@ -136,6 +331,7 @@ class Mask:
         """
         return [[char] * size for _ in range(size)]
 
+    @cached_generate
     def generate(self, puzzle_size: int) -> None:
         """Generate a new mask at `puzzle_size` and either fill points (`Bitmap`),
         or connect points (`Polygon`) and then fill the resulting polygon shape."""
@@ -234,6 +430,7 @@ class CompoundMask(Mask):
     def add_mask(self, mask: Mask) -> None:
         self.masks.append(mask)
 
+    @cached_generate
     def generate(self, puzzle_size: int) -> None:
         """Generate a new mask at `puzzle_size` and the apply all Mask objects
         from `CompoundMask.masks` in order.
@@ -242,9 +439,11 @@ class CompoundMask(Mask):
         with `self.ACTIVE`. This allows for the proper inaction between masks."""
         self.puzzle_size = puzzle_size
         self._mask = self.build_mask(self.puzzle_size, self.ACTIVE)
+        bits = full_bits(self.puzzle_size)
         for mask in self.masks:
             mask.generate(self.puzzle_size)
-            self._apply_mask(mask)
+            bits = composite_bits(bits, mask.bits, mask.method)
+        self._set_bits(bits)
 
     def _apply_mask(self, mask: Mask) -> None:
         """Apply `Mask` to the compound mask.
@@ -259,22 +458,7 @@ class CompoundMask(Mask):
             raise MaskNotGenerated(
                 "Please use `object.generate()` before calling `object.show()`."
             )
-        for y in range(self.puzzle_size):
-            for x in range(self.puzzle_size):
-                if mask.method == 1:
-                    if (
-                        mask.mask[y][x] == self.ACTIVE
-                        and self.mask[y][x] == self.ACTIVE
-                    ):
-                        self.mask[y][x] = self.ACTIVE
-                    else:
-                        self.mask[y][x] = self.INACTIVE
-                elif mask.method == 2:
-                    if mask.mask[y][x] == self.ACTIVE:
-                        self.mask[y][x] = self.ACTIVE
-                else:
-                    if mask.mask[y][x] == self.ACTIVE:
-                        self.mask[y][x] = self.INACTIVE
+        self._set_bits(composite_bits(self.bits, mask.bits, mask.method))
 
 
 # Import all base masks shapes for easier access
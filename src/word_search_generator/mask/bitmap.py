@@ -1,10 +1,20 @@
+import io
+import os
+from functools import lru_cache
+from itertools import compress
 from pathlib import Path
+from typing import IO, TypeAlias
 
 from PIL import Image, ImageChops
 
 from ..utils import in_bounds
 from . import Mask, MaskNotGenerated
 
+# raster image sources accepted by `BitmapImage`
+ImageSource: TypeAlias = str | Path | bytes | IO[bytes] | Image.Image
+
+IMAGE_FORMATS = ("BMP", "JPEG", "PNG")
+
 
 class ContrastError(Exception):
     pass
@@ -53,8 +63,9 @@ class BitmapImage(Bitmap):
     and generates a mask a mask from a raster image."""
 
     threshold = 200  # normalization contrast point
+    cacheable = False  # the image file can change between calls
 
-    def __init__(self, fp: str | Path, method: int = 1, static: bool = False) -> None:
+    def __init__(self, fp: ImageSource, method: int = 1, static: bool = False) -> None:
         """Generate a bitmap mask from a raster image.
 
         Note: Ideally, the raster image should be a single color (dark) on a solid
@@ -62,9 +73,17 @@ class BitmapImage(Bitmap):
         Multi-color images will work, but know that all colors will be converted
         to grayscale first.
 
+        The image is only decoded and normalized (converted to black-and-white
+        and trimmed) once. Image files are cached by path (and reloaded if they
+        change on disk) and raw image bytes are cached by content. Other sources
+        are cached by the mask, so file-like objects are read once (from their
+        current position) and `PIL.Image` objects should not be changed after
+        the mask is first generated.
+
         Args:
-            fp (str | Path): A filepath (string) or `pathlib.Path` object
-                to the raster image the mask will be generated from.
+            fp (ImageSource): A filepath (string) or `pathlib.Path` object
+                to the raster image the mask will be generated from, the raw
+                image bytes, a binary file-like object, or a `PIL.Image` object.
             method (int, optional): How Mask is applied to the puzzle
                 (1=Standard (Intersection), 2=Additive, 3=Subtractive). Defaults to 1.
             static (bool, optional): Should this mask be reapplied
@@ -72,14 +91,38 @@ class BitmapImage(Bitmap):
         """
         super().__init__(method=method, static=static)
         self.fp = fp
+        self._bitmap: Image.Image | None = None
+
+    @property
+    def bitmap(self) -> Image.Image:
+        """The normalized (black-and-white and trimmed) source image.
+
+        Raises:
+            FileNotFoundError: The image file doesn't exist.
+            PIL.UnidentifiedImageError: The image can't be opened.
+        """
+        if isinstance(self.fp, str | Path):
+            path = Path(self.fp).resolve()
+            stat = os.stat(path)
+            return _open_bitmap(
+                str(path), stat.st_mtime_ns, stat.st_size, BitmapImage.threshold
+            )
+        if self._bitmap is None:
+            if isinstance(self.fp, Image.Image):
+                self._bitmap = BitmapImage.normalize_image(
+                    self.fp, BitmapImage.threshold
+                )
+            else:
+                data = self.fp if isinstance(self.fp, bytes) else self.fp.read()
+                self._bitmap = _decode_bitmap(data, BitmapImage.threshold)
+        return self._bitmap
 
     def generate(self, puzzle_size: int) -> None:
         """Generate a new mask at `puzzle_size` from a raster image."""
         self.puzzle_size = puzzle_size
         self._mask = self.build_mask(self.puzzle_size, self.INACTIVE)
-        img = Image.open(self.fp, formats=("BMP", "JPEG", "PNG"))
-        self.points = BitmapImage.process_image(
-            img, self.puzzle_size, BitmapImage.threshold
+        self.points = BitmapImage.bitmap_points(
+            self.bitmap, self.puzzle_size, BitmapImage.threshold
         )
         if not self.points:
             raise ContrastError("The provided image lacked enough contrast.")
@@ -92,16 +135,48 @@ class BitmapImage(Bitmap):
         """Take a `PIL.Image` object, convert it to black-and-white, trim any
         excess pixels from the edges, resize it, and return all of the black
         pixels as a (x, y) coordinates."""
+        return BitmapImage.bitmap_points(
+            BitmapImage.normalize_image(image, BitmapImage.threshold), size, threshold
+        )
+
+    @staticmethod
+    def normalize_image(image: Image.Image, threshold: int = 200) -> Image.Image:
+        """Convert a `PIL.Image` object to black-and-white (pixels lighter than
+        `threshold` become white) and trim any excess pixels from the edges."""
         image = image.convert("L").point(
-            lambda px: 255 if px > BitmapImage.threshold else 0, mode="1"
+            [255 if px > threshold else 0 for px in range(256)], mode="1"
         )
         diff = ImageChops.difference(image, Image.new("L", image.size, (255)))
         bbox = diff.getbbox()
-        image = image.crop(bbox)
-        image.thumbnail((size, size), resample=0)
+        return image.crop(bbox)
+
+    @staticmethod
+    def bitmap_points(
+        bitmap: Image.Image, size: int, threshold: int = 200
+    ) -> list[tuple[int, int]]:
+        """Resize a normalized bitmap (see `BitmapImage.normalize_image()`)
+        to fit within `size` and return all of the black pixels as
+        (x, y) coordinates. `bitmap` is left unchanged."""
+        image = bitmap.copy()
+        image.thumbnail((size, size), resample=Image.Resampling.NEAREST)
         w, _ = image.size
-        return [
-            (0 if i == 0 else i % w, i // w)
-            for i, px in enumerate(image.getdata())
-            if px <= threshold
-        ]
+        data = image.convert("L").tobytes()
+        black = data.translate(bytes(px <= threshold for px in range(256)))
+        return [(i % w, i // w) for i in compress(range(len(data)), black)]
+
+
+@lru_cache(maxsize=32)
+def _open_bitmap(
+    path: str, mtime_ns: int, file_size: int, threshold: int
+) -> Image.Image:
+    """Normalized bitmap of an image file. The modification time
+    and size are only used to invalidate the cached bitmap."""
+    with Image.open(path, formats=IMAGE_FORMATS) as image:
+        return BitmapImage.normalize_image(image, threshold)
+
+
+@lru_cache(maxsize=32)
+def _decode_bitmap(data: bytes, threshold: int) -> Image.Image:
+    """Normalized bitmap of raw image bytes."""
+    with Image.open(io.BytesIO(data), formats=IMAGE_FORMATS) as image:
+        return BitmapImage.normalize_image(image, threshold)
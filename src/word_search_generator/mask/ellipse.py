@@ -1,6 +1,7 @@
 import math
 
 from ..utils import distance, float_range
+from . import MaskNotGenerated, cached_generate
 from .bitmap import Bitmap
 
 
@@ -8,6 +9,9 @@ class Ellipse(Bitmap):
     """This class represents a subclass of the Bitmap object
     and generates an Ellipse masks."""
 
+    _generated = ("_points", "spans")
+    _points: list[tuple[int, int]] | None
+
     def __init__(
         self,
         width: int | None = None,
@@ -34,12 +38,28 @@ class Ellipse(Bitmap):
         self.width = width
         self.height = height
         self.center = center
+        self.spans: list[tuple[int, int, int]] = []
+
+    @property
+    def points(self) -> list[tuple[int, int]]:
+        """All coordinates within the ellipse (calculated from
+        `Ellipse.spans` when first needed after generation)."""
+        if self._points is None:
+            self._points = [
+                (x, y) for y, start, end in self.spans for x in range(start, end + 1)
+            ]
+        return self._points
 
+    @points.setter
+    def points(self, value: list[tuple[int, int]]) -> None:
+        self._points = value
+
+    @cached_generate
     def generate(self, puzzle_size: int) -> None:
         """Generate a new mask at `puzzle_size`."""
         self.puzzle_size = puzzle_size
         self._mask = self.build_mask(self.puzzle_size, self.INACTIVE)
-        self.points = Ellipse.calculate_ellipse_points(
+        self.spans = Ellipse.calculate_ellipse_spans(
             self.width if self.width else self.puzzle_size,
             self.height if self.height else self.puzzle_size,
             (
@@ -49,8 +69,28 @@ class Ellipse(Bitmap):
             ),
             puzzle_size,
         )
+        self._points = None
         self._draw()
 
+    def _draw(self) -> None:
+        """Set each cell of every row span in `Ellipse.spans` as `ACTIVE`
+        in `Ellipse._mask` (or each point when they have been changed).
+
+        Raises:
+            MaskNotGenerated: Mask has not yet been generated.
+        """
+        if self._points is not None:
+            return super()._draw()
+        if not self.puzzle_size:
+            raise MaskNotGenerated(
+                "No puzzle size specified. Please use the `.generate()` method."
+            )
+        for y, start, end in self.spans:
+            start, end = max(start, 0), min(end, self.puzzle_size - 1)
+            if 0 <= y < self.puzzle_size and start <= end:
+                self._mask[y][start : end + 1] = [self.ACTIVE] * (end - start + 1)
+        return None
+
     @staticmethod
     def calculate_ellipse_points(
         width: int,
@@ -59,6 +99,27 @@ class Ellipse(Bitmap):
         puzzle_size: int,
     ) -> list[tuple[int, int]]:
         """Calculate all coordinates within an ellipse."""
+        return [
+            (x, y)
+            for y, start, end in Ellipse.calculate_ellipse_spans(
+                width, height, origin, puzzle_size
+            )
+            for x in range(start, end + 1)
+        ]
+
+    @staticmethod
+    def calculate_ellipse_spans(
+        width: int,
+        height: int,
+        origin: tuple[int, int],
+        puzzle_size: int,
+    ) -> list[tuple[int, int, int]]:
+        """Calculate the inclusive span of coordinates within an ellipse for
+        each row as (y, start x, end x). Spans may lie outside of the puzzle.
+
+        Each row span is solved directly from the ellipse equation and then
+        checked against `Ellipse.within_radius()` at the edges, so the result
+        matches testing every candidate point individually."""
         width_r = width / 2
         height_r = height / 2
         ratio = width_r / height_r
@@ -80,19 +141,36 @@ class Ellipse(Bitmap):
             y_offset = origin[1] - 1
         else:
             y_offset = origin[1]
-        # check all points and see if they fit inside of the ellipse
-        points = []
+        # candidate x values are symmetric around 0 (and either all
+        # whole numbers or all halves), so only the edge needs finding
         minY = -max_pointsY / 2 + 1
         maxY = max_pointsY / 2 - 1
         minX = -max_pointsX / 2 + 1
         maxX = max_pointsX / 2 - 1
+        innerX = minX % 1  # smallest non-negative candidate x
+        spans: list[tuple[int, int, int]] = []
         for y in float_range(minY, maxY + 1):
-            for x in float_range(minX, maxX + 1):
-                if Ellipse.within_radius(x, y, width_r, ratio):
-                    points.append((int(x + x_offset), int(y + y_offset)))
-        return points
+            reach = width_r**2 - (y * ratio) ** 2
+            edge = minX + math.floor(math.sqrt(reach) - minX) if reach > 0 else innerX
+            edge = min(max(edge, innerX), maxX)
+            while edge >= innerX and not Ellipse.within_radius(edge, y, width_r, ratio):
+                edge -= 1
+            while edge + 1 <= maxX and Ellipse.within_radius(
+                edge + 1, y, width_r, ratio
+            ):
+                edge += 1
+            if edge < innerX:
+                continue
+            row = int(y + y_offset)
+            start, end = int(-edge + x_offset), int(edge + x_offset)
+            # rows can repeat where `int()` truncates toward 0 from either side
+            if spans and spans[-1][0] == row:
+                _, prev_start, prev_end = spans.pop()
+                start, end = min(start, prev_start), max(end, prev_end)
+            spans.append((row, start, end))
+        return spans
 
     @staticmethod
-    def within_radius(x: int, y: int, radius: float, ratio: float) -> bool:
+    def within_radius(x: float, y: float, radius: float, ratio: float) -> bool:
         """Check if a coordinate is within a given radius."""
         return distance(x, y, ratio) <= radius
@@ -1,7 +1,7 @@
 import math
 
 from ..utils import in_bounds, round_half_up
-from . import Mask, MaskNotGenerated
+from . import Mask, MaskNotGenerated, cached_generate
 
 
 class Polygon(Mask):
@@ -52,6 +52,7 @@ class Polygon(Mask):
         right_side = [self.points[0]] + list(reversed(self.points))[:right_offset]
         return left_side, right_side
 
+    @cached_generate
     def generate(self, puzzle_size: int) -> None:
         """Generate a new mask at `puzzle_size`."""
         self.puzzle_size = puzzle_size
@@ -119,34 +120,55 @@ class Polygon(Mask):
                 self.mask[y][x] = c
 
     def _fill_shape(self, c: str) -> None:
-        """Fill the interior of a polygon using the single character string `c`."""
-
-        def ray_casting(point, polygon):
-            """Ray Casting algorithm used to determine if a
-            coordinate is within a polygon."""
-            x, y = point
-            ct = 0
-            for i in range(len(polygon) - 1):
-                x1, y1 = polygon[i]
-                x2, y2 = polygon[i + 1]
-                if (y < y1) != (y < y2) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
-                    ct += 1
-            return ct % 2 == 1
+        """Fill the interior of a polygon using the single character string `c`.
 
+        Uses a scanline fill with an active edge table. Each row only checks
+        the edges that cross it, and the cells between every other pair of
+        crossings are filled (the same even-odd rule as ray casting)."""
         if not self.puzzle_size or not self.bounding_box:
             raise MaskNotGenerated(
                 "No puzzle size specified. Please use the `generate()` method."
             )
 
-        # check all points within the polygon bounding box
+        # only fill rows/columns within the polygon bounding box
         bbox = self.bounding_box
         min_x, min_y = bbox[0]
         max_x, max_y = bbox[1]
+        min_x, min_y = max(min_x, 0), max(min_y, 0)
+        max_x = min(max_x, self.puzzle_size - 1)
+        max_y = min(max_y, self.puzzle_size - 1)
+
+        # bucket each (non-horizontal) edge by the first row it crosses
+        edge_table: dict[int, list[tuple[int, int, int, int, int]]] = {}
+        for i in range(len(self.points)):
+            x1, y1 = self.points[i]
+            x2, y2 = self.points[(i + 1) % len(self.points)]
+            if y1 == y2:
+                continue
+            # edges cross rows `y` where `(y < y1) != (y < y2)`
+            start, end = min(y1, y2), max(y1, y2)
+            edge_table.setdefault(max(start, min_y), []).append((end, x1, y1, x2, y2))
+
+        active: list[tuple[int, int, int, int, int]] = []
         for y in range(min_y, max_y + 1):
-            for x in range(min_x, max_x + 1):
-                in_polygon = ray_casting((x, y), self.points + [self.points[0]])
-                if in_polygon and in_bounds(x, y, self.puzzle_size, self.puzzle_size):
-                    self.mask[y][x] = c
+            active = [edge for edge in active if edge[0] > y]
+            active.extend(e for e in edge_table.pop(y, []) if e[0] > y)
+            crossings = sorted(
+                (x2 - x1) * (y - y1) / (y2 - y1) + x1 for _, x1, y1, x2, y2 in active
+            )
+            # a cell is inside when an odd number of crossings lie to its right
+            row = self.mask[y]
+            for i in range(len(crossings) + 1):
+                if (len(crossings) - i) % 2 == 0:
+                    continue
+                start_x = min_x if i == 0 else max(min_x, math.ceil(crossings[i - 1]))
+                end_x = (
+                    max_x
+                    if i == len(crossings)
+                    else min(max_x, math.ceil(crossings[i]) - 1)
+                )
+                for x in range(start_x, end_x + 1):
+                    row[x] = c
 
 
 class Rectangle(Polygon):
@@ -187,6 +209,8 @@ class Rectangle(Polygon):
 class RegularPolygon(Polygon):
     """This subclass of `Polygon` represents a RegularPolygon mask object."""
 
+    _generated = ("points",)
+
     def __init__(
         self,
         vertices: int = 3,
@@ -227,6 +251,7 @@ class RegularPolygon(Polygon):
         self.center = center
         self.angle = angle
 
+    @cached_generate
     def generate(self, puzzle_size: int) -> None:
         self.puzzle_size = puzzle_size
         self._mask = self.build_mask(self.puzzle_size, self.INACTIVE)
@@ -284,6 +309,8 @@ class RegularPolygon(Polygon):
 class Star(Polygon):
     """This subclass of `Polygon` represents a Star mask object."""
 
+    _generated = ("points",)
+
     def __init__(
         self,
         outer_vertices: int = 5,
@@ -326,6 +353,7 @@ class Star(Polygon):
         self.center = center
         self.angle = angle
 
+    @cached_generate
     def generate(self, puzzle_size: int) -> None:
         self.puzzle_size = puzzle_size
         self._mask = self.build_mask(self.puzzle_size, self.INACTIVE)
@@ -2,7 +2,7 @@ import inspect
 import math
 import sys
 
-from . import Bitmap, CompoundMask
+from . import Bitmap, CompoundMask, cached_generate
 from .ellipse import Ellipse
 from .polygon import Polygon, Rectangle, RegularPolygon, Star
 
@@ -22,11 +22,13 @@ class Circle(Ellipse):
 
 
 class Club(CompoundMask):
+    _generated = ("masks",)
     min_size = 18
 
     def __init__(self) -> None:
         super().__init__()
 
+    @cached_generate
     def generate(self, puzzle_size: int) -> None:
         if puzzle_size < self.min_size:
             raise ValueError(
@@ -87,9 +89,12 @@ class Diamond(RegularPolygon):
 
 
 class Donut(CompoundMask):
+    _generated = ("masks",)
+
     def __init__(self) -> None:
         super().__init__()
 
+    @cached_generate
     def generate(self, puzzle_size: int) -> None:
         self.puzzle_size = puzzle_size
         self._mask = self.build_mask(puzzle_size, self.ACTIVE)
@@ -112,11 +117,13 @@ class Donut(CompoundMask):
 
 
 class Fish(CompoundMask):
+    _generated = ("masks",)
     min_size = 18
 
     def __init__(self) -> None:
         super().__init__()
 
+    @cached_generate
     def generate(self, puzzle_size: int) -> None:
         if puzzle_size < self.min_size:
             raise ValueError(
@@ -162,11 +169,13 @@ for a {self.__class__.__name__} mask."
 
 
 class Flower(CompoundMask):
+    _generated = ("masks",)
     min_size = 9
 
     def __init__(self) -> None:
         super().__init__()
 
+    @cached_generate
     def generate(self, puzzle_size: int) -> None:
         if puzzle_size < self.min_size:
             raise ValueError(
@@ -196,11 +205,13 @@ for a {self.__class__.__name__} mask."
 
 
 class Heart(CompoundMask):
+    _generated = ("masks",)
     min_size = 8
 
     def __init__(self) -> None:
         super().__init__()
 
+    @cached_generate
     def generate(self, puzzle_size: int) -> None:
         if puzzle_size < self.min_size:
             raise ValueError(
@@ -284,11 +295,13 @@ class Pentagon(RegularPolygon):
 
 
 class Spade(CompoundMask):
+    _generated = ("masks",)
     min_size = 18
 
     def __init__(self) -> None:
         super().__init__()
 
+    @cached_generate
     def generate(self, puzzle_size: int) -> None:
         if puzzle_size < self.min_size:
             raise ValueError(
@@ -380,9 +393,12 @@ class Star8(Star):
 
 
 class Tree(CompoundMask):
+    _generated = ("masks",)
+
     def __init__(self) -> None:
         super().__init__()
 
+    @cached_generate
     def generate(self, puzzle_size: int) -> None:
         self.puzzle_size = puzzle_size
         self._mask = self.build_mask(puzzle_size, self.ACTIVE)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import functools
 import math
 import random
+import re
 from typing import TYPE_CHECKING, TypeAlias
 
 from .words import WORD_LIST
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+    from io import TextIOBase
+
     from .core.game import DirectionSet, Key, Puzzle, WordSet
 
 
@@ -40,7 +45,7 @@ def float_range(
         count += 1
 
 
-def distance(x: int, y: int, ratio: float) -> float:
+def distance(x: float, y: float, ratio: float) -> float:
     """Calculate the distance between two coordinates on a grid."""
     return math.sqrt(math.pow(y * ratio, 2) + math.pow(x, 2))
 
@@ -82,6 +87,130 @@ def find_bounding_box(
     return ((min_x, min_y), (max_x, max_y))
 
 
+# stand-in for an empty puzzle cell in a packed grid
+PACKED_EMPTY = "\0"
+
+
+def pack_grid(grid: Puzzle) -> str:
+    """Pack a square grid of single characters into one row-major string.
+    Empty cells are stored as `PACKED_EMPTY`."""
+    return "".join(c if c else PACKED_EMPTY for row in grid for c in row)
+
+
+def unpack_grid(packed: str, size: int) -> Puzzle:
+    """Unpack a string created with `pack_grid()` back into a nested list."""
+    return [
+        [c if c != PACKED_EMPTY else "" for c in packed[i : i + size]]
+        for i in range(0, len(packed), size)
+    ]
+
+
+def pack_chars(chars: str, alphabet: str) -> bytes:
+    """Pack a string (e.g. a grid packed with `pack_grid()`) into bytes using
+    the fewest bits per character. Each character is stored as its 1-based
+    index in `alphabet`, with 0 for `PACKED_EMPTY`."""
+    width = len(alphabet).bit_length() or 1
+    codes = {c: f"{i:0{width}b}" for i, c in enumerate(alphabet, 1)}
+    codes[PACKED_EMPTY] = "0" * width
+    bits = "".join(codes[c] for c in reversed(chars))
+    return int(bits or "0", 2).to_bytes((len(chars) * width + 7) // 8, "little")
+
+
+def unpack_chars(data: bytes, count: int, alphabet: str) -> str:
+    """Unpack `count` characters packed with `pack_chars()`."""
+    width = len(alphabet).bit_length() or 1
+    codes = {f"{i:0{width}b}": c for i, c in enumerate(PACKED_EMPTY + alphabet)}
+    total = count * width
+    bits = f"{int.from_bytes(data, 'little'):0{total}b}"
+    return "".join(
+        codes[bits[i - width : i]] for i in range(len(bits), len(bits) - total, -width)
+    )
+
+
+def pack_bits(grid: list[list[str]], char: str) -> int:
+    """Pack a square grid into an integer where bit `y * size + x`
+    is set for every cell (x, y) matching `char`."""
+    size = len(grid)
+    bits = 0
+    for y, row in enumerate(grid):
+        row_bits = "".join("1" if c == char else "0" for c in reversed(row))
+        if row_bits:
+            bits |= int(row_bits, 2) << (y * size)
+    return bits
+
+
+def unpack_bits(bits: int, size: int, on: str, off: str) -> list[list[str]]:
+    """Unpack an integer created with `pack_bits()` into a nested list
+    using `on` for set bits and `off` for everything else."""
+    return [
+        [on if c == "1" else off for c in reversed(f"{row:0{size}b}")]
+        for row in split_bits(bits, size)
+    ]
+
+
+def split_bits(bits: int, size: int) -> list[int]:
+    """Split packed grid bits into a list of rows (bit x == column x)."""
+    row_mask = (1 << size) - 1
+    return [(bits >> (y * size)) & row_mask for y in range(size)]
+
+
+def join_bits(rows: list[int], size: int) -> int:
+    """Join a list of rows back into packed grid bits."""
+    bits = 0
+    for y, row in enumerate(rows):
+        bits |= row << (y * size)
+    return bits
+
+
+def full_bits(size: int) -> int:
+    """Packed grid bits with every cell set."""
+    return (1 << (size * size)) - 1
+
+
+def composite_bits(bits: int, mask_bits: int, method: int) -> int:
+    """Combine packed mask `bits` with packed `mask_bits` using a mask `method`
+    (1=Standard (Intersection), 2=Additive, 3=Subtractive)."""
+    if method == 1:
+        return bits & mask_bits
+    if method == 2:
+        return bits | mask_bits
+    return bits & ~mask_bits
+
+
+def flip_bits_horizontal(bits: int, size: int) -> int:
+    """Flip packed grid bits along the vertical axis (left to right)."""
+    return join_bits(
+        [int(f"{row:0{size}b}"[::-1], 2) for row in split_bits(bits, size)], size
+    )
+
+
+def flip_bits_vertical(bits: int, size: int) -> int:
+    """Flip packed grid bits along the horizontal axis (top to bottom)."""
+    return join_bits(split_bits(bits, size)[::-1], size)
+
+
+def transpose_bits(bits: int, size: int) -> int:
+    """Interchange each row with the corresponding column of packed grid bits."""
+    rows = [f"{row:0{size}b}"[::-1] for row in split_bits(bits, size)]
+    return join_bits(
+        [int("".join(col)[::-1], 2) for col in zip(*rows, strict=True)], size
+    )
+
+
+def bits_bounding_box(bits: int, size: int) -> BoundingBox:
+    """Same as `find_bounding_box()` but for packed grid bits."""
+    rows = split_bits(bits, size)
+    filled = [y for y, row in enumerate(rows) if row]
+    if not filled:
+        return ((0, 0), (size, size))
+    cols = 0
+    for row in rows:
+        cols |= row
+    min_x = (cols & -cols).bit_length() - 1
+    max_x = cols.bit_length() - 1
+    return ((min_x, filled[0]), (max_x, filled[-1]))
+
+
 def stringify(puzzle: Puzzle, bbox: BoundingBox) -> str:
     """Convert puzzle array of nested lists into a string."""
     min_x, min_y = bbox[0]
@@ -148,8 +277,157 @@ def get_answer_key_str(words: WordSet, bbox: BoundingBox) -> str:
     return ", ".join(get_answer_key_list(words, bbox))
 
 
-def get_random_words(n: int, max_length: int | None = None) -> list[str]:
-    """Return a list of random dictionary words."""
-    if max_length:
-        return random.sample([word for word in WORD_LIST if len(word) <= max_length], n)
-    return random.sample(WORD_LIST, n)
+WORD_PATTERN = re.compile(r"[^ ,\n]+")
+"""Words are separated by any mix of spaces, commas, and new lines."""
+
+
+def iter_words(source: str | TextIOBase, chunk_size: int = 65536) -> Iterator[str]:
+    """Lazily split `source` into words. Text streams are read `chunk_size`
+    characters at a time so reading stops as soon as the iterator does."""
+    if isinstance(source, str):
+        for match in WORD_PATTERN.finditer(source):
+            yield match.group()
+        return
+    partial = ""  # word possibly cut off at the end of the last chunk
+    while chunk := source.read(chunk_size):
+        words = WORD_PATTERN.findall(partial + chunk)
+        partial = words.pop() if words and WORD_PATTERN.fullmatch(chunk[-1]) else ""
+        yield from words
+    if partial:
+        yield partial
+
+
+def read_words(source: str | TextIOBase, limit: int | None = None) -> list[str]:
+    """Unique words (uppercased and stripped) from `source` in the order they
+    first appear. Reading stops once `limit` words are found."""
+    words: dict[str, None] = {}
+    for word in iter_words(source):
+        word = word.upper().strip()
+        if word:
+            words[word] = None
+            if len(words) == limit:
+                break
+    return list(words)
+
+
+class WordIndex:
+    """Words sorted by length so random words within a length range can be picked
+    without rescanning the list. Subsets of words starting with a letter or only
+    using a set of letters are built when first needed and cached."""
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words: list[str] = sorted(set(words), key=lambda word: (len(word), word))
+        self._upper = [word.upper() for word in self.words]
+        # `_starts[length]` is the index of the first word at least `length` long
+        longest = len(self.words[-1]) if self.words else 0
+        self._starts = [len(self.words)] * (longest + 2)
+        for i in range(len(self.words) - 1, -1, -1):
+            self._starts[len(self.words[i])] = i
+        for length in range(longest, -1, -1):
+            self._starts[length] = min(self._starts[length], self._starts[length + 1])
+        self._subsets: dict[tuple[str, frozenset[str]], WordIndex] = {}
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def _bounds(
+        self, min_length: int | None = None, max_length: int | None = None
+    ) -> tuple[int, int]:
+        """Start and stop index of the words within the length range."""
+        last = len(self._starts) - 1
+        start = self._starts[min(max(min_length or 0, 0), last)]
+        stop = (
+            len(self.words)
+            if max_length is None
+            else self._starts[min(max(max_length + 1, 0), last)]
+        )
+        return start, max(start, stop)
+
+    def count(
+        self, min_length: int | None = None, max_length: int | None = None
+    ) -> int:
+        """Number of words within the length range."""
+        start, stop = self._bounds(min_length, max_length)
+        return stop - start
+
+    def subset(self, first_letter: str = "", letters: str = "") -> WordIndex:
+        """Index of the words starting with `first_letter` and/or only made up of
+        `letters` (case-insensitive). Subsets are cached."""
+        key = (first_letter.upper(), frozenset(letters.upper()))
+        if key not in self._subsets:
+            self._subsets[key] = WordIndex(
+                word
+                for word, upper in zip(self.words, self._upper, strict=True)
+                if upper.startswith(key[0]) and (not key[1] or key[1].issuperset(upper))
+            )
+        return self._subsets[key]
+
+    def sample(
+        self,
+        n: int,
+        min_length: int | None = None,
+        max_length: int | None = None,
+        exclude: Iterable[str] = (),
+        rng: random.Random | None = None,
+    ) -> list[str]:
+        """Pick `n` unique random words within a length range.
+
+        Random indexes are drawn straight from the length range (rejecting
+        excluded and repeated words), so each pick takes constant time unless
+        more than half of the range is needed or excluded, in which case the
+        range is filtered instead.
+
+        Args:
+            n: Number of words to pick.
+            min_length: Minimum word length. Defaults to None.
+            max_length: Maximum word length. Defaults to None.
+            exclude: Words not to pick (case-insensitive). Defaults to ().
+            rng: Random number generator to use. Defaults to the global
+                `random` functions.
+
+        Raises:
+            ValueError: Not enough words to pick from.
+
+        Returns:
+            The picked words.
+        """
+        rand = rng if rng is not None else random
+        start, stop = self._bounds(min_length, max_length)
+        excluded = {word.upper() for word in exclude}
+        if not 0 <= n <= stop - start:
+            raise ValueError("Sample larger than population or is negative")
+        if 2 * (n + len(excluded)) <= stop - start:
+            # at least half of the range can be picked so few picks are rejected
+            picked: dict[int, None] = {}
+            while len(picked) < n:
+                i = rand.randrange(start, stop)
+                if i not in picked and self._upper[i] not in excluded:
+                    picked[i] = None
+            return [self.words[i] for i in picked]
+        candidates = [i for i in range(start, stop) if self._upper[i] not in excluded]
+        if n > len(candidates):
+            raise ValueError("Sample larger than population or is negative")
+        return [self.words[i] for i in rand.sample(candidates, n)]
+
+
+@functools.cache
+def get_word_index() -> WordIndex:
+    """Index of the built-in `WORD_LIST` (built on first use)."""
+    return WordIndex(WORD_LIST)
+
+
+def get_random_words(
+    n: int,
+    max_length: int | None = None,
+    min_length: int | None = None,
+    exclude: Iterable[str] = (),
+    rng: random.Random | None = None,
+) -> list[str]:
+    """Return a list of random dictionary words (see `WordIndex.sample()`)."""
+    return get_word_index().sample(
+        n,
+        min_length=min_length,
+        max_length=max_length or None,
+        exclude=exclude,
+        rng=rng,
+    )
@@ -1,4 +1,6 @@
 __all__ = [
+    "generate_many",
+    "PuzzleSpec",
     "WordSearchFormatter",
     "WordSearchGenerator",
     "WordSearch",
@@ -6,4 +8,5 @@ __all__ = [
 
 from ._formatter import WordSearchFormatter
 from ._generator import WordSearchGenerator
+from .batch import PuzzleSpec, generate_many
 from .word_search import WordSearch
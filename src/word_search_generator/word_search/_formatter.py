@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import copy
 import csv
+import io
 import json
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any, overload
 
 from fpdf import FPDF, drawing
+from fpdf.util import escape_parens
 from rich import box
 from rich.style import Style
 from rich.table import Table
@@ -14,10 +16,13 @@ from rich.text import Text
 
 from .. import utils
 from ..console import console
+from ..core.directions import Direction
 from ..core.formatter import Formatter
-from ..core.game import Game
+from ..core.game import EmptyPuzzleError, Game
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
     from ..core import GameType
     from ..core.game import Puzzle
     from ..core.word import Word
@@ -118,12 +123,12 @@ class WordSearchFormatter(Formatter):
     def save(
         self,
         game: GameType,
-        path: str | Path,
+        path: str | Path | IO[Any],
         format: str = "PDF",
         solution: bool = False,
         lowercase: bool = False,
         hide_key: bool = False,
-    ) -> Path:
+    ) -> Path | None:
         if format.upper() not in ["CSV", "JSON", "PDF"]:
             raise ValueError('Save file format must be either "CSV", "JSON", or "PDF".')
         # convert strings to PATH object
@@ -148,15 +153,48 @@ class WordSearchFormatter(Formatter):
         # return saved file path
         return saved_file
 
+    def render(
+        self,
+        game: GameType,
+        format: str = "PDF",
+        solution: bool = False,
+        lowercase: bool = False,
+        hide_key: bool = False,
+    ) -> str | bytes:
+        """Render the puzzle in memory without saving it.
+
+        Args:
+            game: Parent puzzle.
+            format: Type of output ("CSV", "JSON", "PDF"). Defaults to "PDF".
+            solution: Include the solution. Defaults to False.
+            lowercase: Change letters to lower case. Defaults to False.
+            hide_key: Hide the PDF answer key. Defaults to False.
+
+        Returns:
+            The CSV or JSON text, or the PDF document bytes.
+        """
+        if format.upper() == "CSV":
+            return self.render_csv(game, solution, lowercase)  # type: ignore
+        if format.upper() == "JSON":
+            return self.render_json(game, solution, lowercase)  # type: ignore
+        if format.upper() == "PDF":
+            return self.render_pdf(game, solution, lowercase, hide_key)
+        raise ValueError('Render format must be either "CSV", "JSON", or "PDF".')
+
     def write_csv_file(
         self,
-        path: Path,
+        path: Path | IO[Any],
         game: WordSearch,
         solution: bool = False,
         lowercase: bool = False,
         *args,
         **kwargs,
-    ) -> Path:
+    ) -> Path | None:
+        return self._write_output(self.render_csv(game, solution, lowercase), path)
+
+    def render_csv(
+        self, game: WordSearch, solution: bool = False, lowercase: bool = False
+    ) -> str:
         word_list = utils.get_word_list_list(game.key)
         puzzle = self.hide_filler_characters(game) if solution else game.cropped_puzzle
         LEVEL_DIRS_str = utils.get_LEVEL_DIRS_str(game.level)
@@ -179,7 +217,7 @@ class WordSearchFormatter(Formatter):
         if not word_list:
             word_list = ["<ALL SECRET WORDS>"]
 
-        with open(path, "x", newline="", encoding="utf-8") as f:
+        with io.StringIO(newline="") as f:
             f_writer = csv.writer(
                 f, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL
             )
@@ -193,17 +231,22 @@ class WordSearchFormatter(Formatter):
             f_writer.writerow([""])
             f_writer.writerow([f"{key_intro}: "])
             f_writer.writerow(answer_key_list)
-        return path.absolute()
+            return f.getvalue()
 
     def write_json_file(
         self,
-        path: Path,
+        path: Path | IO[Any],
         game: WordSearch,
         solution: bool = False,
         lowercase: bool = False,
         *args,
         **kwargs,
-    ) -> Path:
+    ) -> Path | None:
+        return self._write_output(self.render_json(game, solution, lowercase), path)
+
+    def render_json(
+        self, game: WordSearch, solution: bool = False, lowercase: bool = False
+    ) -> str:
         word_list = utils.get_word_list_list(game.key)
         puzzle = self.hide_filler_characters(game) if solution else game.cropped_puzzle
 
@@ -212,7 +255,7 @@ class WordSearchFormatter(Formatter):
             word_list = [word.lower() for word in word_list]
             puzzle = [[c.lower() for c in line] for line in puzzle]
 
-        data = json.dumps(
+        return json.dumps(
             {
                 "puzzle": puzzle,
                 "words": [
@@ -223,231 +266,433 @@ class WordSearchFormatter(Formatter):
                     word.text.lower() if lowercase else word.text: word.key_info_json
                     for word in game.placed_words
                 },
+                "size": game.size,
+                "bounding_box": game.bounding_box,
+                "level": [d.name for d in Direction if d in game.directions],
+                "secret_level": [
+                    d.name for d in Direction if d in game.secret_directions
+                ],
             }
         )
-        with open(path, "x") as f:
-            f.write(data)
-        return path.absolute()
 
     def write_pdf_file(
         self,
-        path: Path,
+        path: Path | IO[Any],
         game: GameType,
         solution: bool = False,
         lowercase: bool = False,
         hide_key: bool = False,
-    ) -> Path:
-        def draw_puzzle_page(
-            pdf: FPDF, game: GameType, solution: bool = False, hide_key: bool = False
-        ) -> FPDF:
-            """Draw the puzzle information on a FPDF PDF page.
-
-            Args:
-                pdf: FPDF PDF document.
-                game: Current Word Search puzzle.
-                solution: Highlight the puzzle solution.. Defaults to False.
-
-            Returns:
-                FPDF PDF with drawn puzzle page.
-            """
-
-            # add a new page and setup the margins
-            pdf.add_page()
-            pdf.set_margin(0.5)
-
-            # insert the title
-            title = "WORD SEARCH" if not solution else "WORD SEARCH (SOLUTION)"
-            pdf.set_font("Helvetica", "B", self.PDF_FONT_SIZE_XXL)
-            pdf.cell(pdf.epw, 0.25, title, new_y="NEXT", align="C", center=True)
-            pdf.ln(0.125)
-
-            # calculate the puzzle size and letter font size
-            pdf.set_left_margin(0.75)
-            gsize = self.PDF_PUZZLE_WIDTH / game.cropped_size[0]
-            gmargin = 0.6875 if gsize > 36 else 0.75
-            font_size = int(72 * gsize * gmargin)
-            # calculate flexible font size based on word count
-            # to ensure all words and the puzzle key fit on one page
-            info_font_size = self.PDF_FONT_SIZE_XL - (
-                len(game.words) - Game.MIN_PUZZLE_WORDS
-            ) * (6 / (Game.MAX_PUZZLE_WORDS - Game.MIN_PUZZLE_WORDS))
-            pdf.set_font_size(font_size)
-
-            # get start position of puzzle
-            start_x = pdf.get_x()
-            start_y = pdf.get_y()
-
-            # draw the puzzle
-            for row in game.cropped_puzzle:
-                for char in row:
-                    pdf.cell(
-                        gsize,
-                        gsize,
-                        char.lower() if lowercase else char,
-                        align="C",
-                    )
-                pdf.ln(gsize)
-            pdf.ln(0.25)
-
-            # draw solution highlights
-            if solution:
-                for word in game.placed_words:
-                    word_start, *_, word_end = word.offset_coordinates(
-                        game.bounding_box
-                    )
-                    word_start_x, word_start_y = word_start
-                    word_end_x, word_end_y = word_end
-
-                    # mypy check for word position
-                    if (
-                        not word_start_x
-                        or not word_start_y
-                        or not word_end_x
-                        or not word_end_y
-                    ):
-                        continue  # pragma: no cover
-
-                    with pdf.new_path() as path:
-                        path.style.fill_color = None
-                        path.style.stroke_color = drawing.DeviceRGB(*word.color, 0.5)
-                        path.style.stroke_join_style = "round"
-                        path.style.stroke_width = pdf.font_size * 0.875
-                        path.move_to(
-                            start_x + ((word_start_x - 1) * gsize) + (gsize / 2),
-                            start_y + ((word_start_y - 1) * gsize) + (gsize / 2),
-                        )
-                        path.line_to(
-                            start_x + ((word_end_x - 1) * gsize) + (gsize / 2),
-                            start_y + ((word_end_y - 1) * gsize) + (gsize / 2),
-                        )
+    ) -> Path | None:
+        return self._write_output(
+            self.render_pdf(game, solution, lowercase, hide_key), path
+        )
 
-            # collect puzzle information
-            word_list_str = utils.get_word_list_str(game.key)
-            LEVEL_DIRS_str = utils.get_LEVEL_DIRS_str(game.level)
-            key_intro = "Answer Key"
-            if hasattr(game, "placed_secret_words"):
-                key_intro += " (*Secret Words)"
-            answer_key_str = utils.get_answer_key_str(
-                game.placed_words, game.bounding_box
-            )
+    def render_pdf(
+        self,
+        game: GameType,
+        solution: bool = False,
+        lowercase: bool = False,
+        hide_key: bool = False,
+    ) -> bytes:
+        pdf = self.new_pdf()
 
-            # if lower case requested, change for letters for puzzle, words, and key
-            if lowercase:
-                for word in game.placed_words:
-                    answer_key_str = answer_key_str.replace(
-                        word.text, word.text.lower()
-                    )
+        # draw initial puzzle page
+        pdf = self.draw_pdf_page(pdf, game, False, lowercase, hide_key)
 
-            # catch case of all secret words
-            if not word_list_str:
-                word_list_str = "<ALL SECRET WORDS>"
-
-            # write word list info
-            pdf.set_font("Helvetica", "BU", size=info_font_size)
-            pdf.cell(
-                pdf.epw,
-                text=f"Find words going {LEVEL_DIRS_str}:",
-                align="C",
-                new_y="NEXT",
-            )
-            pdf.ln(0.125)
-
-            # write word list
-            pdf.set_font("Helvetica", "B", size=info_font_size)
-            pdf.set_font_size(info_font_size)
-            pdf.set_char_spacing(0.5)
-
-            sorted_words = sorted(game.placed_words, key=lambda w: w.text)
-            lines: list[tuple[float, list[Word]]] = []
-            line_width = 0.0
-            line: list[Word] = []
-            for word in sorted_words:
-                if word.secret and not solution:
-                    continue
-                word_cell_width = pdf.get_string_width(word.text) + pdf.c_margin * 4
-                if line_width + word_cell_width > pdf.epw:
-                    lines.append((line_width, line))
-                    line_width = 0.0
-                    line = []
-                line_width += word_cell_width
-                line.append(word)
-            if line:
-                lines.append((line_width, line))
+        # add puzzle solution page if requested
+        if solution:
+            pdf = self.draw_pdf_page(pdf, game, solution, lowercase)
 
-            for line_width, words in lines:
-                line_offset = (pdf.epw - line_width) / 2
-                pdf.set_x(pdf.get_x() + line_offset)
-                for word in words:
-                    if word.secret and not solution:  # pragma: no cover
-                        continue
-                    start_x = pdf.get_x()
-                    start_y = pdf.get_y()
-                    word_cell_width = pdf.get_string_width(word.text) + pdf.c_margin * 4
-                    pdf.cell(
-                        w=word_cell_width,
-                        text=word.text.lower() if lowercase else word.text,
-                        align="C",
-                    )
-                    if solution:
-                        with pdf.new_path() as path:
-                            path.style.fill_color = None
-                            path.style.stroke_color = drawing.DeviceRGB(
-                                *word.color, 0.5
-                            )
-                            path.style.stroke_join_style = "round"
-                            path.style.stroke_width = pdf.font_size * 0.875
-                            path.move_to(
-                                start_x + pdf.c_margin * 2.75,
-                                start_y + (pdf.font_size / 2),
-                            )
-                            path.line_to(
-                                pdf.get_x() - pdf.c_margin * 2.75,
-                                pdf.get_y() + (pdf.font_size / 2),
-                            )
-
-                pdf.ln(pdf.font_size * 1.25)
-
-            if not lines and not solution:
-                pdf.cell(text="<ALL SECRET WORDS>", align="C", center=True)
+        return bytes(pdf.output())
 
-            if not hide_key:
-                # write the puzzle answer key
-                # resetting the margin before rotating makes layout easier to figure
-                pdf.set_margin(0)
-                pdf.set_char_spacing(0)
-                # rotate the page to write answer key upside down
-                with pdf.rotation(angle=180, x=pdf.epw / 2, y=pdf.eph / 2):
-                    pdf.set_xy(pdf.epw - pdf.epw, 0)
-                    pdf.set_margin(0.25)
-                    pdf.set_font("Helvetica", size=self.PDF_FONT_SIZE_S)
-                    pdf.write(text=f"{key_intro}: {answer_key_str}")
-
-            return pdf
-
-        # setup the PDF document
+    def write_pdf_book(
+        self,
+        path: str | Path,
+        games: Iterable[GameType],
+        solution: bool = False,
+        appendix: bool = False,
+        lowercase: bool = False,
+        hide_key: bool = False,
+        puzzles_per_file: int | None = None,
+    ) -> list[Path]:
+        """Save many puzzles into a single PDF "book".
+
+        Games are drawn one at a time as they are pulled from `games` (so they
+        can be generated lazily) into a single document that shares its fonts
+        and page setup across every page. To keep memory bounded for very large
+        books, set `puzzles_per_file` and the book will be split into multiple
+        volumes (e.g. "book-1.pdf", "book-2.pdf"), each written out (and freed)
+        as soon as it is full.
+
+        Example:
+            ```python
+            puzzles = (WordSearch(words, seed=n) for n in range(500))
+            WordSearchFormatter().write_pdf_book("book.pdf", puzzles, solution=True)
+            ```
+
+        Args:
+            path: File save path. When `puzzles_per_file` is set, the volume
+                number is appended to the file name.
+            games: Puzzles to include.
+            solution: Include a solution page for each puzzle. Defaults to False.
+            appendix: Collect the solution pages at the end of the book (or
+                volume) instead of after each puzzle. Defaults to False.
+            lowercase: Change letters to lower case. Defaults to False.
+            hide_key: Don't include the answer key. Defaults to False.
+            puzzles_per_file: Maximum number of puzzles per file. Defaults
+                to None (a single file).
+
+        Raises:
+            EmptyPuzzleError: A puzzle has not been generated or
+                has no placed words.
+            ValueError: Invalid `puzzles_per_file` or no puzzles were provided.
+
+        Returns:
+            Final save paths of each file.
+        """
+        if puzzles_per_file is not None and puzzles_per_file < 1:
+            raise ValueError("Puzzles per file must be >= 1.")
+        if isinstance(path, str):
+            path = Path(path)
+
+        def volume_path(volume: int) -> Path:
+            if puzzles_per_file is None:
+                return path
+            return path.with_name(f"{path.stem}-{volume}{path.suffix}")
+
+        saved_files: list[Path] = []
+        pdf: FPDF | None = None
+        solutions: list[GameType] = []
+        count = 0
+        for game in games:
+            if not game.puzzle or not game.placed_words:
+                raise EmptyPuzzleError()
+            if pdf is None:
+                # fail before drawing anything if the volume can't be saved
+                if volume_path(len(saved_files) + 1).exists():
+                    raise FileExistsError(
+                        f"Sorry, output file '{volume_path(len(saved_files) + 1)}' "
+                        + "already exists."
+                    )
+                pdf = self.new_pdf()
+            self.draw_pdf_page(pdf, game, False, lowercase, hide_key)
+            if solution and appendix:
+                solutions.append(game)
+            elif solution:
+                self.draw_pdf_page(pdf, game, True, lowercase)
+            count += 1
+            if puzzles_per_file and count % puzzles_per_file == 0:
+                for solved in solutions:
+                    self.draw_pdf_page(pdf, solved, True, lowercase)
+                volume = volume_path(len(saved_files) + 1)
+                saved_files.append(self._write_output(bytes(pdf.output()), volume))
+                pdf, solutions = None, []
+        if pdf is not None:
+            for solved in solutions:
+                self.draw_pdf_page(pdf, solved, True, lowercase)
+            volume = volume_path(len(saved_files) + 1)
+            saved_files.append(self._write_output(bytes(pdf.output()), volume))
+        if not count:
+            raise ValueError("No puzzles provided.")
+        return saved_files
+
+    def new_pdf(self) -> FPDF:
+        """Setup a new (empty) PDF document."""
         pdf = FPDF(orientation="P", unit="in", format="Letter")
         pdf.set_author(self.PDF_AUTHOR)
         pdf.set_creator(self.PDF_CREATOR)
         pdf.set_title(self.PDF_TITLE)
         pdf.set_line_width(pdf.line_width * 2)
+        return pdf
 
-        # draw initial puzzle page
-        pdf = draw_puzzle_page(pdf, game, False, hide_key)
+    @overload
+    @staticmethod
+    def _write_output(data: str | bytes, fp: Path) -> Path: ...
 
-        # add puzzle solution page if requested
-        if solution:
-            pdf = draw_puzzle_page(pdf, game, solution)
+    @overload
+    @staticmethod
+    def _write_output(data: str | bytes, fp: Path | IO[Any]) -> Path | None: ...
 
-        # check the provided path since fpdf doesn't offer context manager
-        if path.exists():
-            raise FileExistsError(f"Sorry, output file '{path}' already exists.")
+    @staticmethod
+    def _write_output(data: str | bytes, fp: Path | IO[Any]) -> Path | None:
+        """Write `data` to a new file at path `fp` or to the text or binary
+        stream `fp`. Text written to a binary stream is encoded as UTF-8.
+
+        Raises:
+            FileExistsError: `fp` is a path that already exists.
+            OSError: The file could not be saved.
+            TypeError: Bytes can't be written to the text stream `fp`.
+
+        Returns:
+            Final save path of the file (None when written to a stream).
+        """
+        if not isinstance(fp, Path):
+            # only text streams have an encoding
+            if not hasattr(fp, "encoding"):
+                fp.write(data.encode("utf-8") if isinstance(data, str) else data)
+            elif isinstance(data, str):
+                fp.write(data)
+            else:
+                raise TypeError("PDF output requires a binary stream.")
+            return None
 
-        # write the final PDF to the filesystem
         try:
-            pdf.output(path)
+            if isinstance(data, str):
+                with open(fp, "x", newline="", encoding="utf-8") as f:
+                    f.write(data)
+            else:
+                with open(fp, "xb") as f:
+                    f.write(data)
+        except FileExistsError as err:
+            raise FileExistsError(f"Sorry, output file '{fp}' already exists.") from err
         except OSError as err:
-            raise OSError(f"File could not be saved to '{path}'.") from err
-        return path.absolute()
+            raise OSError(f"File could not be saved to '{fp}'.") from err
+        return fp.absolute()
+
+    def draw_pdf_page(
+        self,
+        pdf: FPDF,
+        game: GameType,
+        solution: bool = False,
+        lowercase: bool = False,
+        hide_key: bool = False,
+    ) -> FPDF:
+        """Draw the puzzle information on a new FPDF PDF page.
+
+        Args:
+            pdf: FPDF PDF document.
+            game: Current Word Search puzzle.
+            solution: Highlight the puzzle solution. Defaults to False.
+            lowercase: Change letters to lower case. Defaults to False.
+            hide_key: Don't include the answer key. Defaults to False.
+
+        Returns:
+            FPDF PDF with drawn puzzle page.
+        """
+
+        # add a new page and setup the margins
+        pdf.add_page()
+        pdf.set_margin(0.5)
+
+        # insert the title
+        title = "WORD SEARCH" if not solution else "WORD SEARCH (SOLUTION)"
+        pdf.set_font("Helvetica", "B", self.PDF_FONT_SIZE_XXL)
+        pdf.cell(pdf.epw, 0.25, title, new_y="NEXT", align="C", center=True)
+        pdf.ln(0.125)
+
+        # calculate the puzzle size and letter font size
+        pdf.set_left_margin(0.75)
+        gsize = self.PDF_PUZZLE_WIDTH / game.cropped_size[0]
+        gmargin = 0.6875 if gsize > 36 else 0.75
+        font_size = int(72 * gsize * gmargin)
+        # calculate flexible font size based on word count
+        # to ensure all words and the puzzle key fit on one page
+        info_font_size = self.PDF_FONT_SIZE_XL - (
+            len(game.words) - Game.MIN_PUZZLE_WORDS
+        ) * (6 / (Game.MAX_PUZZLE_WORDS - Game.MIN_PUZZLE_WORDS))
+        pdf.set_font_size(font_size)
+
+        # get start position of puzzle
+        start_x = pdf.get_x()
+        start_y = pdf.get_y()
+
+        # draw the puzzle
+        self._draw_pdf_grid(pdf, game.cropped_puzzle, gsize, lowercase)
+        pdf.ln(0.25)
+
+        # draw solution highlights
+        if solution:
+            highlights = []
+            for word in game.placed_words:
+                word_start, *_, word_end = word.offset_coordinates(game.bounding_box)
+                word_start_x, word_start_y = word_start
+                word_end_x, word_end_y = word_end
+
+                # mypy check for word position
+                if (
+                    not word_start_x
+                    or not word_start_y
+                    or not word_end_x
+                    or not word_end_y
+                ):
+                    continue  # pragma: no cover
+
+                highlights.append(
+                    (
+                        word.color,
+                        start_x + ((word_start_x - 1) * gsize) + (gsize / 2),
+                        start_y + ((word_start_y - 1) * gsize) + (gsize / 2),
+                        start_x + ((word_end_x - 1) * gsize) + (gsize / 2),
+                        start_y + ((word_end_y - 1) * gsize) + (gsize / 2),
+                    )
+                )
+            self._draw_pdf_highlights(pdf, highlights, pdf.font_size * 0.875)
+
+        # collect puzzle information
+        word_list_str = utils.get_word_list_str(game.key)
+        LEVEL_DIRS_str = utils.get_LEVEL_DIRS_str(game.level)
+        key_intro = "Answer Key"
+        if hasattr(game, "placed_secret_words"):
+            key_intro += " (*Secret Words)"
+        answer_key_str = utils.get_answer_key_str(game.placed_words, game.bounding_box)
+
+        # if lower case requested, change for letters for puzzle, words, and key
+        if lowercase:
+            for word in game.placed_words:
+                answer_key_str = answer_key_str.replace(word.text, word.text.lower())
+
+        # catch case of all secret words
+        if not word_list_str:
+            word_list_str = "<ALL SECRET WORDS>"
+
+        # write word list info
+        pdf.set_font("Helvetica", "BU", size=info_font_size)
+        pdf.cell(
+            pdf.epw,
+            text=f"Find words going {LEVEL_DIRS_str}:",
+            align="C",
+            new_y="NEXT",
+        )
+        pdf.ln(0.125)
+
+        # write word list
+        pdf.set_font("Helvetica", "B", size=info_font_size)
+        pdf.set_font_size(info_font_size)
+        pdf.set_char_spacing(0.5)
+
+        sorted_words = sorted(game.placed_words, key=lambda w: w.text)
+        lines: list[tuple[float, list[Word]]] = []
+        line_width = 0.0
+        line: list[Word] = []
+        for word in sorted_words:
+            if word.secret and not solution:
+                continue
+            word_cell_width = pdf.get_string_width(word.text) + pdf.c_margin * 4
+            if line_width + word_cell_width > pdf.epw:
+                lines.append((line_width, line))
+                line_width = 0.0
+                line = []
+            line_width += word_cell_width
+            line.append(word)
+        if line:
+            lines.append((line_width, line))
+
+        highlights = []
+        for line_width, words in lines:
+            line_offset = (pdf.epw - line_width) / 2
+            pdf.set_x(pdf.get_x() + line_offset)
+            for word in words:
+                if word.secret and not solution:  # pragma: no cover
+                    continue
+                start_x = pdf.get_x()
+                start_y = pdf.get_y()
+                word_cell_width = pdf.get_string_width(word.text) + pdf.c_margin * 4
+                pdf.cell(
+                    w=word_cell_width,
+                    text=word.text.lower() if lowercase else word.text,
+                    align="C",
+                )
+                if solution:
+                    highlights.append(
+                        (
+                            word.color,
+                            start_x + pdf.c_margin * 2.75,
+                            start_y + (pdf.font_size / 2),
+                            pdf.get_x() - pdf.c_margin * 2.75,
+                            pdf.get_y() + (pdf.font_size / 2),
+                        )
+                    )
+
+            pdf.ln(pdf.font_size * 1.25)
+
+        if solution:
+            self._draw_pdf_highlights(pdf, highlights, pdf.font_size * 0.875)
+
+        if not lines and not solution:
+            pdf.cell(text="<ALL SECRET WORDS>", align="C", center=True)
+        # reset the spacing so it doesn't carry over to the next page
+        pdf.set_char_spacing(0)
+
+        if not hide_key:
+            # write the puzzle answer key
+            # resetting the margin before rotating makes layout easier to figure
+            pdf.set_margin(0)
+            # rotate the page to write answer key upside down
+            with pdf.rotation(angle=180, x=pdf.epw / 2, y=pdf.eph / 2):
+                pdf.set_xy(pdf.epw - pdf.epw, 0)
+                pdf.set_margin(0.25)
+                pdf.set_font("Helvetica", size=self.PDF_FONT_SIZE_S)
+                pdf.write(text=f"{key_intro}: {answer_key_str}")
+
+        return pdf
+
+    @staticmethod
+    def _draw_pdf_grid(
+        pdf: FPDF, puzzle: Puzzle, gsize: float, lowercase: bool = False
+    ) -> None:
+        """Draw the puzzle letters centered within square cells of `gsize`
+        starting at the current position, then move below the grid.
+
+        Instead of a `FPDF.cell()` per letter, each row is written as a single
+        text object with a relative `Td` move before each letter. Letters end
+        up in the exact same spot as they would centered in a cell."""
+        k = pdf.k
+        widths: dict[str, float] = {}
+        x, y = pdf.get_x(), pdf.get_y()
+        for row in puzzle:
+            parts: list[str] = []
+            prev_x = 0.0
+            for col, char in enumerate(row):
+                if not char:
+                    continue
+                if lowercase:
+                    char = char.lower()
+                if char not in widths:
+                    widths[char] = pdf.get_string_width(char)
+                char_x = x + col * gsize + (gsize - widths[char]) / 2
+                if parts:
+                    parts.append(f"{(char_x - prev_x) * k:.2f} 0 Td")
+                else:
+                    baseline = pdf.h - y - 0.5 * gsize - 0.3 * pdf.font_size
+                    parts.append(f"{char_x * k:.2f} {baseline * k:.2f} Td")
+                parts.append(f"({escape_parens(char)}) Tj")
+                prev_x = char_x
+            if parts:
+                WordSearchFormatter._write_pdf_operators(
+                    pdf, f"BT {' '.join(parts)} ET"
+                )
+            y += gsize
+        pdf.set_xy(pdf.l_margin, y)
+
+    @staticmethod
+    def _write_pdf_operators(pdf: FPDF, operators: str) -> None:
+        """Write raw PDF content stream `operators` to the current page.
+
+        fpdf2 has no public API for this, so this relies on the private
+        `FPDF._out()` of the pinned fpdf2 version (2.7.8). Check it still
+        exists (see `test_pdf_raw_operators_supported`) before upgrading."""
+        pdf._out(operators)
+
+    @staticmethod
+    def _draw_pdf_highlights(
+        pdf: FPDF,
+        highlights: list[tuple[tuple[float, float, float], float, float, float, float]],
+        width: float,
+    ) -> None:
+        """Draw every (color, start x, start y, end x, end y) highlight stroke
+        within a single drawing context."""
+        if not highlights:
+            return
+        with pdf.drawing_context() as context:
+            for color, x1, y1, x2, y2 in highlights:
+                path = drawing.PaintedPath()
+                path.style.fill_color = None
+                path.style.stroke_color = drawing.DeviceRGB(*color, 0.5)
+                path.style.stroke_join_style = "round"
+                path.style.stroke_width = width
+                path.move_to(x1, y1)
+                path.line_to(x2, y2)
+                context.add_item(path)
 
     # TODO: remove method
     def format_puzzle_for_show(
@@ -1,30 +1,246 @@
 from __future__ import annotations
 
 import random
+import re
+from collections import deque
+from functools import lru_cache
 from typing import TYPE_CHECKING, TypeAlias
 
-from ..core.generator import Generator, WordFitError, retry
+from ..core.generator import (
+    ALPHABET,
+    Generator,
+    GeneratorStats,
+    WordFitError,
+    retry,
+)
 from ..core.word import Direction, Word
 from ..utils import in_bounds
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator, Sequence
+
     from ..core import GameType
-    from ..core.game import Puzzle
+    from ..core.game import DirectionSet, Puzzle
 
 
 Fit: TypeAlias = tuple[str, list[tuple[int, int]]]
 Fits: TypeAlias = list[tuple[str, list[tuple[int, int]]]]
 
 
+Line: TypeAlias = tuple[tuple[int, int], ...]
+
+# (∂row, ∂col) of each line a duplicate word could be read along
+LINE_AXES = ((0, 1), (1, 0), (1, 1), (-1, 1))
+
+# placeholders used when matching words against lines of the puzzle
+EMPTY_CELL = "\0"
+INACTIVE_CELL = "\1"
+
+
+@lru_cache(maxsize=128)
+def grid_lines(size: int, r_move: int, c_move: int) -> tuple[Line, ...]:
+    """Every line of (row, col) coordinates that runs across a square grid
+    of `size` when heading in the (`r_move`, `c_move`) direction."""
+    lines = []
+    for row in range(size):
+        for col in range(size):
+            # only start from cells with no previous cell on the line
+            if in_bounds(col - c_move, row - r_move, size, size):
+                continue
+            line = []
+            r, c = row, col
+            while in_bounds(c, r, size, size):
+                line.append((r, c))
+                r += r_move
+                c += c_move
+            lines.append(tuple(line))
+    return tuple(lines)
+
+
+class DuplicateWordIndex:
+    """Aho-Corasick automaton over placed puzzle words (and their reverses)
+    used to spot accidental duplicates of those words in the puzzle.
+
+    Words can be added as they are placed in the puzzle. The automaton links
+    are lazily rebuilt on the next search after a change so placing many
+    words in a row stays cheap."""
+
+    def __init__(self, words: Iterable[str] | None = None) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._terminal: list[str | None] = [None]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        self._sources: dict[str, set[str]] = {}
+        self._dirty = False
+        self.longest = 0
+        for word in words or []:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        """Index `word` and its reverse."""
+        for pattern in {word, word[::-1]}:
+            if pattern not in self._sources:
+                self._sources[pattern] = set()
+                self._insert(pattern)
+            self._sources[pattern].add(word)
+        self._dirty = True
+
+    def _insert(self, pattern: str) -> None:
+        node = 0
+        for char in pattern:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._terminal.append(None)
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        self._terminal[node] = pattern
+
+    def _build(self) -> None:
+        """Rebuild the failure links and output sets (breadth-first)."""
+        self.longest = max((len(p) for p in self._sources), default=0)
+        self._fail[0] = 0
+        self._out[0] = ()
+        queue: deque[int] = deque()
+        for node in self._goto[0].values():
+            self._fail[node] = 0
+            queue.append(node)
+        while queue:
+            node = queue.popleft()
+            terminal = self._terminal[node]
+            own = (terminal,) if terminal is not None else ()
+            self._out[node] = own + self._out[self._fail[node]]
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                queue.append(child)
+        self._dirty = False
+
+    def find(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield `(end, pattern)` for every indexed pattern found in `text`,
+        where `end` is the index of the last character of the match."""
+        if self._dirty:
+            self._build()
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for pattern in out[node]:
+                yield i, pattern
+
+    def conflicts(self, pattern: str, current_word: str | None = None) -> bool:
+        """Would finding `pattern` duplicate a placed word other than one
+        overlapping `current_word` (which can't be avoided when placing it)."""
+        for word in self._sources.get(pattern, ()):
+            if current_word and (current_word in word or word in current_word):
+                continue
+            return True
+        return False
+
+    def __bool__(self) -> bool:
+        if self._dirty:
+            self._build()
+        return self.longest > 0
+
+
 class WordSearchGenerator(Generator):
     """Default generator for standard WordSearch puzzles."""
 
-    def generate(self, game: GameType) -> Puzzle:
+    QUICK_FIT_TRIES = 100
+
+    def __init__(
+        self,
+        alphabet: str | Iterable[str] = ALPHABET,
+        indexed_fit: bool = True,
+        rng: random.Random | None = None,
+        profile: bool = False,
+    ) -> None:
+        """Initialize a word search puzzle generator.
+
+        Args:
+            alphabet: Alphabet (letters) to use for the puzzle filler characters.
+            indexed_fit: Place words by picking from every spot each word fits
+                (found in a single pass over the puzzle) instead of retrying
+                random coordinates. Defaults to True.
+            rng: Random number generator used for every generated puzzle.
+                Defaults to None which uses the rng of each game being generated.
+            profile: Record `GeneratorStats` for each generated puzzle.
+                Defaults to False.
+        """
+        super().__init__(alphabet, profile)
+        self.indexed_fit = indexed_fit
+        self._rng = rng
+        self.rng: random.Random = rng if rng is not None else random.Random()
+        self.dupe_index: DuplicateWordIndex | None = None
+        self._line_strings: dict[tuple[int, int], list[str]] = {}
+        # filler cells words can be placed over (only used when adding words)
+        self.free_cells: set[tuple[int, int]] = set()
+
+    def _setup(self, game: GameType, puzzle: Puzzle) -> None:
+        """Reset the generator state for working on `puzzle`."""
         self.game = game
-        self.puzzle = game._build_puzzle(game.size, "")
-        self.fill_words()
-        if any(word.placed for word in game.words):
-            self.fill_blanks()
+        if self._rng is None:
+            self.rng = game.rng
+        self.puzzle = puzzle
+        self.dupe_index = None
+        self._line_strings = {}
+        self.free_cells = set()
+        self.stats = GeneratorStats() if self.profile else None
+
+    def generate(self, game: GameType) -> Puzzle:
+        self._setup(game, game._build_puzzle(game.size, ""))
+        self.dupe_index = DuplicateWordIndex()
+        with self.phase("total"):
+            self.fill_words()
+            if any(word.placed for word in game.words):
+                with self.phase("fill_blanks"):
+                    self.fill_blanks()
+        return self.puzzle
+
+    def add_words(self, game: GameType, words: Iterable[Word]) -> Puzzle:
+        """Fit `words` into the current puzzle without moving any placed words.
+
+        New words are placed just like during `generate()` except that filler
+        characters count as empty cells. Filler characters are only replaced
+        where a new word crosses them, or where they would spell a new word
+        somewhere else in the puzzle.
+        """
+        self._setup(game, [row[:] for row in game.puzzle])
+        placed_cells = {cell for word in game.placed_words for cell in word.coordinates}
+        self.free_cells = {
+            (row, col)
+            for row, mask_row in enumerate(game.mask)
+            for col, mask_char in enumerate(mask_row)
+            if mask_char == game.ACTIVE and (row, col) not in placed_cells
+        }
+        with self.phase("total"):
+            self.fill_words(words)
+        self.free_cells = set()
+        return self.puzzle
+
+    def remove_words(self, game: GameType, words: Iterable[Word]) -> Puzzle:
+        """Clear `words` from the current puzzle without moving any other words.
+        Only the cells not shared with a remaining word are refilled."""
+        self._setup(game, [row[:] for row in game.puzzle])
+        placed_cells = {cell for word in game.placed_words for cell in word.coordinates}
+        cleared = {
+            cell
+            for word in words
+            for cell in word.coordinates
+            if cell not in placed_cells
+        }
+        for row, col in cleared:
+            self.puzzle[row][col] = ""
+        with self.phase("total"), self.phase("fill_blanks"):
+            for cell in sorted(cleared):
+                self.fill_cell(cell)
         return self.puzzle
 
     def no_duped_words(
@@ -32,67 +248,51 @@ class WordSearchGenerator(Generator):
     ) -> bool:
         """Make sure that adding `char` at `position` will not create a
         duplicate of any word already placed in the puzzle."""
-        placed_word_strings = []
-        for word in self.game.words:
-            if word.placed:
-                if current_word and (
-                    current_word in word.text or word.text in current_word
-                ):
-                    continue
-                placed_word_strings.append(word.text)
-        if not placed_word_strings:
+        if self.stats is not None:
+            self.stats.dupe_checks += 1
+        if self.dupe_index is None:
+            # puzzle state was supplied outside of `generate()`
+            self.dupe_index = DuplicateWordIndex(
+                word.text for word in self.game.words if word.placed
+            )
+        if not self.dupe_index:
             return True
 
-        # calculate how large of a search radius to check
-        radius = len(max(placed_word_strings, key=len))
-        # track each directional fragment of characters
-        fragments = self.capture_fragments(radius, position)
-        # check to see if any duped words are now present
-        before_ct = after_ct = 0
-        for word_text in placed_word_strings:
-            for before in fragments:
-                # remove the current word
-                # after = before.replace(current_word, "")
-                after = before.replace("*", char)
-                if word_text in before or word_text[::-1] in before:
-                    before_ct += 1
-                if word_text in after or word_text[::-1] in after:
-                    after_ct += 1
-        return before_ct == after_ct
-
-    def capture_fragments(self, radius: int, position: tuple[int, int]) -> list[str]:
         row, col = position
-        fragments = []
-        height = width = self.game.size
-
-        # cardinal direction ranges to capture
-        ranges = [
-            (
-                range(row - (radius - 1), row + radius),
-                range(col - (radius - 1), col + radius),
-            ),  # top-left to bottom-right
-            (
-                [row] * (radius * 2 - 1),
-                range(col - (radius - 1), col + radius),
-            ),  # left to right
-            (
-                range(row - (radius - 1), row + radius),
-                [col] * (radius * 2 - 1),
-            ),  # top to bottom
-            (
-                range(row + (radius - 1), row - radius, -1),
-                range(col - (radius - 1), col + radius),
-            ),  # bottom-left to top-right
-        ]
-
-        for row_range, col_range in ranges:
-            fragment = ""
-            for r, c in zip(row_range, col_range, strict=False):
-                if not in_bounds(c, r, width, height):
+        size = len(self.puzzle)
+        reach = self.dupe_index.longest - 1
+        for r_move, c_move in LINE_AXES:
+            # collect the unbroken run of letters passing through `position`
+            # along this axis, no further out than the longest placed word
+            before: list[str] = []
+            r, c = row - r_move, col - c_move
+            while (
+                len(before) < reach
+                and in_bounds(c, r, size, size)
+                and self.puzzle[r][c] != ""
+            ):
+                before.append(self.puzzle[r][c])
+                r, c = r - r_move, c - c_move
+            after: list[str] = []
+            r, c = row + r_move, col + c_move
+            while (
+                len(after) < reach
+                and in_bounds(c, r, size, size)
+                and self.puzzle[r][c] != ""
+            ):
+                after.append(self.puzzle[r][c])
+                r, c = r + r_move, c + c_move
+            if not before and not after:
+                continue
+            line = "".join(reversed(before)) + char + "".join(after)
+            # only matches that pass through `position` are new duplicates
+            idx = len(before)
+            for end, pattern in self.dupe_index.find(line):
+                if end - len(pattern) >= idx or end < idx:
                     continue
-                fragment += "*" if (r, c) == (row, col) else self.puzzle[r][c]
-            fragments.append(fragment)
-        return fragments
+                if self.dupe_index.conflicts(pattern, current_word):
+                    return False
+        return True
 
     def test_a_fit(
         self,
@@ -108,72 +308,228 @@ class WordSearchGenerator(Generator):
         for char in word:
             # if coordinates are off of puzzle cancel fit test
             if not in_bounds(col, row, len(self.puzzle), len(self.puzzle)):
-                return []
+                return self.reject("out_of_bounds")
             # first check if the spot is inactive on the mask
             if self.game.mask[row][col] == self.game.INACTIVE:
-                return []
+                return self.reject("mask_inactive")
             # if the current puzzle space is empty or if letters don't match
-            if self.puzzle[row][col] != "" and self.puzzle[row][col] != char:
-                return []
+            if (
+                self.puzzle[row][col] != ""
+                and self.puzzle[row][col] != char
+                and (row, col) not in self.free_cells
+            ):
+                return self.reject("letter_conflict")
             coordinates.append((row, col))
             # adjust the coordinates for the next character
             row += direction.r_move
             col += direction.c_move
         return coordinates
 
+    def reject(self, reason: str) -> list[tuple[int, int]]:
+        """Record a rejected fit when profiling. Returns an empty fit."""
+        if self.stats is not None:
+            self.stats.rejections[reason] += 1
+        return []
+
+    def word_directions(self, word: Word) -> list[Direction]:
+        """Valid directions for `word` based on its type. Listed in a fixed
+        order (unlike sets) so seeded puzzles are reproducible."""
+        directions: DirectionSet = self.game.directions
+        if word.secret and hasattr(self.game, "secret_directions"):
+            directions = self.game.secret_directions
+        return [d for d in Direction if d in directions]
+
     def find_a_fit(self, word: Word, position: tuple[int, int]) -> Fit:
         """Look for random place in the puzzle where `word` fits."""
         fits: Fits = []
         # check all directions for level
-        directions = secret_directions = self.game.directions
-        if hasattr(self.game, "secret_directions"):
-            secret_directions = self.game.secret_directions
-        for d in secret_directions if word.secret else directions:
+        for d in self.word_directions(word):
             coords = self.test_a_fit(word.text, position, d)
             if coords:
                 fits.append((Direction(d).name, coords))
         # if the word fits, pick a random fit for placement
         if not fits:
             raise WordFitError
-        return random.choice(fits)
+        return self.rng.choice(fits)
+
+    def find_all_fits(self, word: Word) -> dict[tuple[int, int], Fits]:
+        """Find every spot in the puzzle where `word` fits, grouped by
+        start position. Each line of the puzzle is matched against the word
+        as a whole so the entire puzzle only needs to be checked once."""
+        fits: dict[tuple[int, int], Fits] = {}
+        length = len(word.text)
+        for d in self.word_directions(word):
+            name, (r_move, c_move) = d.name, d.value
+            # opposite directions share the same lines, just read backwards
+            reverse = r_move < 0 or (r_move == 0 and c_move < 0)
+            axis = (-r_move, -c_move) if reverse else (r_move, c_move)
+            text = word.text[::-1] if reverse else word.text
+            pattern = re.compile(
+                "(?="
+                + "".join(f"[{re.escape(char)}{EMPTY_CELL}]" for char in text)
+                + ")"
+            )
+            lines = grid_lines(len(self.puzzle), *axis)
+            for coords, line in zip(lines, self.line_strings(axis), strict=True):
+                for match in pattern.finditer(line):
+                    span = coords[match.start() : match.start() + length]
+                    if reverse:
+                        span = span[::-1]
+                    fits.setdefault(span[0], []).append((name, list(span)))
+        return fits
+
+    def no_fit_reason(self, word: Word) -> str:
+        """Rejection reason for a `word` that `find_all_fits()` found no spot
+        for. The word is either longer than the puzzle, blocked by the mask
+        along every line, or blocked by letters already in the puzzle."""
+        length = len(word.text)
+        if length > len(self.puzzle):
+            return "out_of_bounds"
+        open_run = re.compile(f"[^{re.escape(INACTIVE_CELL)}]{{{length}}}")
+        for d in self.word_directions(word):
+            r_move, c_move = d.value
+            reverse = r_move < 0 or (r_move == 0 and c_move < 0)
+            axis = (-r_move, -c_move) if reverse else (r_move, c_move)
+            if any(open_run.search(line) for line in self.line_strings(axis)):
+                return "letter_conflict"
+        return "mask_inactive"
+
+    def line_strings(self, axis: tuple[int, int]) -> list[str]:
+        """Current puzzle characters for each line along `axis` (as listed by
+        `grid_lines()`). Cached until the next word is placed."""
+        if axis not in self._line_strings:
+            cells = [
+                [
+                    (
+                        char
+                        if char
+                        else (
+                            INACTIVE_CELL
+                            if mask_char == self.game.INACTIVE
+                            else EMPTY_CELL
+                        )
+                    )
+                    for char, mask_char in zip(row, mask_row, strict=True)
+                ]
+                for row, mask_row in zip(self.puzzle, self.game.mask, strict=True)
+            ]
+            for row, col in self.free_cells:
+                cells[row][col] = EMPTY_CELL
+            self._line_strings[axis] = [
+                "".join(cells[r][c] for r, c in line)
+                for line in grid_lines(len(self.puzzle), *axis)
+            ]
+        return self._line_strings[axis]
 
-    def fill_words(self) -> None:
-        """Fill puzzle with the supplied `words`.
+    def fill_words(self, words: Iterable[Word] | None = None) -> None:
+        """Fill puzzle with the supplied `words` (defaults to all game words).
         Some words will be skipped if they don't fit."""
         # try to place each word on the puzzle
-        placed_words: list[str] = []
-        hidden_words = [word for word in self.game.words if not word.secret]
-        secret_words = [word for word in self.game.words if word.secret]
+        placed_words = [word.text for word in self.game.words if word.placed]
+        # sets aren't ordered consistently between runs so sort before shuffling
+        words = sorted(
+            self.game.words if words is None else words, key=lambda word: word.text
+        )
+        self.rng.shuffle(words)
+        hidden_words = [word for word in words if not word.secret]
+        secret_words = [word for word in words if word.secret]
+        validators = self.game.validator_pipeline
+        if validators:
+            with self.phase("validation"):
+                validators.prime(word.text for word in words)
         # try to place each secret word on the puzzle first before hidden words
         for word in hidden_words + secret_words:
-            if self.game.validators and not word.validate(
-                self.game.validators, placed_words
-            ):
-                continue
-            fit = self.try_to_fit_word(word)
+            if validators:
+                with self.phase("validation"):
+                    valid = word.validate(validators, placed_words)
+                if not valid:
+                    continue
+            with self.phase("placement"):
+                if self.indexed_fit:
+                    fit = self.fit_word(word)
+                else:
+                    fit = self.try_to_fit_word(word)
             if fit:
                 placed_words.append(word.text)
             if len(placed_words) == self.game.MAX_PUZZLE_WORDS:
                 break
 
+    def fit_word(self, word: Word) -> bool:
+        """Fit `word` at a random spot picked from every spot it fits.
+
+        A handful of random coordinates are tried first since that is quickest
+        when the puzzle is sparse. After that, every spot the word fits is
+        found in a single pass and, just like random retries, a start position
+        is picked at random first and then a direction. Spots that would create
+        a duplicate word are dropped until the word is placed or none are left.
+        """
+        for _ in range(self.QUICK_FIT_TRIES):
+            try:
+                return self.random_fit(word)
+            except WordFitError:
+                continue
+
+        fits = self.find_all_fits(word)
+        if not fits and self.stats is not None:
+            # the full scan counts as a single (rejected) attempt
+            self.stats.attempts[word.text] += 1
+            self.reject(self.no_fit_reason(word))
+        starts = list(fits)
+        while starts:
+            i = self.rng.randrange(len(starts))
+            options = fits[starts[i]]
+            d, coords = options.pop(self.rng.randrange(len(options)))
+            if not options:
+                starts[i] = starts[-1]
+                starts.pop()
+            if self.stats is not None:
+                self.stats.attempts[word.text] += 1
+            if self.place_word(word, d, coords):
+                return True
+        return False
+
     @retry()
     def try_to_fit_word(self, word: Word) -> bool:
         """Try to fit `word` at randomized coordinates.
         @retry wrapper controls the number of attempts"""
-        row = random.randint(0, len(self.puzzle) - 1)
-        col = random.randint(0, len(self.puzzle) - 1)
+        return self.random_fit(word)
+
+    def random_fit(self, word: Word) -> bool:
+        """Try to fit `word` at a single set of randomized coordinates.
+
+        Raises:
+            WordFitError: The word couldn't be placed at the coordinates.
+        """
+        if self.stats is not None:
+            self.stats.attempts[word.text] += 1
+        row = self.rng.randint(0, len(self.puzzle) - 1)
+        col = self.rng.randint(0, len(self.puzzle) - 1)
 
         # no need to continue if random coordinate isn't available
-        if self.puzzle[row][col] != "" and self.puzzle[row][col] != word.text[0]:
+        if (
+            self.puzzle[row][col] != ""
+            and self.puzzle[row][col] != word.text[0]
+            and (row, col) not in self.free_cells
+        ):
+            self.reject("letter_conflict")
             raise WordFitError
         if self.game.mask[row][col] == self.game.INACTIVE:
+            self.reject("mask_inactive")
             raise WordFitError
 
         # try and find a directional fit using the starting coordinates if not INACTIVE
         d, coords = self.find_a_fit(word, (row, col))
+        if not self.place_word(word, d, coords):
+            raise WordFitError
+        return word.placed
 
-        # place word characters at fit coordinates
-        previous_chars = []  # track previous to backtrack on WordFitError
+    def place_word(
+        self, word: Word, direction: str, coords: Sequence[tuple[int, int]]
+    ) -> bool:
+        """Place `word` characters at `coords` and update its placement info.
+        Returns False (leaving the puzzle untouched) if placing the word would
+        create a duplicate of any word already placed in the puzzle."""
+        previous_chars = []  # track previous to backtrack on a duped word
         for i, char in enumerate(word.text):
             check_row = coords[i][0]
             check_col = coords[i][1]
@@ -189,15 +545,45 @@ class WordSearchGenerator(Generator):
                 # if a duped word was created put previous characters back in place
                 for n, previous_char in enumerate(previous_chars):
                     self.puzzle[coords[n][0]][coords[n][1]] = previous_char
-                raise WordFitError
+                self.reject("duplicate_created")
+                return False
+
+        # when placing over filler, the word might now be spelled out elsewhere
+        strays: list[list[tuple[int, int]]] = []
+        if self.free_cells:
+            strays = [
+                cells
+                for cells in self.find_word(word.text)
+                if set(cells) != set(coords)
+            ]
+            # strays made entirely from other words can't be fixed
+            if any(self.free_cells.isdisjoint(cells) for cells in strays):
+                for (row, col), previous_char in zip(
+                    coords, previous_chars, strict=True
+                ):
+                    self.puzzle[row][col] = previous_char
+                self.reject("duplicate_created")
+                return False
+            self.free_cells.difference_update(coords)
 
         # update word placement info
-        word.start_row = row
-        word.start_column = col
-        word.direction = Direction[d]
-        word.coordinates = coords
+        word.start_row, word.start_column = coords[0]
+        word.direction = Direction[direction]
+        word.coordinates = list(coords)
+        if self.dupe_index is not None:
+            self.dupe_index.add(word.text)
+        self._line_strings = {}
 
-        return word.placed
+        # replace a filler character in each stray copy of the word
+        for cells in strays:
+            if "".join(self.puzzle[r][c] for r, c in cells) not in (
+                word.text,
+                word.text[::-1],
+            ):
+                continue  # already broken up by an earlier replacement
+            free = [cell for cell in cells if cell in self.free_cells]
+            self.fill_cell(self.rng.choice(free))
+        return True
 
     def fill_blanks(self) -> None:
         """Fill empty puzzle spaces with random characters."""
@@ -211,8 +597,29 @@ class WordSearchGenerator(Generator):
                     self.puzzle[row][col] == ""
                     and self.game.mask[row][col] == self.game.ACTIVE
                 ):
-                    while True:
-                        random_char = random.choice(self.alphabet)
-                        if self.no_duped_words(random_char, (row, col)):
-                            self.puzzle[row][col] = random_char
-                            break
+                    self.fill_cell((row, col))
+
+    def fill_cell(self, position: tuple[int, int]) -> None:
+        """Fill the cell at `position` with a random character that doesn't
+        create a duplicate of any word placed in the puzzle."""
+        row, col = position
+        while True:
+            random_char = self.rng.choice(self.alphabet)
+            if self.no_duped_words(random_char, position):
+                self.puzzle[row][col] = random_char
+                break
+
+    def find_word(self, text: str) -> list[list[tuple[int, int]]]:
+        """Coordinates of every spot `text` can be read (forwards or backwards)
+        in the puzzle."""
+        found = []
+        length = len(text)
+        for axis in LINE_AXES:
+            for line in grid_lines(len(self.puzzle), *axis):
+                chars = "".join(self.puzzle[r][c] or EMPTY_CELL for r, c in line)
+                for target in {text, text[::-1]}:
+                    start = chars.find(target)
+                    while start != -1:
+                        found.append(list(line[start : start + length]))
+                        start = chars.find(target, start + 1)
+        return found
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
+from typing import TYPE_CHECKING, TypedDict
+
+from ..mask import Mask, shapes
+from .word_search import WordSearch
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+
+class PuzzleSpec(TypedDict, total=False):
+    """Settings for a single puzzle generated by `generate_many()`.
+    All keys are optional and mirror the `WordSearch` arguments."""
+
+    words: str
+    level: int | str
+    size: int
+    secret_words: str
+    secret_level: int | str
+    require_all_words: bool
+    masks: list[Mask | str]  # mask objects or built-in shape names
+    seed: int
+
+
+def generate_one(spec: PuzzleSpec) -> str:
+    """Generate a single puzzle from `spec` and return it serialized as JSON.
+
+    Args:
+        spec: Puzzle settings.
+
+    Returns:
+        The generated puzzle (see `WordSearch.json`).
+    """
+    masks: list[Mask] = []
+    for mask in spec.get("masks", []):
+        if isinstance(mask, str):
+            if mask not in shapes.BUILTIN_MASK_SHAPES:
+                raise ValueError(f"'{mask}' is not a built-in mask shape.")
+            mask = getattr(shapes, mask)()
+        masks.append(mask)
+
+    ws = WordSearch(
+        level=spec.get("level"),
+        size=spec.get("size"),
+        secret_level=spec.get("secret_level"),
+        require_all_words=spec.get("require_all_words", False),
+        seed=spec.get("seed"),
+    )
+    # add the words, size, and masks in a batch so the puzzle is generated once
+    with ws.batch():
+        if spec.get("words"):
+            ws.add_words(spec["words"])
+        if spec.get("secret_words"):
+            ws.add_words(spec["secret_words"], secret=True)
+        if masks and not ws.size and ws.words:
+            ws.size = ws._calc_puzzle_size(ws.words, ws.directions)
+        for mask in masks:
+            if hasattr(mask, "min_size") and ws.size < mask.min_size:
+                ws.size = mask.min_size
+            ws.apply_mask(mask)
+    return ws.json
+
+
+def _generate_chunk(chunk: list[tuple[int, PuzzleSpec]]) -> list[tuple[int, str]]:
+    return [(i, generate_one(spec)) for i, spec in chunk]
+
+
+def generate_many(
+    specs: Iterable[PuzzleSpec],
+    max_workers: int | None = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+) -> Iterator[tuple[int, str]]:
+    """Generate many puzzles in parallel using a pool of processes.
+
+    Puzzles are sent to the workers in chunks of `chunksize` specs and come
+    back serialized as JSON (see `WordSearch.json`) so only plain strings
+    cross the process boundary.
+
+    Example:
+        ```python
+        specs = [{"words": "dog, cat, pig", "size": 10, "seed": n} for n in range(500)]
+        for i, data in generate_many(specs, chunksize=25):
+            ...
+        ```
+
+    Args:
+        specs: Settings for each puzzle.
+        max_workers: Maximum number of worker processes. Defaults to the
+            `ProcessPoolExecutor` default (number of processors).
+        chunksize: Number of puzzles each worker generates per task.
+            Defaults to 1.
+        ordered: Yield results in the order of `specs`. When False, results
+            are yielded as soon as each chunk completes. Defaults to True.
+
+    Raises:
+        ValueError: Invalid `chunksize`.
+
+    Yields:
+        Tuples of (index of the spec in `specs`, serialized puzzle).
+    """
+    if chunksize < 1:
+        raise ValueError("Chunksize must be >= 1.")
+    indexed = enumerate(specs)
+    chunks = iter(lambda: list(islice(indexed, chunksize)), [])
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        if ordered:
+            for results in executor.map(_generate_chunk, chunks):
+                yield from results
+        else:
+            futures = [executor.submit(_generate_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
@@ -1,8 +1,14 @@
+import csv
+import io
 import json
+import re
+import struct
 from collections.abc import Iterable
 from pathlib import Path
+from typing import IO, Any, TypeAlias
 
 from .. import utils
+from ..core.directions import Direction
 from ..core.formatter import Formatter
 from ..core.game import (
     DirectionSet,
@@ -11,6 +17,7 @@ from ..core.game import (
     Game,
     MissingGeneratorError,
     MissingWordError,
+    Puzzle,
     PuzzleSizeError,
     WordSet,
 )
@@ -22,9 +29,87 @@ from ..core.validator import (
     NoSubwords,
     Validator,
 )
+from ..core.word import Position, Word
+from ..mask.bitmap import Bitmap
+from ..wordlist import WordSource
 from ._formatter import WordSearchFormatter
 from ._generator import WordSearchGenerator
 
+# binary format (see `WordSearch.to_bytes()`)
+_BINARY_MAGIC = b"WSG"
+_BINARY_VERSION = 1
+# magic, version, flags, size, directions, and secret directions
+_BINARY_HEADER = struct.Struct("<3sBBBBB")
+# flags and text length (in bytes)
+_BINARY_WORD = struct.Struct("<BH")
+# start row, start column, and direction
+_BINARY_PLACEMENT = struct.Struct("<BBB")
+# header flags
+_BINARY_REQUIRE_ALL_WORDS = 1
+_BINARY_SEED = 2
+_BINARY_MASK = 4
+# word flags
+_BINARY_SECRET = 1
+_BINARY_PLACED = 2
+
+# saved word text, secret, start row, start column, and direction
+_SavedWord: TypeAlias = tuple[str, bool, int | None, int | None, Direction | None]
+# answer key string (see `Word.key_string()`)
+_KEY_STRING = re.compile(r"^(\*?)(.+) ([A-Z]+) @ \((\d+), (\d+)\)$")
+
+
+def _pack_directions(directions: DirectionSet) -> int:
+    """Pack a set of directions into an integer with one bit per `Direction`."""
+    return sum(1 << i for i, d in enumerate(Direction) if d in directions)
+
+
+def _unpack_directions(bits: int) -> str | int:
+    """Unpack directions packed with `_pack_directions()` into comma separated
+    direction names (or level -1 when there are none)."""
+    return ",".join(d.name for i, d in enumerate(Direction) if bits >> i & 1) or -1
+
+
+def _word_coordinates(
+    text: str, row: int, col: int, direction: Direction
+) -> list[tuple[int, int]]:
+    """Puzzle coordinates (row, column) of each letter of a placed word."""
+    r_move, c_move = direction.value
+    return [(row + i * r_move, col + i * c_move) for i in range(len(text))]
+
+
+def _words_level(words: list[_SavedWord], secret: bool) -> str | None:
+    """Directions of the placed (secret) `words` as comma separated names."""
+    directions = {d for _, s, *_, d in words if s == secret and d is not None}
+    return ",".join(d.name for d in Direction if d in directions) or None
+
+
+def _find_offset(cropped: Puzzle, words: list[_SavedWord]) -> tuple[int, int]:
+    """Find the offset (x, y) of a cropped puzzle within the full puzzle
+    by matching the placed `words` with the puzzle letters."""
+    letters = [
+        (y, x, c)
+        for text, _, row, col, direction in words
+        if row is not None and col is not None and direction is not None
+        for (y, x), c in zip(
+            _word_coordinates(text, row, col, direction), text, strict=True
+        )
+    ]
+    if not letters:
+        return (0, 0)
+    height = len(cropped)
+    width = len(cropped[0])
+    rows = [y for y, _, _ in letters]
+    cols = [x for _, x, _ in letters]
+    for min_y in range(max(0, max(rows) - height + 1), min(rows) + 1):
+        for min_x in range(max(0, max(cols) - width + 1), min(cols) + 1):
+            if all(cropped[y - min_y][x - min_x] == c for y, x, c in letters):
+                return (min_x, min_y)
+    raise ValueError("Puzzle words don't match the puzzle letters.")
+
+
+def _is_level_row(row: list[str]) -> bool:
+    return len(row) == 1 and row[0].startswith("* Words can go ")
+
 
 class WordSearch(Game):
     """This class represents a WordSearch object."""
@@ -46,27 +131,29 @@ class WordSearch(Game):
 
     def __init__(
         self,
-        words: str | None = None,
+        words: str | io.TextIOBase | None = None,
         level: int | str | None = None,
         size: int | None = None,
-        secret_words: str | None = None,
+        secret_words: str | io.TextIOBase | None = None,
         secret_level: int | str | None = None,
         *,
         require_all_words: bool = False,
         generator: Generator | None = None,
         formatter: Formatter | None = None,
         validators: Iterable[Validator] | None = DEFAULT_VALIDATORS,
+        compact: bool = False,
+        seed: int | None = None,
     ):
         """Initialize a game.
 
         Args:
-            words: A string of words separated by spaces, commas, or new lines.
-                Will be trimmed if more. Defaults to None.
+            words: A string (or text stream) of words separated by spaces, commas,
+                or new lines. Will be trimmed if more. Defaults to None.
             level: Difficulty level or potential word directions. Defaults to 2.
             size: Puzzle size. Defaults to None.
-            secret_words: A string of words separated by spaces, commas, or new lines.
-                Words will be 'secret' meaning they will not be included in the
-                word list. Defaults to None.
+            secret_words: A string (or text stream) of words separated by spaces,
+                commas, or new lines. Words will be 'secret' meaning they will not
+                be included in the word list. Defaults to None.
             secret_level: Difficulty level or potential word directions for
                 'secret' words. Defaults to None.
             require_all_words: Raises an error when `generator` cannot place all of
@@ -76,7 +163,15 @@ class WordSearch(Game):
             validators: An iterable of validators that puzzle words will be checked
                 against during puzzle generation. Provide an empty iterable to disable
                 word validation. Defaults to `DEFAULT_VALIDATORS`.
+            compact: Store the puzzle and mask in a compact packed form to save
+                memory (see `Game.compact`). Defaults to False.
+            seed: Seed for the puzzle random number generator. Puzzles with the
+                same seed, words, and settings are identical. Defaults to None.
         """
+        # words are processed before `Game.__init__()` so setup the rng early
+        self._seed = seed
+        self.rng = self._new_rng(seed)
+
         # determine valid word directions
         self._secret_directions: DirectionSet = (
             self.validate_level(secret_level)
@@ -99,6 +194,8 @@ class WordSearch(Game):
             generator=generator,
             formatter=formatter,
             validators=validators,
+            compact=compact,
+            seed=seed,
         )
 
     # **************************************************** #
@@ -147,6 +244,12 @@ class WordSearch(Game):
                 "key": {
                     word.text: word.key_info_json for word in self.words if word.placed
                 },
+                "size": self.size,
+                "bounding_box": self.bounding_box,
+                "level": [d.name for d in Direction if d in self.directions],
+                "secret_level": [
+                    d.name for d in Direction if d in self.secret_directions
+                ],
             }
         )
 
@@ -169,7 +272,7 @@ class WordSearch(Game):
                 from the Direction object.
         """
         self._secret_directions = self.validate_level(value)
-        self.generate()
+        self._regenerate()
 
     # ************************************************* #
     # ******************** METHODS ******************** #
@@ -193,7 +296,7 @@ class WordSearch(Game):
 
     def save(
         self,
-        path: str | Path,
+        path: str | Path | IO[Any],
         format: str = "PDF",
         solution: bool = False,
         lowercase: bool = False,
@@ -209,6 +312,326 @@ class WordSearch(Game):
             hide_key=hide_key,
         )
 
+    def to_bytes(self) -> bytes:
+        """The current puzzle, mask, words, and settings in a compact, versioned
+        binary format. Use `WordSearch.from_bytes()` to rebuild the puzzle.
+
+        Raises:
+            EmptyPuzzleError: Puzzle not yet generated.
+        """
+        puzzle = self.puzzle
+        if not puzzle:
+            raise EmptyPuzzleError()
+        mask_bits = self._mask_bits()
+        flags = (
+            _BINARY_REQUIRE_ALL_WORDS * self.require_all_words
+            | _BINARY_SEED * (self.seed is not None)
+            | _BINARY_MASK * (mask_bits != utils.full_bits(self.size))
+        )
+        data = [
+            _BINARY_HEADER.pack(
+                _BINARY_MAGIC,
+                _BINARY_VERSION,
+                flags,
+                self.size,
+                _pack_directions(self.directions),
+                _pack_directions(self.secret_directions),
+            )
+        ]
+        if self.seed is not None:
+            seed = self.seed.to_bytes(
+                self.seed.bit_length() // 8 + 1, "little", signed=True
+            )
+            data += [len(seed).to_bytes(1, "little"), seed]
+        if flags & _BINARY_MASK:
+            data.append(mask_bits.to_bytes((self.size**2 + 7) // 8, "little"))
+
+        # letters are packed into the fewest bits needed for the puzzle alphabet
+        packed_puzzle = utils.pack_grid(puzzle)
+        alphabet = "".join(sorted(set(packed_puzzle) - {utils.PACKED_EMPTY}))
+        encoded_alphabet = alphabet.encode()
+        data += [
+            len(encoded_alphabet).to_bytes(2, "little"),
+            encoded_alphabet,
+            utils.pack_chars(packed_puzzle, alphabet),
+            len(self.words).to_bytes(2, "little"),
+        ]
+
+        directions = list(Direction)
+        for word in sorted(self.words, key=lambda w: w.text):
+            text = word.text.encode()
+            data += [
+                _BINARY_WORD.pack(
+                    _BINARY_SECRET * word.secret | _BINARY_PLACED * word.placed,
+                    len(text),
+                ),
+                text,
+            ]
+            if word.placed:
+                data.append(
+                    _BINARY_PLACEMENT.pack(
+                        word.start_row,
+                        word.start_column,
+                        directions.index(word.direction),  # type: ignore[arg-type]
+                    )
+                )
+        return b"".join(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, **kwargs) -> "WordSearch":
+        """Rebuild a puzzle saved with `WordSearch.to_bytes()` without
+        regenerating it. Any masks are restored as a single static `Bitmap`
+        of the active puzzle area.
+
+        Args:
+            data: Binary puzzle data.
+            **kwargs: Extra `WordSearch` arguments not stored in the binary
+                data (e.g. `validators` or `compact`).
+
+        Raises:
+            ValueError: Invalid puzzle data or unsupported format version.
+
+        Returns:
+            The rebuilt puzzle.
+        """
+        offset = 0
+
+        def read(size: int) -> bytes:
+            nonlocal offset
+            if offset + size > len(data):
+                raise ValueError("Invalid puzzle data (truncated).")
+            offset += size
+            return data[offset - size : offset]
+
+        magic, version, flags, size, directions, secret_directions = (
+            _BINARY_HEADER.unpack(read(_BINARY_HEADER.size))
+        )
+        if magic != _BINARY_MAGIC:
+            raise ValueError("Invalid puzzle data.")
+        if version != _BINARY_VERSION:
+            raise ValueError(f"Unsupported puzzle data version {version}.")
+        seed = None
+        if flags & _BINARY_SEED:
+            seed = int.from_bytes(read(read(1)[0]), "little", signed=True)
+        mask_bits = utils.full_bits(size)
+        if flags & _BINARY_MASK:
+            mask_bits = int.from_bytes(read((size**2 + 7) // 8), "little")
+        try:
+            alphabet = read(int.from_bytes(read(2), "little")).decode()
+            width = len(alphabet).bit_length() or 1
+            packed_puzzle = utils.unpack_chars(
+                read((size**2 * width + 7) // 8), size**2, alphabet
+            )
+        except (KeyError, UnicodeDecodeError) as err:
+            raise ValueError("Invalid puzzle data.") from err
+
+        all_directions = list(Direction)
+        words: list[_SavedWord] = []
+        for _ in range(int.from_bytes(read(2), "little")):
+            word_flags, length = _BINARY_WORD.unpack(read(_BINARY_WORD.size))
+            try:
+                text = read(length).decode()
+            except UnicodeDecodeError as err:
+                raise ValueError("Invalid puzzle data.") from err
+            row = col = direction = None
+            if word_flags & _BINARY_PLACED:
+                row, col, index = _BINARY_PLACEMENT.unpack(read(_BINARY_PLACEMENT.size))
+                if index >= len(all_directions):
+                    raise ValueError("Invalid puzzle data.")
+                direction = all_directions[index]
+            words.append((text, bool(word_flags & _BINARY_SECRET), row, col, direction))
+        if offset != len(data):
+            raise ValueError("Invalid puzzle data (trailing bytes).")
+
+        settings = {
+            "level": _unpack_directions(directions),
+            "secret_level": _unpack_directions(secret_directions),
+            "require_all_words": bool(flags & _BINARY_REQUIRE_ALL_WORDS),
+            "seed": seed,
+        }
+        return cls._restore(
+            utils.unpack_grid(packed_puzzle, size),
+            mask_bits,
+            words,
+            **(settings | kwargs),
+        )
+
+    @classmethod
+    def from_json(cls, data: str, **kwargs) -> "WordSearch":
+        """Rebuild a puzzle from `WordSearch.json` or a JSON export without
+        regenerating it. Any masks are restored as a single static `Bitmap`
+        of the active puzzle area.
+
+        Exports made before the puzzle size, bounding box, and levels were
+        included are supported too. The position of a cropped (masked) puzzle
+        is then worked out from the word placements, and the levels from the
+        word directions.
+
+        Args:
+            data: Puzzle JSON.
+            **kwargs: Extra `WordSearch` arguments (e.g. `validators` or `compact`).
+
+        Raises:
+            ValueError: Invalid puzzle JSON or the filler letters were hidden
+                (exported with the solution).
+
+        Returns:
+            The rebuilt puzzle.
+        """
+        try:
+            info = json.loads(data)
+            cropped = [[c.upper() for c in row] for row in info["puzzle"]]
+            words: list[_SavedWord] = [
+                (
+                    text.upper(),
+                    bool(placement["secret"]),
+                    placement["start_row"],
+                    placement["start_col"],
+                    Direction[placement["direction"]],
+                )
+                for text, placement in info["key"].items()
+            ]
+            offset = tuple(info["bounding_box"][0]) if "bounding_box" in info else None
+        except (ValueError, KeyError, TypeError, AttributeError) as err:
+            raise ValueError("Invalid puzzle JSON.") from err
+
+        settings = {
+            "level": ",".join(info.get("level", []))
+            or _words_level(words, secret=False),
+            "secret_level": ",".join(info.get("secret_level", []))
+            or _words_level(words, secret=True),
+        }
+        return cls._from_cropped_puzzle(
+            cropped,
+            words,
+            offset,  # type: ignore[arg-type]
+            info.get("size"),
+            **(settings | kwargs),
+        )
+
+    @classmethod
+    def from_csv(cls, data: str, **kwargs) -> "WordSearch":
+        """Rebuild a puzzle from a CSV export without regenerating it. Any masks
+        are restored as a single static `Bitmap` of the active puzzle area.
+
+        Since the CSV format only includes the cropped puzzle, the rebuilt puzzle
+        is sized to fit it (and may be smaller than the original).
+
+        Args:
+            data: Puzzle CSV.
+            **kwargs: Extra `WordSearch` arguments (e.g. `validators` or `compact`).
+
+        Raises:
+            ValueError: Invalid puzzle CSV or the filler letters were hidden
+                (exported with the solution).
+
+        Returns:
+            The rebuilt puzzle.
+        """
+        rows = list(csv.reader(io.StringIO(data, newline="")))
+        try:
+            end = rows.index([""])
+            level_row = next(i for i, row in enumerate(rows) if _is_level_row(row))
+            key = rows[level_row + 3]
+        except (ValueError, StopIteration, IndexError) as err:
+            raise ValueError("Invalid puzzle CSV.") from err
+        cropped = [[c.upper() for c in row] for row in rows[1:end]]
+        level = rows[level_row][0].removeprefix("* Words can go ").rstrip(".")
+
+        words: list[_SavedWord] = []
+        for key_string in key:
+            match = _KEY_STRING.match(key_string.upper())
+            if not match:
+                raise ValueError(f"Invalid puzzle CSV answer key '{key_string}'.")
+            secret, text, direction, col, row = match.groups()
+            words.append(
+                (text, bool(secret), int(row) - 1, int(col) - 1, Direction[direction])
+            )
+
+        settings = {
+            "level": ",".join(d for d in level.split(", ") if d != "and")
+            or _words_level(words, secret=False),
+            "secret_level": _words_level(words, secret=True),
+        }
+        return cls._from_cropped_puzzle(cropped, words, (0, 0), **(settings | kwargs))
+
+    @classmethod
+    def _from_cropped_puzzle(
+        cls,
+        cropped: Puzzle,
+        words: list[_SavedWord],
+        offset: tuple[int, int] | None = None,
+        size: int | None = None,
+        **kwargs,
+    ) -> "WordSearch":
+        """Rebuild a puzzle from a cropped puzzle where the empty cells are
+        masked. When the `offset` (x, y) of the cropped puzzle isn't known, it
+        is found by matching the `words` with the puzzle letters."""
+        if any(c == " " for row in cropped for c in row):
+            raise ValueError("Puzzle filler letters are hidden (solution export).")
+        height = len(cropped)
+        width = len(cropped[0]) if cropped else 0
+        if not width or any(len(row) != width for row in cropped):
+            raise ValueError("Puzzle rows must all be the same (non-zero) length.")
+        if offset is None:
+            offset = _find_offset(cropped, words)
+        min_x, min_y = offset
+        if size is None:
+            size = max(min_x + width, min_y + height, cls.MIN_PUZZLE_SIZE)
+        if min_x + width > size or min_y + height > size:
+            raise ValueError("Cropped puzzle doesn't fit the puzzle size.")
+
+        puzzle = cls._build_puzzle(size, "")
+        for y, row in enumerate(cropped, min_y):
+            puzzle[y][min_x : min_x + len(row)] = row
+        mask_bits = utils.pack_bits(
+            [["" if c else cls.INACTIVE for c in row] for row in puzzle], ""
+        )
+        return cls._restore(puzzle, mask_bits, words, **kwargs)
+
+    @classmethod
+    def _restore(
+        cls,
+        puzzle: Puzzle,
+        mask_bits: int,
+        words: list[_SavedWord],
+        **kwargs,
+    ) -> "WordSearch":
+        """Rebuild a puzzle from its (full size) puzzle grid, mask bits, and
+        words without regenerating it. Extra `kwargs` are passed to `WordSearch`.
+
+        Raises:
+            ValueError: A placed word doesn't match the puzzle letters.
+        """
+        size = len(puzzle)
+        ws = cls(size=size, **kwargs)
+        for text, secret, row, col, direction in words:
+            word = Word(text, secret=secret, rng=ws.rng)
+            if row is not None and col is not None and direction is not None:
+                coordinates = _word_coordinates(word.text, row, col, direction)
+                if not all(
+                    0 <= y < size and 0 <= x < size and puzzle[y][x] == c
+                    for (y, x), c in zip(coordinates, word.text, strict=True)
+                ):
+                    raise ValueError(
+                        f"Word '{word.text}' doesn't match the puzzle letters."
+                    )
+                word.position = Position(row, col)
+                word.direction = direction
+                word.coordinates = coordinates
+            ws._words.add(word)
+
+        ws._puzzle = puzzle
+        ws._set_mask_bits(mask_bits, size)
+        if mask_bits != utils.full_bits(size):
+            mask = Bitmap(
+                [(i % size, i // size) for i in range(size**2) if mask_bits >> i & 1]
+            )
+            mask.generate(size)
+            ws._masks.append(mask)
+        ws._pack_grids()
+        return ws
+
     # *************************************************************** #
     # ******************** PROCESSING/GENERATION ******************** #
     # *************************************************************** #
@@ -219,6 +642,7 @@ class WordSearch(Game):
         action: str = "REPLACE",
         secret: bool = False,
         reset_size: bool = False,
+        source: WordSource | None = None,
     ) -> None:
         """Add `count` randomly generated words to the puzzle.
 
@@ -231,6 +655,8 @@ class WordSearch(Game):
                 be secret. Defaults to False.
             reset_size (bool, optional): Reset the puzzle
                 size based on the updated words. Defaults to False.
+            source (WordSource, optional): Word list to pick the words from
+                (using the puzzle rng). Defaults to the built-in dictionary.
 
         Raises:
             TypeError: Must be an integer.
@@ -248,18 +674,22 @@ class WordSearch(Game):
             raise TypeError("Action must be a string.")
         if action.upper() not in ["ADD", "REPLACE"]:
             raise ValueError("Action must be either 'ADD' or 'REPLACE'.")
-        if action.upper() == "ADD":
-            self.add_words(
-                ",".join(utils.get_random_words(count)),
-                secret=secret,
-                reset_size=reset_size,
+        words = (
+            source.sample(count, rng=self.rng)
+            if source is not None
+            else utils.get_random_words(
+                count,
+                # don't pick any words already in the puzzle when adding
+                exclude=[word.text for word in self.words]
+                if action.upper() == "ADD"
+                else (),
+                rng=self.rng,
             )
+        )
+        if action.upper() == "ADD":
+            self.add_words(",".join(words), secret=secret, reset_size=reset_size)
         else:
-            self.replace_words(
-                ",".join(utils.get_random_words(count)),
-                secret=secret,
-                reset_size=reset_size,
-            )
+            self.replace_words(",".join(words), secret=secret, reset_size=reset_size)
 
     def generate(self, reset_size: bool = False) -> None:
         """Generate the puzzle grid.
@@ -279,8 +709,9 @@ class WordSearch(Game):
             raise MissingGeneratorError()
         if not self.words:
             raise EmptyWordlistError("No words have been added to the puzzle.")
+        self._pending = self._pending_reset_size = False
         if not self.size or reset_size:
-            self.size = self._calc_puzzle_size(self._words, self._directions)
+            self._set_size(self._calc_puzzle_size(self._words, self._directions))
         min_word_length = (
             min([len(word.text) for word in self.words]) if self.words else self.size
         )
@@ -290,9 +721,14 @@ class WordSearch(Game):
             )
         for word in self.words:
             word.remove_from_puzzle()
+        if self.seed is not None:
+            self.rng.seed(self.seed)
+        self._unpack_grids()
         if not self.mask or len(self.mask) != self.size:
             self._mask = self._build_puzzle(self.size, self.ACTIVE)
         self._puzzle = self.generator.generate(self)
+        self._stats = self.generator.stats
+        self._pack_grids()
         if self.require_all_words and self.unplaced_hidden_words:
             raise MissingWordError("All words could not be placed in the puzzle.")
 
@@ -0,0 +1,167 @@
+"""
+Word Lists
+----------
+Lazily read (and randomly sample) puzzle words from word list files, stdin,
+text streams, or iterables without loading the whole list into memory.
+
+    >>> from word_search_generator.wordlist import WordSource
+    >>> source = WordSource("dictionary.txt", max_length=15)
+    >>> source.sample(25)
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from io import TextIOBase
+from itertools import islice
+from math import exp, floor, log
+from os import PathLike
+from typing import TYPE_CHECKING
+
+from .core.validator import Validator
+from .utils import iter_words
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+
+class WordSource:
+    """A lazily read list of puzzle words.
+
+    Words are read from the source each time it is iterated, one chunk at a
+    time, uppercased, and filtered by length, alphabet, and validators. Text
+    streams and iterators can only be read once.
+    """
+
+    BATCH_SIZE = 1024
+    """Number of words checked per `Validator.validate_many()` call."""
+
+    def __init__(
+        self,
+        source: str | PathLike[str] | TextIOBase | Iterable[str],
+        *,
+        min_length: int | None = None,
+        max_length: int | None = None,
+        alphabet: str | None = None,
+        validators: Iterable[Validator] | None = None,
+    ) -> None:
+        """Initialize a word source.
+
+        Args:
+            source: Path to a word list file ("-" for stdin), a text stream, or
+                an iterable of strings. Words are separated by any mix of spaces,
+                commas, and new lines.
+            min_length: Minimum word length. Defaults to None.
+            max_length: Maximum word length (e.g. the puzzle size).
+                Defaults to None.
+            alphabet: Only include words made up of these characters.
+                Defaults to None.
+            validators: Only include words passing these validators (checked
+                without any placed words). Defaults to None.
+
+        Raises:
+            TypeError: Incorrect validator type provided.
+        """
+        self.source = source
+        self.min_length = min_length
+        self.max_length = max_length
+        self.alphabet: frozenset[str] | None = (
+            frozenset(alphabet.upper()) if alphabet else None
+        )
+        self.validators: list[Validator] = list(validators) if validators else []
+        for validator in self.validators:
+            if not isinstance(validator, Validator):
+                raise TypeError(f"Invalid validator: {validator}.")
+
+    def __iter__(self) -> Iterator[str]:
+        words = filter(self._accepts, map(str.strip, map(str.upper, self._read())))
+        if not self.validators:
+            yield from words
+            return
+        while batch := list(islice(words, self.BATCH_SIZE)):
+            for validator in self.validators:
+                results = validator.validate_many(batch, placed_words=[])
+                batch = [w for w, valid in zip(batch, results, strict=True) if valid]
+            yield from batch
+
+    def _read(self) -> Iterator[str]:
+        """Read the raw words from the source."""
+        source = self.source
+        if isinstance(source, str | PathLike):
+            if source == "-":
+                for line in sys.stdin:
+                    yield from iter_words(line)
+                return
+            with open(source, encoding="utf-8") as f:
+                yield from iter_words(f)
+        elif isinstance(source, TextIOBase):
+            yield from iter_words(source)
+        else:
+            for text in source:
+                yield from iter_words(text)
+
+    def _accepts(self, word: str) -> bool:
+        """Does the word pass the length and alphabet filters."""
+        if not word:
+            return False
+        if self.min_length is not None and len(word) < self.min_length:
+            return False
+        if self.max_length is not None and len(word) > self.max_length:
+            return False
+        return self.alphabet is None or self.alphabet.issuperset(word)
+
+    def sample(self, n: int, rng: random.Random | None = None) -> list[str]:
+        """Pick `n` random words from the source in a single pass.
+
+        Uses reservoir sampling (Algorithm L) so memory use only depends on `n`
+        and random numbers are only drawn for the words picked, no matter how
+        large the source is. Repeated words in the source are only picked once,
+        but every occurrence counts toward its chance of being picked, so the
+        sample is uniform over the words as they occur in the source rather
+        than over the unique words. Deduplicate the source first if that
+        matters.
+
+        Args:
+            n: Number of words to pick.
+            rng: Random number generator to use. Defaults to the global
+                `random` functions.
+
+        Returns:
+            The picked words in random order. Fewer than `n` when the source
+            doesn't have enough (unique) words.
+        """
+        if n <= 0:
+            return []
+        rand = rng if rng is not None else random
+
+        def uniform() -> float:
+            """Random float in the open interval (0, 1)."""
+            while not (u := rand.random()):
+                pass
+            return u
+
+        words = iter(self)
+        reservoir: list[str] = []
+        picked: set[str] = set()
+        for word in words:
+            if word not in picked:
+                reservoir.append(word)
+                picked.add(word)
+                if len(reservoir) == n:
+                    break
+        if len(reservoir) == n:
+            w = exp(log(uniform()) / n)
+            while True:
+                skip = floor(log(uniform()) / log(1 - w))
+                word = next(islice(words, skip, None), "")
+                if not word:
+                    break
+                if word not in picked:
+                    i = rand.randrange(n)
+                    picked.discard(reservoir[i])
+                    picked.add(word)
+                    reservoir[i] = word
+                w *= exp(log(uniform()) / n)
+        rand.shuffle(reservoir)
+        return reservoir
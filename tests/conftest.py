@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import IO, Any
 
 import pytest
 
@@ -42,7 +43,7 @@ def empty_formatter(tmp_path: Path):
         def save(
             self,
             game: GameType,
-            path: str | Path,
+            path: str | Path | IO[Any],
             format: str = "PDF",
             solution: bool = False,
             *args,
@@ -1,3 +1,4 @@
+import io
 import json
 from pathlib import Path
 
@@ -15,6 +16,7 @@ from word_search_generator.core.game import (
     PuzzleSizeError,
 )
 from word_search_generator.core.word import Direction, Word
+from word_search_generator.mask.shapes import Circle, Heart
 from word_search_generator.word_search._generator import WordSearchGenerator
 
 
@@ -150,6 +152,29 @@ def test_cleanup_input(base_game: Game, words: str, ct: int):
         base_game._cleanup_input(1, False, 10)  # type: ignore
 
 
+def test_cleanup_input_dedupe_and_cap(base_game: Game):
+    words = base_game._cleanup_input("cat, CAT, cat\t,dog " + "cow " * 5, True)
+    assert {word.text for word in words} == {"CAT", "DOG", "COW"}
+    assert all(word.secret for word in words)
+    many = ",".join(f"word{i}" for i in range(base_game.MAX_PUZZLE_WORDS * 10))
+    words = base_game._cleanup_input(many)
+    assert len(words) == base_game.MAX_PUZZLE_WORDS
+    assert Word("word0") in words
+
+
+def test_cleanup_input_stream(base_game: Game, words: str):
+    assert base_game._cleanup_input(io.StringIO(words)) == base_game._cleanup_input(
+        words
+    )
+
+
+def test_add_words_stream(ws: WordSearch):
+    ws.add_words(io.StringIO("buffalo\nbeaver"))
+    assert {"BUFFALO", "BEAVER"} <= {word.text for word in ws.words}
+    ws.remove_words(io.StringIO("buffalo"))
+    assert "BUFFALO" not in {word.text for word in ws.words}
+
+
 def test_invalid_level_direction_type(base_game: Game):
     with pytest.raises(TypeError):
         base_game.validate_level(None)
@@ -343,3 +368,92 @@ def test_puzzle_inequality_diff_type(words):
 @pytest.mark.skip(reason="need to figure out how to represent generator and formatter")
 def test_repr(base_game: Game):
     assert eval(repr(base_game)) == base_game
+
+
+class CountingGenerator(WordSearchGenerator):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def generate(self, game):
+        self.calls += 1
+        return super().generate(game)
+
+
+def test_generate_once_at_init(words):
+    generator = CountingGenerator()
+    Game(words, generator=generator)
+    assert generator.calls == 1
+
+
+def test_batch_regenerates_once(words):
+    generator = CountingGenerator()
+    g = Game(words, size=15, generator=generator)
+    with g.batch():
+        g.add_words("vinegar")
+        g.remove_words("dog")
+        g.size = 20
+        g.apply_mask(Circle())
+        g.invert_mask()
+        g.directions = 3
+        assert generator.calls == 1
+    assert generator.calls == 2
+    assert len(g.puzzle) == 20
+    assert "VINEGAR" in {word.text for word in g.words}
+
+
+def test_batch_nested(words):
+    generator = CountingGenerator()
+    g = Game(words, generator=generator)
+    with g.batch():
+        with g.batch():
+            g.size = 20
+        assert generator.calls == 1
+        g.size = 21
+    assert generator.calls == 2
+
+
+def test_batch_read_regenerates(words):
+    generator = CountingGenerator()
+    g = Game(words, size=15, generator=generator)
+    with g.batch():
+        g.size = 20
+        assert len(g.puzzle) == 20
+        assert generator.calls == 2
+    assert generator.calls == 2
+
+
+@pytest.mark.parametrize("size", [None, 21])
+def test_batch_mask_before_first_generation(words, size):
+    generator = CountingGenerator()
+    g = Game(size=size, generator=generator)
+    with g.batch():
+        g.add_words(words)
+        g.apply_mask(Circle())
+    expected = Game(words, size=size, generator=WordSearchGenerator())
+    expected.apply_mask(Circle())
+    assert generator.calls == 1
+    assert g.masks[0].puzzle_size == g.size == expected.size
+    assert g.mask == expected.mask
+    assert g.placed_words
+
+
+def test_apply_masks_regenerates_once(words):
+    generator = CountingGenerator()
+    g = Game(words, size=21, generator=generator)
+    g.apply_masks([Circle(), Heart(), Circle()])
+    assert generator.calls == 2
+
+
+def test_incremental_unsupported_generator(words, empty_generator):
+    g = Game(words, generator=empty_generator)
+    g.add_words("vinegar", incremental=True)
+    assert "VINEGAR" in {word.text for word in g.placed_words}
+
+
+def test_incremental_regenerates_once(words):
+    generator = CountingGenerator()
+    g = Game(words, size=15, generator=generator)
+    g.add_words("vinegar", incremental=True)
+    g.remove_words("dog", incremental=True)
+    assert generator.calls == 1
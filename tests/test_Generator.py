@@ -1,9 +1,16 @@
+import random
+
 import pytest
 
 from word_search_generator import WordSearch
 from word_search_generator.core.directions import LEVEL_DIRS
+from word_search_generator.core.generator import GeneratorStats
+from word_search_generator.core.word import Direction, Word
 from word_search_generator.utils import get_random_words
-from word_search_generator.word_search._generator import WordSearchGenerator
+from word_search_generator.word_search._generator import (
+    DuplicateWordIndex,
+    WordSearchGenerator,
+)
 
 
 def test_dupe_at_position_1(generator_test_game):
@@ -30,6 +37,28 @@ def test_no_dupe_at_position(generator_test_game):
     assert check is True
 
 
+def test_no_dupe_across_empty_cell(generator_test_game):
+    gen = WordSearchGenerator()
+    gen.game = generator_test_game
+    gen.puzzle = generator_test_game.puzzle
+    gen.puzzle[3][0] = "B"
+    gen.puzzle[3][3] = "T"
+    check = gen.no_duped_words("A", (3, 1))
+    assert check is True
+
+
+def test_dupe_index_find():
+    index = DuplicateWordIndex(["cat", "bat"])
+    assert sorted(index.find("xbatacx")) == [(3, "bat"), (5, "tac")]
+
+
+def test_dupe_index_conflicts():
+    index = DuplicateWordIndex(["at", "bat"])
+    assert index.conflicts("at")
+    assert not index.conflicts("at", current_word="cat")
+    assert index.conflicts("bat", current_word="cat")
+
+
 def test_only_placed_words_in_key(ws):
     assert all(word.direction for word in ws.placed_words)
 
@@ -89,3 +118,115 @@ def test_custom_get_attr():
 
     with pytest.raises(AttributeError):
         word_search_generator.__ver__  # noqa: B018
+
+
+def test_find_all_fits(generator_test_game):
+    gen = WordSearchGenerator()
+    gen.game = generator_test_game
+    gen.game._mask = gen.game._build_puzzle(5, gen.game.ACTIVE)
+    gen.puzzle = generator_test_game.puzzle
+    fits = gen.find_all_fits(Word("tab"))
+    for start, options in fits.items():
+        for d, coords in options:
+            assert coords[0] == start
+            assert coords == gen.test_a_fit("TAB", start, Direction[d])
+    # shares characters with "rat" and "cab"
+    assert fits[(2, 4)] == [("S", [(2, 4), (3, 4), (4, 4)])]
+    # letters don't match
+    assert (0, 0) not in fits
+
+
+def test_find_all_fits_masked(generator_test_game):
+    gen = WordSearchGenerator()
+    gen.game = generator_test_game
+    gen.game._mask = gen.game._build_puzzle(5, gen.game.INACTIVE)
+    gen.puzzle = generator_test_game.puzzle
+    assert not gen.find_all_fits(Word("tab"))
+
+
+def test_fit_word_no_fit(generator_test_game):
+    gen = WordSearchGenerator()
+    gen.game = generator_test_game
+    gen.game._mask = gen.game._build_puzzle(5, gen.game.ACTIVE)
+    gen.puzzle = generator_test_game.puzzle
+    word = Word("elephant")
+    assert not gen.fit_word(word)
+    assert not word.placed
+
+
+@pytest.mark.parametrize(
+    "text, mask_char, reason",
+    [
+        ("elephant", "ACTIVE", "out_of_bounds"),
+        ("tab", "INACTIVE", "mask_inactive"),
+        ("zzz", "ACTIVE", "letter_conflict"),
+    ],
+)
+def test_fit_word_no_fit_stats(generator_test_game, text, mask_char, reason):
+    gen = WordSearchGenerator(profile=True)
+    gen.stats = GeneratorStats()
+    gen.game = generator_test_game
+    gen.game._mask = gen.game._build_puzzle(5, getattr(gen.game, mask_char))
+    gen.puzzle = (
+        gen.game._build_puzzle(5, "")
+        if mask_char == "INACTIVE"
+        else gen.game._build_puzzle(5, "X")
+    )
+    word = Word(text)
+    assert not gen.fit_word(word)
+    assert gen.stats.attempts[word.text] == gen.QUICK_FIT_TRIES + 1
+    assert gen.no_fit_reason(word) == reason
+    assert gen.stats.rejections[reason] > 0
+
+
+def test_random_placement_generator():
+    ws = WordSearch(
+        "cat dog pig cow mule duck",
+        generator=WordSearchGenerator(indexed_fit=False),
+    )
+    assert len(ws.placed_words) == 6
+
+
+def test_generator_rng():
+    words = "cat dog pig cow mule duck"
+    ws1 = WordSearch(words, generator=WordSearchGenerator(rng=random.Random(3)))
+    ws2 = WordSearch(words, generator=WordSearchGenerator(rng=random.Random(3)))
+    assert ws1.puzzle == ws2.puzzle
+
+
+def test_generator_stats_disabled():
+    ws = WordSearch("cat dog pig")
+    assert ws.stats is None
+
+
+def test_generator_stats():
+    ws = WordSearch(
+        "cat dog pig cow mule duck", generator=WordSearchGenerator(profile=True)
+    )
+    stats = ws.stats
+    assert stats is not None
+    assert {"total", "validation", "placement", "fill_blanks"} <= set(stats.phases)
+    assert stats.phases["total"] >= stats.phases["placement"]
+    assert set(stats.attempts) == {word.text for word in ws.words}
+    assert stats.dupe_checks > 0
+    assert stats.as_dict()["dupe_checks"] == stats.dupe_checks
+    assert "Duplicate word checks" in str(stats)
+
+
+def test_generator_stats_reset_each_generation():
+    ws = WordSearch("cat dog pig", generator=WordSearchGenerator(profile=True))
+    stats = ws.stats
+    ws.generate()
+    assert ws.stats is not stats
+
+
+def test_generator_stats_rejections(generator_test_game):
+    generator = WordSearchGenerator(profile=True)
+    generator.stats = GeneratorStats()
+    generator.game = generator_test_game
+    generator.game._mask = generator.game._build_puzzle(5, generator.game.ACTIVE)
+    generator.puzzle = generator.game._build_puzzle(5, "")
+    assert not generator.test_a_fit("ABCDEFG", (0, 0), Direction.E)
+    generator.puzzle[2][2] = "Z"
+    assert not generator.test_a_fit("ABC", (0, 0), Direction.SE)
+    assert generator.stats.rejections == {"out_of_bounds": 1, "letter_conflict": 1}
@@ -1,14 +1,26 @@
+import io
 from pathlib import Path
 
 import pytest
 from PIL import Image as PILImage
 
 from word_search_generator import WordSearch
-from word_search_generator.mask import CompoundMask, Mask, MaskNotGenerated
-from word_search_generator.mask.bitmap import Bitmap, BitmapImage, ContrastError
+from word_search_generator.mask import (
+    MASK_CACHE,
+    CompoundMask,
+    Mask,
+    MaskCache,
+    MaskNotGenerated,
+)
+from word_search_generator.mask.bitmap import (
+    Bitmap,
+    BitmapImage,
+    ContrastError,
+    _open_bitmap,
+)
 from word_search_generator.mask.ellipse import Ellipse
 from word_search_generator.mask.polygon import Polygon, RegularPolygon, Star
-from word_search_generator.mask.shapes import Circle, Heart
+from word_search_generator.mask.shapes import Circle, Club, Heart
 from word_search_generator.utils import get_random_words
 
 
@@ -182,6 +194,84 @@ def test_transpose():
     assert m.mask == [["1", "4", "7"], ["2", "5", "8"], ["3", "6", "9"]]
 
 
+def test_mask_bits():
+    m = Mask()
+    m.generate(3)
+    m._mask = [["*", "#", "#"], ["#", "*", "#"], ["#", "#", "*"]]
+    assert m.bits == 0b100_010_001
+    m._set_bits(0b000_111_000)
+    assert m.mask == [["#", "#", "#"], ["*", "*", "*"], ["#", "#", "#"]]
+
+
+def test_mask_cache_hit():
+    MASK_CACHE.clear()
+    m1 = Club()
+    m1.generate(21)
+    m2 = Club()
+    m2.generate(21)
+    assert MASK_CACHE.hits == 1
+    assert m1.mask == m2.mask and m1.mask is not m2.mask
+    assert [m.mask for m in m1.masks] == [m.mask for m in m2.masks]
+    assert m1.masks[0] is not m2.masks[0]
+
+
+def test_mask_cache_returns_copies():
+    MASK_CACHE.clear()
+    expected = Circle()
+    expected.generate(11)
+    m = Circle()
+    m.generate(11)
+    m.invert()
+    m.points.clear()
+    m.generate(11)
+    assert MASK_CACHE.hits == 2
+    assert m.mask == expected.mask
+    assert m.points == expected.points
+
+
+def test_mask_cache_keys():
+    MASK_CACHE.clear()
+    Ellipse(5, 7).generate(11)
+    Ellipse(5, 7, method=2).generate(11)
+    Ellipse(5, 7).generate(13)
+    Ellipse(7, 5).generate(11)
+    assert MASK_CACHE.hits == 0
+    assert len(MASK_CACHE) == 4
+
+
+def test_mask_cache_lru():
+    cache = MaskCache(maxsize=2)
+    cache.put("a", ())
+    cache.put("b", ())
+    cache.get("a")
+    cache.put("c", ())
+    assert cache.get("b") is None
+    assert cache.get("a") == cache.get("c") == ()
+
+
+def test_mask_cache_disabled():
+    MASK_CACHE.clear()
+    MASK_CACHE.maxsize = 0
+    try:
+        Circle().generate(11)
+        Circle().generate(11)
+    finally:
+        MASK_CACHE.maxsize = 256
+    assert len(MASK_CACHE) == 0
+
+
+def test_mask_cache_uncached_subclass():
+    class Custom(Ellipse):
+        def generate(self, puzzle_size: int) -> None:
+            super().generate(puzzle_size)
+            self.invert()
+
+    MASK_CACHE.clear()
+    Custom().generate(11)
+    Custom().generate(11)
+    assert len(MASK_CACHE) == 0
+
+
 def test_ungenerated_mask():
     """Test MaskNotGenerated exception when mask hasn't been generated yet."""
     m = Mask()
@@ -342,6 +432,57 @@ def test_image_mask_contrast_exception(tmp_path: Path):
         im.generate(size)
 
 
+def draw_test_image(size: int = 100, box: int = 50) -> PILImage.Image:
+    image = PILImage.new("L", (size, size), (255))
+    image.paste(0, (10, 10, 10 + box, 10 + box // 2))
+    return image
+
+
+def test_image_mask_sources(tmp_path: Path):
+    img_path = Path.joinpath(tmp_path, "test_image.png")
+    test_img = draw_test_image()
+    test_img.save(img_path, "PNG")
+    data = img_path.read_bytes()
+    masks = []
+    for source in [img_path, str(img_path), data, io.BytesIO(data), test_img]:
+        im = BitmapImage(source)  # type: ignore[arg-type]
+        im.generate(11)
+        masks.append(im.mask)
+    assert all(mask == masks[0] for mask in masks)
+    assert sum(row.count(BitmapImage.ACTIVE) for row in masks[0]) == 11 * 6
+
+
+def test_image_mask_decoded_once(tmp_path: Path):
+    img_path = Path.joinpath(tmp_path, "test_image.png")
+    draw_test_image().save(img_path, "PNG")
+    im = BitmapImage(img_path)
+    im.generate(11)
+    hits = _open_bitmap.cache_info().hits
+    im.generate(21)
+    BitmapImage(img_path).generate(11)
+    assert _open_bitmap.cache_info().hits == hits + 2
+    assert im.bitmap.size == (50, 25)
+
+
+def test_image_mask_file_changed(tmp_path: Path):
+    img_path = Path.joinpath(tmp_path, "test_image.png")
+    draw_test_image(box=50).save(img_path, "PNG")
+    im = BitmapImage(img_path)
+    im.generate(11)
+    draw_test_image(box=20).save(img_path, "PNG")
+    assert im.bitmap.size == (20, 10)
+
+
+def test_image_mask_stream_read_once():
+    buffer = io.BytesIO()
+    draw_test_image().save(buffer, "PNG")
+    buffer.seek(0)
+    im = BitmapImage(buffer)
+    im.generate(11)
+    im.generate(21)
+    assert im.puzzle_size == 21
+
+
 # ************************************************* #
 # ******************** ELLIPSE ******************** #
 # ************************************************* #
@@ -371,6 +512,26 @@ def test_calculate_ellipse_points_method_2():
     assert len(points) % 2 == 0
 
 
+def test_calculate_ellipse_spans():
+    spans = Ellipse.calculate_ellipse_spans(5, 3, (3, 3), 6)
+    assert spans == [(1, 1, 3), (2, 0, 4), (3, 1, 3)]
+    assert Ellipse.calculate_ellipse_points(5, 3, (3, 3), 6) == [
+        (x, y) for y, start, end in spans for x in range(start, end + 1)
+    ]
+
+
+def test_ellipse_spans_outside_puzzle():
+    size = 10
+    m = Ellipse(9, 20, (-3, 4))
+    m.generate(size)
+    assert m.spans[0] == (-5, -5, -3)
+    assert all(len(row) == size for row in m.mask)
+    assert [row.index(m.ACTIVE) if m.ACTIVE in row else -1 for row in m.mask] == (
+        [0] * 9 + [-1]
+    )
+    assert not any(m.ACTIVE in row[1:] for row in m.mask)
+
+
 def test_within_radius_true():
     width = 10
     height = 6
@@ -411,6 +572,20 @@ def test_fill_shape_not_generated():
         pm._fill_shape("J")
 
 
+def test_fill_shape_concave_out_of_bounds():
+    pm = Polygon([(-2, 1), (4, 3), (8, -1), (6, 8), (3, 5), (0, 8)])
+    pm.generate(7)
+    assert ["".join(row) for row in pm.mask] == [
+        "#######",
+        "######*",
+        "***##**",
+        "*******",
+        "*******",
+        "*******",
+        "***#***",
+    ]
+
+
 def test_generate_method_no_size():
     m = Mask()
     with pytest.raises(TypeError):
@@ -1,9 +1,15 @@
+import pickle
+
+import pytest
+
 from word_search_generator import WordSearch
 from word_search_generator.core.validator import (
     NoPalindromes,
     NoPunctuation,
     NoSingleLetterWords,
     NoSubwords,
+    Validator,
+    ValidatorPipeline,
 )
 
 
@@ -62,3 +68,75 @@ def test_no_subwords_valid():
 def test_no_subwords_invalid():
     validator = NoSubwords()
     assert not validator.validate("cream", placed_words=["icecream", "cone", "scoop"])
+
+
+def test_no_subwords_reversed():
+    validator = NoSubwords()
+    assert not validator.validate("maerc", placed_words=["icecream"])
+    assert not validator.validate("ICECREAM", placed_words=["cone", "maerc"])
+
+
+def test_no_subwords_placed_words_updated():
+    validator = NoSubwords()
+    placed_words = ["briefcase"]
+    assert validator.validate("case", placed_words=["luggage"])
+    assert not validator.validate("case", placed_words=placed_words)
+    assert validator.validate("gag", placed_words=placed_words)
+    placed_words.append("luggage")
+    assert not validator.validate("gag", placed_words=placed_words)
+    placed_words[-1] = "duffle"
+    assert validator.validate("gag", placed_words=placed_words)
+    assert validator.validate("case", placed_words=["duffle", "luggage"])
+
+
+def test_no_subwords_pickle():
+    validator = pickle.loads(pickle.dumps(NoSubwords()))
+    assert validator.validate("laptop", placed_words=["briefcase"])
+    assert not validator.validate("case", placed_words=["briefcase"])
+
+
+class CountingValidator(Validator):
+    context_free = True
+
+    def __init__(self, banned):
+        self.banned = banned
+        self.checked = []
+
+    def validate(self, value, *args, **kwargs):
+        return self.validate_many([value])[0]
+
+    def validate_many(self, values, *args, **kwargs):
+        self.checked.append(list(values))
+        return [value not in self.banned for value in values]
+
+
+def test_pipeline_caches_context_free_results():
+    counter = CountingValidator({"BAD"})
+    pipeline = ValidatorPipeline([NoPalindromes(), counter, NoSubwords()])
+    assert pipeline.contextual == [pipeline.validators[2]]
+    assert pipeline.validate_many(["GOOD", "BAD", "MOM", "GOODS"], ["DOG"]) == [
+        True,
+        False,
+        False,
+        True,
+    ]
+    assert counter.checked == [["GOOD", "BAD", "GOODS"]]  # palindromes dropped
+    assert not pipeline.validate("GOOD", placed_words=["GOODS"])
+    assert pipeline.validate("BAD") is False
+    assert counter.checked == [["GOOD", "BAD", "GOODS"]]
+
+
+def test_pipeline_invalid_validator():
+    with pytest.raises(TypeError):
+        ValidatorPipeline([NoPalindromes(), "nope"])  # type: ignore[list-item]
+
+
+def test_pipeline_cached_across_regeneration():
+    counter = CountingValidator({"BAD"})
+    ws = WordSearch("good bad words here", validators=[counter])
+    ws.generate()
+    ws.random_words(1, action="ADD")
+    assert "BAD" not in {word.text for word in ws.placed_words}
+    assert sum(map(len, counter.checked)) == len(ws.words)
+    ws.validators = [CountingValidator(set())]
+    assert "BAD" in {word.text for word in ws.placed_words}
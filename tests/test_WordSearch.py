@@ -1,6 +1,9 @@
 import json
+import os
 import pathlib
 import random
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -235,6 +238,15 @@ def test_random_words_added():
     assert len(ws.words) > 3
 
 
+def test_random_words_seed():
+    ws1 = WordSearch(seed=7)
+    ws1.random_words(5)
+    ws2 = WordSearch(seed=7)
+    ws2.random_words(5)
+    assert ws1.words == ws2.words
+    assert ws1.puzzle == ws2.puzzle
+
+
 def test_random_words_count_type_error():
     ws = WordSearch()
     with pytest.raises(TypeError):
@@ -433,3 +445,261 @@ def test_no_words_to_generate(ws: WordSearch):
     ws._words = set()
     with pytest.raises(EmptyWordlistError):
         ws.generate()
+
+
+def test_compact_storage(words):
+    ws = WordSearch(words, compact=True)
+    assert not ws._puzzle
+    assert not ws._mask
+    assert len(ws.puzzle) == ws.size
+    assert check_key(ws.key, ws.puzzle)
+
+
+def test_compact_toggle(ws: WordSearch):
+    puzzle = ws.puzzle
+    mask = ws.mask
+    ws.compact = True
+    assert ws.puzzle == puzzle
+    assert ws.mask == mask
+    assert ws.cropped_puzzle == puzzle
+    ws.compact = False
+    assert ws._puzzle == puzzle
+    assert ws._mask == mask
+
+
+def test_compact_masked(iterations, builtin_mask_shapes):
+    for _ in range(iterations):
+        ws = WordSearch(size=random.randint(21, 35))
+        ws.random_words(random.randint(5, 21))
+        ws.apply_mask(random.choice(builtin_mask_shapes))
+        bbox = ws.bounding_box
+        cropped = ws.cropped_puzzle
+        ws.compact = True
+        assert ws.bounding_box == bbox
+        assert ws.cropped_puzzle == cropped
+        ws.invert_mask()
+        mask = ws.mask
+        assert all(
+            mask[y][x] == ws.ACTIVE
+            for word in ws.placed_words
+            for y, x in word.coordinates
+        )
+
+
+def assert_same_puzzle(a: WordSearch, b: WordSearch) -> None:
+    assert a == b
+    assert a.puzzle == b.puzzle
+    assert a.mask == b.mask
+    assert a.key == b.key
+    assert a.seed == b.seed
+    assert a.require_all_words == b.require_all_words
+    assert {w.text: w.coordinates for w in a.words} == {
+        w.text: w.coordinates for w in b.words
+    }
+
+
+def test_bytes_round_trip(words):
+    ws = WordSearch(
+        words,
+        level=3,
+        secret_words="bird, fish",
+        secret_level=1,
+        require_all_words=True,
+        seed=-(2**70),
+    )
+    data = ws.to_bytes()
+    assert len(data) < len(ws.json)
+    restored = WordSearch.from_bytes(data)
+    assert_same_puzzle(restored, ws)
+    assert restored.to_bytes() == data
+
+
+def test_bytes_round_trip_masked(iterations, builtin_mask_shapes):
+    for _ in range(iterations):
+        ws = WordSearch(size=random.randint(21, 35))
+        ws.random_words(random.randint(5, 21))
+        ws.apply_mask(random.choice(builtin_mask_shapes))
+        restored = WordSearch.from_bytes(ws.to_bytes(), compact=True)
+        assert restored.compact
+        assert restored.masked
+        assert_same_puzzle(restored, ws)
+        assert restored.cropped_puzzle == ws.cropped_puzzle
+        restored.generate()
+        assert restored.mask == ws.mask
+
+
+def test_bytes_empty_puzzle_error():
+    with pytest.raises(EmptyPuzzleError):
+        WordSearch().to_bytes()
+
+
+def test_from_bytes_invalid_data(ws: WordSearch):
+    data = ws.to_bytes()
+    for invalid in (b"", data[:-1], data + b"\0", b"XYZ" + data[3:]):
+        with pytest.raises(ValueError):
+            WordSearch.from_bytes(invalid)
+    with pytest.raises(ValueError, match="version"):
+        WordSearch.from_bytes(data[:3] + b"\xff" + data[4:])
+
+
+def test_from_json(words):
+    ws = WordSearch(words, level=3, secret_words="bird, fish", secret_level=1)
+    restored = WordSearch.from_json(ws.json)
+    assert_same_puzzle(restored, ws)
+    assert restored.directions == ws.directions
+    assert restored.secret_directions == ws.secret_directions
+
+
+def test_from_json_masked(iterations, builtin_mask_shapes):
+    for _ in range(iterations):
+        ws = WordSearch(size=random.randint(21, 35))
+        ws.random_words(random.randint(5, 21))
+        ws.apply_mask(random.choice(builtin_mask_shapes))
+        restored = WordSearch.from_json(formatter.render_json(ws, lowercase=True))
+        assert restored.masked
+        assert restored.puzzle == ws.puzzle
+        assert restored.mask == ws.mask
+        assert restored.key == ws.key
+
+
+def test_from_json_without_settings(iterations, builtin_mask_shapes):
+    """JSON exports from before the size, bounding box, and levels were included."""
+    for _ in range(iterations):
+        ws = WordSearch(size=random.randint(21, 35))
+        ws.random_words(random.randint(5, 21))
+        ws.apply_mask(random.choice(builtin_mask_shapes))
+        data = json.loads(ws.json)
+        for key in ("size", "bounding_box", "level", "secret_level"):
+            del data[key]
+        restored = WordSearch.from_json(json.dumps(data))
+        assert restored.cropped_puzzle == ws.cropped_puzzle
+        assert restored.key == ws.key
+        assert restored.directions <= ws.directions
+
+
+def test_from_json_errors(ws: WordSearch):
+    with pytest.raises(ValueError):
+        WordSearch.from_json("{}")
+    with pytest.raises(ValueError, match="hidden"):
+        WordSearch.from_json(formatter.render_json(ws, solution=True))
+    data = json.loads(ws.json)
+    text, info = data["key"].popitem()
+    data["key"][text[::-1]] = info  # palindromes aren't allowed
+    with pytest.raises(ValueError, match="match"):
+        WordSearch.from_json(json.dumps(data))
+
+
+def test_from_csv(iterations, builtin_mask_shapes):
+    for _ in range(iterations):
+        ws = WordSearch(size=random.randint(21, 35), secret_words="bird, fish")
+        ws.random_words(random.randint(5, 21), action="ADD")
+        ws.apply_mask(random.choice(builtin_mask_shapes))
+        restored = WordSearch.from_csv(formatter.render_csv(ws, lowercase=True))
+        assert restored.cropped_puzzle == ws.cropped_puzzle
+        assert restored.directions == ws.directions
+        assert restored.placed_secret_words == ws.placed_secret_words
+        assert utils.get_answer_key_list(
+            restored.placed_words, restored.bounding_box
+        ) == utils.get_answer_key_list(ws.placed_words, ws.bounding_box)
+
+
+def test_from_csv_errors(ws: WordSearch):
+    with pytest.raises(ValueError):
+        WordSearch.from_csv("WORD SEARCH\r\n")
+    with pytest.raises(ValueError, match="hidden"):
+        WordSearch.from_csv(formatter.render_csv(ws, solution=True))
+    with pytest.raises(ValueError, match="answer key"):
+        WordSearch.from_csv(formatter.render_csv(ws).replace(" @ ", " at "))
+
+
+def test_seeded_puzzle(words):
+    ws1 = WordSearch(words, level=3, seed=42)
+    ws2 = WordSearch(words, level=3, seed=42)
+    assert ws1.puzzle == ws2.puzzle
+    assert ws1.key == ws2.key
+    assert [w.color for w in sorted(ws1.words, key=lambda w: w.text)] == [
+        w.color for w in sorted(ws2.words, key=lambda w: w.text)
+    ]
+
+
+def test_seeded_puzzle_regenerate(words):
+    ws = WordSearch(words, seed=42)
+    puzzle = ws.puzzle
+    ws.generate()
+    assert ws.puzzle == puzzle
+
+
+def test_seed_setter(words):
+    ws = WordSearch(words, seed=1)
+    ws.seed = 2
+    assert ws.seed == 2
+    assert ws.puzzle == WordSearch(words, seed=2).puzzle
+
+
+def test_seeded_puzzle_across_processes(words):
+    script = (
+        "from word_search_generator import WordSearch;"
+        f"print(WordSearch({words!r}, level=3, seed=7).puzzle)"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYTHONHASHSEED": hash_seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for hash_seed in ("1", "2")
+    }
+    assert len(outputs) == 1
+
+
+def test_incremental_add_words(words):
+    ws = WordSearch(words, size=15)
+    placements = {word.text: word.coordinates for word in ws.placed_words}
+    ws.add_words("zebra", incremental=True)
+    assert "ZEBRA" in {word.text for word in ws.placed_words}
+    for word in ws.placed_words:
+        assert "".join(ws.puzzle[r][c] for r, c in word.coordinates) == word.text
+        if word.text in placements:
+            assert word.coordinates == placements[word.text]
+
+
+def test_incremental_add_words_masked(words):
+    ws = WordSearch(words, size=21)
+    ws.apply_mask(Rectangle(10, 10))
+    ws.add_words("zebra, giraffe", incremental=True)
+    for word in ws.placed_words:
+        assert all(ws.mask[r][c] == ws.ACTIVE for r, c in word.coordinates)
+    assert all(
+        bool(char) == (mask_char == ws.ACTIVE)
+        for row, mask_row in zip(ws.puzzle, ws.mask, strict=True)
+        for char, mask_char in zip(row, mask_row, strict=True)
+    )
+
+
+def test_incremental_remove_words(words):
+    ws = WordSearch(words, size=15)
+    placements = {word.text: word.coordinates for word in ws.placed_words}
+    puzzle = ws.puzzle
+    ws.remove_words("dog", incremental=True)
+    assert "DOG" not in {word.text for word in ws.words}
+    shared = {cell for word in ws.placed_words for cell in word.coordinates}
+    for word in ws.placed_words:
+        assert word.coordinates == placements[word.text]
+    for r, row in enumerate(ws.puzzle):
+        for c, char in enumerate(row):
+            if (r, c) in shared or (r, c) not in placements.get("DOG", []):
+                assert char == puzzle[r][c]
+
+
+def test_incremental_fallback(words):
+    ws = WordSearch(words, size=15)
+    ws.add_words("zebra", incremental=True, reset_size=True)
+    assert ws.size != 15
+
+
+def test_incremental_require_all_words(words):
+    ws = WordSearch(words, size=10, require_all_words=True)
+    with pytest.raises(MissingWordError):
+        ws.add_words("abcdefghijklmnopqrstuvwxyz", incremental=True)
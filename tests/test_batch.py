@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from word_search_generator import generate_many
+from word_search_generator.mask.shapes import Circle
+from word_search_generator.word_search.batch import PuzzleSpec, generate_one
+from word_search_generator.word_search.word_search import WordSearch
+
+
+def test_generate_one(words):
+    data = json.loads(generate_one({"words": words, "size": 15, "level": 3}))
+    assert len(data["puzzle"]) == 15
+    assert set(data["words"]) == set(data["key"])
+
+
+def test_generate_one_masks(words):
+    spec: PuzzleSpec = {"words": words, "masks": [Circle(), "Heart"]}
+    data = json.loads(generate_one(spec))
+    assert len(data["puzzle"]) < 15 or "" in data["puzzle"][0]
+
+
+def test_generate_one_size_and_masks():
+    spec: PuzzleSpec = {
+        "words": "dog cat pig horse goat cow",
+        "size": 15,
+        "masks": ["Circle"],
+    }
+    data = json.loads(generate_one(spec))
+    assert len(data["puzzle"]) == 15
+    assert data["puzzle"][0][0] == ""
+    assert len(data["key"]) == 6
+
+
+def test_generate_one_generates_once(words, monkeypatch):
+    calls = []
+    generate = WordSearch.generate
+
+    def counting_generate(self, *args, **kwargs):
+        calls.append(1)
+        return generate(self, *args, **kwargs)
+
+    monkeypatch.setattr(WordSearch, "generate", counting_generate)
+    spec: PuzzleSpec = {
+        "words": words,
+        "secret_words": "vinegar",
+        "masks": [Circle(), "Heart"],
+    }
+    generate_one(spec)
+    assert len(calls) == 1
+
+
+def test_generate_one_invalid_mask_name(words):
+    with pytest.raises(ValueError):
+        generate_one({"words": words, "masks": ["Blob"]})
+
+
+def test_generate_one_seed(words):
+    assert generate_one({"words": words, "seed": 1}) == generate_one(
+        {"words": words, "seed": 1}
+    )
+
+
+def test_generate_many_ordered():
+    specs: list[PuzzleSpec] = [
+        {"words": "cat, dog, pig", "size": 10},
+        {"words": "horse, donkey, goat", "size": 12},
+        {"words": "turtle, sheep, cow", "size": 14},
+    ]
+    results = list(generate_many(specs, max_workers=2, chunksize=2))
+    assert [i for i, _ in results] == [0, 1, 2]
+    for (_, data), spec in zip(results, specs, strict=True):
+        puzzle = json.loads(data)
+        assert len(puzzle["puzzle"]) == spec["size"]
+
+
+def test_generate_many_unordered():
+    specs: list[PuzzleSpec] = [{"words": "cat, dog, pig"} for _ in range(5)]
+    results = list(generate_many(specs, max_workers=2, ordered=False))
+    assert sorted(i for i, _ in results) == list(range(5))
+
+
+def test_generate_many_invalid_chunksize():
+    with pytest.raises(ValueError):
+        list(generate_many([{"words": "cat"}], chunksize=0))
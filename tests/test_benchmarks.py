@@ -0,0 +1,64 @@
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.cases import collect, mask_benchmarks, sample_words
+from benchmarks.harness import Benchmark, compare_results, time_benchmark
+from word_search_generator.mask import MASK_CACHE
+
+
+def make_results(**medians):
+    return {
+        "meta": {},
+        "benchmarks": {name: {"median": median} for name, median in medians.items()},
+    }
+
+
+def test_time_benchmark():
+    calls: list[int] = []
+    timing = time_benchmark(Benchmark("append", calls.append, lambda: 1), rounds=3)
+    assert calls == [1, 1, 1]
+    assert timing["rounds"] == 3
+    assert timing["min"] <= timing["median"] <= timing["max"]
+
+
+def test_compare_results():
+    old = make_results(a=1.0, b=1.0, c=1.0)
+    new = make_results(a=1.1, b=2.0, c=3.0, d=10.0)
+    regressions = compare_results(old, new, threshold=1.25)  # type: ignore
+    assert [r.name for r in regressions] == ["c", "b"]
+    assert regressions[0].ratio == 3.0
+
+
+def test_sample_words_reproducible():
+    words = sample_words(10, 5)
+    assert words == sample_words(10, 5)
+    assert all(len(word) <= 5 for word in words.split(","))
+
+
+def test_collect_quick():
+    names = [b.name for b in collect(quick=True)]
+    assert len(names) == len(set(names))
+    assert any(name.startswith("generate[") for name in names)
+    assert any(name.startswith("save[format=PDF") for name in names)
+
+
+def test_mask_benchmarks_cache():
+    benchmarks = {b.name: b for b in mask_benchmarks(quick=True)}
+    uncached = benchmarks["apply_mask[shape=Circle,size=21]"]
+    cached = benchmarks["apply_mask_cached[shape=Circle,size=21]"]
+    time_benchmark(uncached, rounds=2)
+    assert MASK_CACHE.hits == 0
+    time_benchmark(cached, rounds=2)
+    assert MASK_CACHE.hits == 1
+
+
+def test_run_and_compare(tmp_path):
+    output = tmp_path.joinpath("results.json")
+    args = ["run", "-q", "-r", "1", "-s", "export", "-k", "CSV", "-o", str(output)]
+    assert main(args) == 0
+    results = json.loads(output.read_text())
+    assert set(results["benchmarks"]) == {
+        "save[format=CSV,size=10]",
+        "save[format=CSV,size=25]",
+    }
+    assert main(["compare", str(output), str(output)]) == 0
@@ -28,6 +28,14 @@ def test_stdin():
     assert result.returncode == 0
 
 
+def test_stats():
+    result = subprocess.run(
+        "word-search some test words --stats", shell=True, capture_output=True
+    )
+    assert result.returncode == 0
+    assert b"Duplicate word checks:" in result.stderr
+
+
 def test_export_pdf(tmp_path: Path):
     fp = tmp_path.joinpath("test.pdf")
     result = subprocess.run(f'word-search some test words -o "{fp}"', shell=True)
@@ -238,3 +246,21 @@ def test_input_file(tmp_path: Path):
     file_to_read.write_text("dog, pig\nmoose,horse,cat,    mouse, newt\ngoose")
     result = subprocess.run(f"word-search -i {file_to_read.absolute()}", shell=True)
     assert result.returncode == 0
+
+
+def test_wordlist_file(tmp_path: Path):
+    file_to_read = Path.joinpath(tmp_path, "words.txt")
+    file_to_read.write_text("\n".join(f"word{i}" for i in range(1000)))
+    result = subprocess.run(
+        f"word-search -r 5 -rx 2 -s 10 -w {file_to_read.absolute()}",
+        shell=True,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0
+    assert "WORD" in result.stdout
+
+
+def test_wordlist_requires_random(tmp_path: Path):
+    result = subprocess.run(f"word-search -w {tmp_path} dog cat", shell=True)
+    assert result.returncode != 0
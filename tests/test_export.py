@@ -1,21 +1,28 @@
+import asyncio
 import csv
+import io
 import json
 import math
 import os
 import random
 import re
 import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import pdfplumber
 import pytest
+from fpdf import FPDF
 from pdfplumber.page import Page
 from pypdf import PdfReader
 
 from word_search_generator import WordSearch, utils
 from word_search_generator.core.game import EmptyPuzzleError
 from word_search_generator.core.word import Direction, Word
+from word_search_generator.mask.shapes import Circle
+from word_search_generator.word_search import WordSearchFormatter
 
 # TODO: add alternation for lowercase in tests
 
@@ -275,6 +282,87 @@ def test_export_empty_puzzle(tmp_path: Path, format):
         puzzle.save(fp, format=format)
 
 
+def test_export_streams(words, tmp_path: Path):
+    puzzle = WordSearch(words, seed=1)
+    for format in ("csv", "json", "pdf"):
+        fp = Path.joinpath(tmp_path, f"test.{format}")
+        puzzle.save(fp, format=format)
+        with io.BytesIO() as buffer:
+            assert puzzle.save(buffer, format=format) == ""
+            assert buffer.getvalue() == fp.read_bytes()
+    with io.StringIO() as f:
+        puzzle.save(f, format="json")
+        assert f.getvalue() == Path.joinpath(tmp_path, "test.json").read_text()
+
+
+def test_export_zip_archive(words, tmp_path: Path):
+    puzzle = WordSearch(words, seed=1)
+    fp = Path.joinpath(tmp_path, "puzzles.zip")
+    with zipfile.ZipFile(fp, "w") as archive:
+        for format in ("csv", "json", "pdf"):
+            with archive.open(f"puzzle.{format}", "w") as f:
+                puzzle.save(f, format=format)
+    with zipfile.ZipFile(fp) as archive:
+        data = json.loads(archive.read("puzzle.json"))
+        assert len(PdfReader(archive.open("puzzle.pdf")).pages) == 1
+    assert data["words"] == [word.text for word in puzzle.placed_words]
+
+
+def test_export_pdf_text_stream_error(words):
+    puzzle = WordSearch(words)
+    with io.StringIO() as f, pytest.raises(TypeError):
+        puzzle.save(f, format="pdf")
+
+
+def test_render(words):
+    puzzle = WordSearch(words, seed=1)
+    formatter = WordSearchFormatter()
+    csv_data = formatter.render(puzzle, "csv", lowercase=True)
+    assert isinstance(csv_data, str)
+    assert csv_data.startswith("WORD SEARCH\r\n")
+    json_data = formatter.render(puzzle, "json")
+    assert isinstance(json_data, str)
+    assert json.loads(json_data)["puzzle"] == puzzle.cropped_puzzle
+    pdf_data = formatter.render(puzzle, "pdf", solution=True)
+    assert isinstance(pdf_data, bytes)
+    assert len(PdfReader(io.BytesIO(pdf_data)).pages) == 2
+    with pytest.raises(ValueError):
+        formatter.render(puzzle, "txt")
+
+
+@pytest.mark.asyncio
+async def test_export_async(words, tmp_path: Path):
+    puzzle = WordSearch(words, seed=1)
+    paths = [Path.joinpath(tmp_path, f"test.{ext}") for ext in ("csv", "json", "pdf")]
+    saved = await asyncio.gather(
+        *(puzzle.save_async(fp, format=fp.suffix[1:], solution=True) for fp in paths)
+    )
+    assert saved == [str(fp) for fp in paths]
+    data = json.loads(paths[1].read_text())
+    assert sorted(data["words"]) == sorted(word.text for word in puzzle.words)
+    assert len(PdfReader(paths[2]).pages) == 2
+
+
+@pytest.mark.asyncio
+async def test_export_async_process_pool(words, tmp_path: Path):
+    puzzle = WordSearch(words, seed=1)
+    fp = Path.joinpath(tmp_path, "test.json")
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        await puzzle.save_async(fp, format="json", executor=executor)
+    assert json.loads(fp.read_text())["puzzle"] == json.loads(puzzle.json)["puzzle"]
+
+
+@pytest.mark.asyncio
+async def test_export_async_errors(tmp_path: Path):
+    fp = Path.joinpath(tmp_path, "test.pdf")
+    with pytest.raises(EmptyPuzzleError):
+        await WordSearch().save_async(fp)
+    puzzle = WordSearch("dog, cat, pig")
+    puzzle.save(fp)
+    with pytest.raises(FileExistsError):
+        await puzzle.save_async(fp)
+
+
 def test_export_pdf_puzzles(iterations, tmp_path: Path):
     """Export a bunch of puzzles as PDF and make sure they are all 1-page."""
     puzzles = []
@@ -648,6 +736,31 @@ def test_pdf_output_solution_character_placement(iterations, tmp_path: Path):
                 assert word_char == puzzle_char
 
 
+def test_pdf_output_masked_puzzle_placement(tmp_path: Path):
+    ws = WordSearch("dog, cat, pig, horse, goat", size=15, seed=1)
+    ws.apply_mask(Circle())
+    fp = Path.joinpath(tmp_path, f"{uuid.uuid4()}.pdf")
+    ws.save(fp, format="PDF")
+
+    page = pdfplumber.open(fp).pages[0]
+    chars_str = "".join(c["text"] for c in page.chars)
+    puzzle_start = chars_str.index("WORD SEARCH") + len("WORD SEARCH")
+    puzzle_end = chars_str.index("Find")
+    rows: dict[float, list[dict[str, Any]]] = {}
+    for char in page.chars[puzzle_start:puzzle_end]:
+        rows.setdefault(round(char["top"], 2), []).append(char)
+
+    # every letter should be centered in its (unmasked) cell
+    puzzle = ws.cropped_puzzle
+    middle = rows[sorted(rows)[len(rows) // 2]]
+    left = (middle[0]["x0"] + middle[0]["x1"]) / 2
+    gsize = ((middle[-1]["x0"] + middle[-1]["x1"]) / 2 - left) / (len(puzzle) - 1)
+    for row, chars in zip(puzzle, rows.values(), strict=True):
+        cols = [round(((c["x0"] + c["x1"]) / 2 - left) / gsize, 2) for c in chars]
+        assert cols == [i for i, char in enumerate(row) if char]
+        assert "".join(c["text"] for c in chars) == "".join(row)
+
+
 def test_csv_output_puzzle_size(iterations, tmp_path: Path):
     def parse_puzzle(fp):
         puzzle = []
@@ -672,3 +785,77 @@ def test_csv_output_puzzle_size(iterations, tmp_path: Path):
         results.append(ws.size == len(puzzle) and ws.size == len(puzzle[0]))  # type: ignore
 
     assert all(results)
+
+
+def test_pdf_raw_operators_supported():
+    # the puzzle grid is drawn with the private `FPDF._out()`
+    assert callable(getattr(FPDF, "_out", None))
+    pdf = FPDF("P", "in", "Letter")
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=24)
+    WordSearchFormatter._draw_pdf_grid(pdf, [["A", "B"], ["", "C"]], 0.5)
+    page = pdfplumber.open(io.BytesIO(bytes(pdf.output()))).pages[0]
+    assert page.extract_text().split() == ["A", "B", "C"]
+
+
+def book_puzzles(count: int):
+    return (
+        WordSearch("dog, cat, pig, horse, goat", size=10, seed=n) for n in range(count)
+    )
+
+
+def page_titles(fp: Path) -> list[str]:
+    with pdfplumber.open(fp) as pdf:
+        return [page.extract_text().split("\n")[0] for page in pdf.pages]
+
+
+def test_pdf_book(tmp_path: Path):
+    fp = Path.joinpath(tmp_path, "book.pdf")
+    assert WordSearchFormatter().write_pdf_book(fp, book_puzzles(3)) == [fp.absolute()]
+    assert page_titles(fp) == ["WORD SEARCH"] * 3
+
+
+def test_pdf_book_solutions(tmp_path: Path):
+    fp = Path.joinpath(tmp_path, "book.pdf")
+    WordSearchFormatter().write_pdf_book(fp, book_puzzles(2), solution=True)
+    assert page_titles(fp) == ["WORD SEARCH", "WORD SEARCH (SOLUTION)"] * 2
+
+
+def test_pdf_book_appendix(tmp_path: Path):
+    fp = Path.joinpath(tmp_path, "book.pdf")
+    WordSearchFormatter().write_pdf_book(
+        fp, book_puzzles(2), solution=True, appendix=True
+    )
+    assert page_titles(fp) == ["WORD SEARCH"] * 2 + ["WORD SEARCH (SOLUTION)"] * 2
+
+
+def test_pdf_book_volumes(tmp_path: Path):
+    fp = Path.joinpath(tmp_path, "book.pdf")
+    saved = WordSearchFormatter().write_pdf_book(
+        fp, book_puzzles(5), solution=True, appendix=True, puzzles_per_file=2
+    )
+    assert [p.name for p in saved] == ["book-1.pdf", "book-2.pdf", "book-3.pdf"]
+    assert [len(PdfReader(p).pages) for p in saved] == [4, 4, 2]
+
+
+def test_pdf_book_title_position(tmp_path: Path):
+    fp = Path.joinpath(tmp_path, "book.pdf")
+    WordSearchFormatter().write_pdf_book(fp, book_puzzles(2), hide_key=True)
+    with pdfplumber.open(fp) as pdf:
+        titles = [page.extract_words()[:2] for page in pdf.pages]
+    assert [w["text"] for w in titles[1]] == ["WORD", "SEARCH"]
+    assert [w["x0"] for w in titles[0]] == [w["x0"] for w in titles[1]]
+
+
+def test_pdf_book_errors(tmp_path: Path):
+    fp = Path.joinpath(tmp_path, "book.pdf")
+    formatter = WordSearchFormatter()
+    with pytest.raises(ValueError):
+        formatter.write_pdf_book(fp, [])
+    with pytest.raises(ValueError):
+        formatter.write_pdf_book(fp, book_puzzles(1), puzzles_per_file=0)
+    with pytest.raises(EmptyPuzzleError):
+        formatter.write_pdf_book(fp, [WordSearch()])
+    fp.touch()
+    with pytest.raises(FileExistsError):
+        formatter.write_pdf_book(fp, book_puzzles(1))
@@ -1,3 +1,8 @@
+import io
+import random
+
+import pytest
+
 from word_search_generator import utils
 
 
@@ -46,3 +51,122 @@ def test_float_range_invalid_args():
 
 def test_float_range_negative():
     assert len(list(utils.float_range(0.40, 0.30, -0.1))) == 2
+
+
+def test_pack_grid():
+    grid = [["A", "", "B"], ["", "C", ""], ["D", "E", "F"]]
+    packed = utils.pack_grid(grid)
+    assert len(packed) == 9
+    assert utils.unpack_grid(packed, 3) == grid
+
+
+def test_pack_chars():
+    packed = utils.pack_grid([["A", "", "B"], ["", "C", ""], ["Z", "A", "É"]])
+    alphabet = "ABCZÉ"
+    data = utils.pack_chars(packed, alphabet)
+    assert len(data) == 4  # 9 cells * 3 bits
+    assert utils.unpack_chars(data, 9, alphabet) == packed
+    assert utils.unpack_chars(utils.pack_chars("", ""), 0, "") == ""
+
+
+def test_iter_words():
+    text = "cat  bird,\n\npig,,   ,,, horse\nmoose"
+    words = ["cat", "bird", "pig", "horse", "moose"]
+    assert list(utils.iter_words(text)) == words
+    for chunk_size in (1, 2, 3, 5):
+        assert list(utils.iter_words(io.StringIO(text), chunk_size)) == words
+
+
+def test_read_words():
+    text = "cat, dog, CAT, \t, Dog , pig, cow"
+    assert utils.read_words(text) == ["CAT", "DOG", "PIG", "COW"]
+    stream = io.StringIO(text)
+    assert utils.read_words(stream, limit=2) == ["CAT", "DOG"]
+    assert stream.read() == ""  # short streams are read in a single chunk
+    stream = io.StringIO(text + ",".join(["x"] * 100_000))
+    assert utils.read_words(stream, limit=3) == ["CAT", "DOG", "PIG"]
+    assert len(stream.read()) > 100_000  # reading stopped at the limit
+
+
+def test_pack_bits():
+    grid = [["*", "#", "#"], ["#", "*", "*"], ["#", "#", "#"]]
+    bits = utils.pack_bits(grid, "*")
+    assert bits == 0b000_110_001
+    assert utils.unpack_bits(bits, 3, "*", "#") == grid
+    assert utils.bits_bounding_box(bits, 3) == utils.find_bounding_box(grid, "*")
+
+
+def test_bits_bounding_box_empty():
+    assert utils.bits_bounding_box(0, 5) == ((0, 0), (5, 5))
+
+
+def test_bits_transformations():
+    grid = [["*", "*", "#"], ["#", "*", "#"], ["#", "#", "#"]]
+    bits = utils.pack_bits(grid, "*")
+    assert utils.unpack_bits(utils.flip_bits_horizontal(bits, 3), 3, "*", "#") == [
+        r[::-1] for r in grid
+    ]
+    flipped = utils.flip_bits_vertical(bits, 3)
+    assert utils.unpack_bits(flipped, 3, "*", "#") == grid[::-1]
+    assert utils.unpack_bits(utils.transpose_bits(bits, 3), 3, "*", "#") == [
+        list(r) for r in zip(*grid, strict=True)
+    ]
+    assert utils.unpack_bits(bits ^ utils.full_bits(3), 3, "#", "*") == grid
+
+
+def test_composite_bits():
+    a, b = 0b0011, 0b0110
+    assert utils.composite_bits(a, b, 1) == 0b0010
+    assert utils.composite_bits(a, b, 2) == 0b0111
+    assert utils.composite_bits(a, b, 3) == 0b0001
+
+
+def test_word_index_lengths():
+    index = utils.WordIndex(["ox", "cat", "dog", "Bird", "horse", "cat", "moose"])
+    assert len(index) == 6
+    assert index.count() == 6
+    assert index.count(min_length=3, max_length=4) == 3
+    assert index.count(min_length=6) == 0
+    assert index.count(max_length=1) == 0
+    assert sorted(index.sample(3, min_length=3, max_length=4)) == ["Bird", "cat", "dog"]
+    assert index.sample(0) == []
+    with pytest.raises(ValueError):
+        index.sample(5, max_length=4)
+
+
+def test_word_index_exclude():
+    index = utils.WordIndex(f"word{i}" for i in range(100))
+    rng = random.Random(1)
+    for _ in range(20):
+        sample = index.sample(10, exclude=["WORD1", "word2"], rng=rng)
+        assert len(set(sample)) == 10
+        assert not {"word1", "word2"} & set(sample)
+    assert sorted(index.sample(3, exclude=[f"word{i}" for i in range(97)])) == [
+        "word97",
+        "word98",
+        "word99",
+    ]
+    with pytest.raises(ValueError):
+        index.sample(4, exclude=[f"word{i}" for i in range(97)])
+
+
+def test_word_index_subset():
+    index = utils.WordIndex(["apple", "ant", "Anna", "bat", "tab", "banana"])
+    assert index.subset("a").words == ["ant", "Anna", "apple"]
+    assert index.subset(letters="abn").words == ["Anna", "banana"]
+    assert index.subset("B", letters="tab").words == ["bat"]
+    assert index.subset("a") is index.subset("A")  # cached
+
+
+def test_get_random_words():
+    words = utils.get_random_words(10, max_length=5, min_length=4)
+    assert len(set(words)) == 10
+    assert all(4 <= len(word) <= 5 for word in words)
+    assert set(words) <= set(utils.WORD_LIST)
+    assert utils.get_word_index() is utils.get_word_index()
+
+
+def test_get_random_words_rng():
+    assert utils.get_random_words(10, rng=random.Random(3)) == utils.get_random_words(
+        10, rng=random.Random(3)
+    )
@@ -0,0 +1,100 @@
+import io
+import random
+from collections import Counter
+
+import pytest
+
+from word_search_generator import WordSearch
+from word_search_generator.core.validator import NoPalindromes, Validator
+from word_search_generator.wordlist import WordSource
+
+
+@pytest.fixture
+def wordlist_file(tmp_path):
+    path = tmp_path.joinpath("words.txt")
+    path.write_text("dog\ncat, pig\r\nmom  horse\n\nturtle\ncat\n")
+    return path
+
+
+def test_read_file(wordlist_file):
+    words = ["DOG", "CAT", "PIG", "MOM", "HORSE", "TURTLE", "CAT"]
+    assert list(WordSource(wordlist_file)) == words
+    assert list(WordSource(str(wordlist_file))) == words  # readable again
+
+
+def test_read_stdin(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("dog cat\npig\n"))
+    assert list(WordSource("-")) == ["DOG", "CAT", "PIG"]
+
+
+def test_read_stream_and_iterable():
+    assert list(WordSource(io.StringIO("dog,cat"))) == ["DOG", "CAT"]
+    assert list(WordSource(iter(["dog cat", "pig"]))) == ["DOG", "CAT", "PIG"]
+
+
+def test_filters(wordlist_file):
+    source = WordSource(
+        wordlist_file,
+        min_length=3,
+        max_length=5,
+        alphabet="acdegimoprst",
+        validators=[NoPalindromes()],
+    )
+    assert list(source) == ["DOG", "CAT", "PIG", "CAT"]
+
+
+def test_batch_validation():
+    class Banned(Validator):
+        context_free = True
+        calls = 0
+
+        def validate(self, value, *args, **kwargs):
+            raise AssertionError("words should be validated in batches")
+
+        def validate_many(self, values, *args, **kwargs):
+            Banned.calls += 1
+            return [value != "BAD" for value in values]
+
+    source = WordSource(["good bad"] * 1500, validators=[Banned()])
+    assert Counter(source) == {"GOOD": 1500}
+    assert Banned.calls == 3  # 3000 words in batches of 1024
+
+
+def test_invalid_validator():
+    with pytest.raises(TypeError):
+        WordSource([], validators=["nope"])  # type: ignore[list-item]
+
+
+def test_sample():
+    words = [f"word{i}" for i in range(1000)]
+    sample = WordSource(words).sample(10, rng=random.Random(1))
+    assert len(set(sample)) == 10
+    assert sample == WordSource(words).sample(10, rng=random.Random(1))
+    assert WordSource(words).sample(0) == []
+
+
+def test_sample_not_enough_words(wordlist_file):
+    assert sorted(WordSource(wordlist_file).sample(10)) == [
+        "CAT",
+        "DOG",
+        "HORSE",
+        "MOM",
+        "PIG",
+        "TURTLE",
+    ]
+
+
+def test_sample_uniform():
+    rng = random.Random(1234)
+    counts: Counter[str] = Counter()
+    for _ in range(2000):
+        counts.update(WordSource(str(i) for i in range(10)).sample(3, rng=rng))
+    assert len(counts) == 10
+    assert all(500 < count < 700 for count in counts.values())  # 600 expected
+
+
+def test_random_words_from_source():
+    ws = WordSearch(seed=1)
+    ws.random_words(5, source=WordSource(f"word{i}" for i in range(5000)))
+    assert len(ws.words) == 5
+    assert all(word.text.startswith("WORD") for word in ws.words)